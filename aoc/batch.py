@@ -0,0 +1,194 @@
+"""
+Solve the parts of a day for many input files, in a pool of workers, printing a JSON line per file as soon
+as it is solved:
+
+    python -m aoc.batch 7 inputs/day7/                  # every file of a directory
+    python -m aoc.batch 7 'inputs/day7/*.txt' --chunk-size 16 --output results.jsonl
+    python -m aoc.batch 22 inputs/day22/ --time-budget 10   # give up on a part after 10s
+
+    {"file": "inputs/day7/alice.txt", "day": 7, "answers": {"1": 222, "2": 13264}, "parse_ms": 4.1, ...}
+    {"file": "inputs/day7/bob.txt", "day": 7, "answers": {"1": 151}, "errors": {"2": "KeyError: 'shiny gold'"}, ...}
+
+The files are sent to the workers by chunks, to not pay a round trip per file when they are quickly solved.
+A failure is only failing its part of its file, and a crashing worker is only failing the file crashing it:
+the pool is lost with the worker, so the chunks it had not solved yet are solved again, each one in its own
+process, and a chunk crashing again is split in halves until the crashing file is alone.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, Future
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from typing import List, Dict, Any, Optional, Iterable, TextIO
+
+from aoc.registry import get_puzzle
+from aoc.util.budget import Budget, BudgetExceeded, add_budget_arguments, budget_from_arguments
+from aoc.util.profiling import Profiler, phase
+
+FileResult = Dict[str, Any]
+
+DEFAULT_CHUNK_SIZE = 8
+
+
+def find_inputs(patterns: Iterable[str]) -> List[str]:
+    """
+    Input files given as files, directories (all their files) or glob patterns, without duplicates.
+    """
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = [os.path.join(pattern, name) for name in sorted(os.listdir(pattern))]
+        else:
+            matches = sorted(glob.glob(pattern)) or [pattern]
+        paths.extend(path for path in matches if not os.path.isdir(path))
+
+    return list(dict.fromkeys(paths))
+
+
+def solve_file(day: int, path: str, budget: Optional[Budget] = None) -> FileResult:
+    """
+    Solve all the parts of a day for an input file, the input being parsed again for every part
+    as some solvers are consuming or mutating it.
+    """
+    puzzle = get_puzzle(day).with_input(path).resolve()
+    result: FileResult = {"file": path, "day": day, "answers": {}}
+    errors = {}
+    exceeded = {}
+    with Profiler() as profiler:
+        for part, solver in enumerate(puzzle.parts, start=1):
+            try:
+                with phase("parse"):
+                    parsed = puzzle.parse(puzzle.open_input())
+                with phase(f"part{part}"), budget or nullcontext():
+                    result["answers"][str(part)] = solver(parsed)
+            except BudgetExceeded as e:
+                errors[str(part)] = f"{type(e).__name__}: {e}"
+                exceeded[str(part)] = e.progress
+            except Exception as e:  # a broken input should only fail its own part
+                errors[str(part)] = f"{type(e).__name__}: {e}"
+
+    if errors:
+        result["errors"] = errors
+    if exceeded:
+        result["budget_exceeded"] = exceeded
+    result["parse_ms"] = round(profiler.wall_ms("parse"), 3)
+    result["solve_ms"] = {
+        str(part): round(profiler.wall_ms(f"part{part}"), 3)
+        for part in range(1, len(puzzle.parts) + 1)
+    }
+
+    return result
+
+
+def solve_chunk(day: int, paths: List[str], budget: Optional[Budget] = None) -> List[FileResult]:
+    return [solve_file(day, path, budget) for path in paths]
+
+
+def solve_chunk_alone(day: int, paths: List[str], budget: Optional[Budget] = None) -> List[FileResult]:
+    """
+    Solve a chunk in a process of its own. When it crashes, both halves of the chunk are solved again, each one
+    in its own process, down to the file crashing it, which is the only one failing.
+    """
+    try:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            return executor.submit(solve_chunk, day, paths, budget).result()
+    except BrokenProcessPool as e:
+        if len(paths) == 1:
+            return _failed_chunk(day, paths, e)
+
+    middle = len(paths) // 2
+    return solve_chunk_alone(day, paths[:middle], budget) + solve_chunk_alone(day, paths[middle:], budget)
+
+
+def _failed_chunk(day: int, paths: List[str], error: Exception) -> List[FileResult]:
+    return [
+        {"file": path, "day": day, "answers": {}, "errors": {"*": f"{type(error).__name__}: {error}"}}
+        for path in paths
+    ]
+
+
+def chunks(paths: List[str], chunk_size: int) -> List[List[str]]:
+    return [paths[start:start + chunk_size] for start in range(0, len(paths), chunk_size)]
+
+
+def run_batch(day: int,
+              paths: List[str],
+              output: TextIO,
+              workers: Optional[int] = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE,
+              budget: Optional[Budget] = None) -> Dict[str, int]:
+    """
+    Write the result of every file as soon as its chunk is solved, and give how many files were solved
+    and failed.
+    """
+    get_puzzle(day)
+    summary = {"files": 0, "failed": 0}
+
+    def emit(result: FileResult) -> None:
+        summary["files"] += 1
+        summary["failed"] += "errors" in result
+        output.write(json.dumps(result, default=str) + "\n")
+        output.flush()
+
+    unsolved = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures: Dict[Future, List[str]] = {
+            executor.submit(solve_chunk, day, chunk, budget): chunk
+            for chunk in chunks(paths, chunk_size)
+        }
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except BrokenProcessPool:
+                # a worker died, and the pool with it: its chunk is not known, all the ones not solved are retried
+                unsolved.append(futures[future])
+                continue
+            except Exception as e:
+                results = _failed_chunk(day, futures[future], e)
+            for result in results:
+                emit(result)
+
+    if unsolved:
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as threads:
+            futures = {threads.submit(solve_chunk_alone, day, chunk, budget): chunk for chunk in unsolved}
+            for future in as_completed(futures):
+                try:
+                    results = future.result()
+                except Exception as e:  # the chunk could not be sent to its process, only its files are lost
+                    results = _failed_chunk(day, futures[future], e)
+                for result in results:
+                    emit(result)
+
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Solve a day for many input files")
+    parser.add_argument("day", type=int, help="day of the inputs")
+    parser.add_argument("inputs", nargs="+", help="input files, directories or glob patterns")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="files sent at once to a worker")
+    parser.add_argument("-o", "--output", default=None, help="write the JSON lines in this file instead of stdout")
+    add_budget_arguments(parser)
+    args = parser.parse_args(argv)
+
+    paths = find_inputs(args.inputs)
+    budget = budget_from_arguments(args)
+    start = time.perf_counter()
+    if args.output:
+        with open(args.output, "w") as output:
+            summary = run_batch(args.day, paths, output, args.workers, args.chunk_size, budget)
+    else:
+        summary = run_batch(args.day, paths, sys.stdout, args.workers, args.chunk_size, budget)
+
+    elapsed = time.perf_counter() - start
+    print(f"{summary['files']} files in {elapsed:.1f}s, {summary['failed']} failed", file=sys.stderr)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""
+Content-addressed on-disk cache of the parsed inputs and of the answers.
+
+Entries are keyed by a hash of the input bytes and of the "version" of the functions involved,
+which is the hash of the source of their module and of the `aoc` modules it depends on. So editing
+a solver, a parser or a util is invalidating its entries, without having to think about it.
+
+The cache is stored in `AOC_CACHE_DIR` (default: `.aoc_cache` at the root of the repository), and the
+least recently used entries are evicted when it grows over `AOC_CACHE_MAX_BYTES` (default: 256MiB).
+"""
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+from functools import partial, lru_cache
+from types import ModuleType
+from typing import Any, Optional, Callable, Set, Iterable
+
+from aoc.registry import Puzzle, EntryPoint
+
+CACHE_DIR_ENV = "AOC_CACHE_DIR"
+MAX_BYTES_ENV = "AOC_CACHE_MAX_BYTES"
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".aoc_cache")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".pickle"
+
+
+class Cache:
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.directory = directory or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else int(os.environ.get(MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    def get(self, key: str) -> Any:
+        """
+        Get the value stored for the key, or raise a KeyError.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            raise KeyError(key)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # a corrupted entry, or one referencing a class that does not exist anymore
+            self._remove(path)
+            raise KeyError(key)
+
+        # the modification time is used as the last access time for the eviction
+        os.utime(path)
+        return value
+
+    def put(self, key: str, value: Any) -> bool:
+        """
+        Store a value, if it can be pickled (a parser returning a generator can not be cached).
+        """
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+
+        if len(payload) > self.max_bytes:
+            return False
+
+        os.makedirs(self.directory, exist_ok=True)
+        # write in a temporary file first, so concurrent workers never read a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(payload)
+        os.replace(tmp_path, self._path(key))
+
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used entries until the cache fits in its maximum size.
+        """
+        entries = []
+        for path in self._entries():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            evicted += 1
+
+        return evicted
+
+    def clear(self) -> int:
+        removed = 0
+        for path in self._entries():
+            self._remove(path)
+            removed += 1
+
+        return removed
+
+    def size(self) -> int:
+        return sum(os.path.getsize(path) for path in self._entries())
+
+    def _entries(self) -> Iterable[str]:
+        if not os.path.isdir(self.directory):
+            return []
+
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(_ENTRY_SUFFIX)
+        ]
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def make_key(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def describe(value: Any) -> str:
+    """
+    Describe a callable (and the arguments bound to it) in a way that is stable across processes,
+    unlike its repr which is showing memory addresses.
+    """
+    if isinstance(value, EntryPoint):
+        return describe(value.resolve())
+    if isinstance(value, partial):
+        args = ", ".join(map(describe, value.args))
+        keywords = ", ".join(f"{key}={describe(arg)}" for key, arg in sorted(value.keywords.items()))
+        return f"partial({describe(value.func)}, {args}, {keywords})"
+    if inspect.isroutine(value) or inspect.isclass(value):
+        return f"{getattr(value, '__module__', None)}:{getattr(value, '__qualname__', repr(value))}"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(map(describe, value))) + "}"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{describe(k)}: {describe(v)}" for k, v in sorted(value.items(), key=repr)) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(map(describe, value)) + "]"
+
+    return repr(value)
+
+
+def version(fn: Callable) -> str:
+    """
+    Version of a callable: its description, and the source of the modules it depends on.
+    """
+    modules: Set[str] = set()
+    _collect_callable_modules(fn, modules)
+    return make_key(describe(fn), *(_module_version(name) for name in sorted(modules)))
+
+
+def _collect_callable_modules(value: Any, modules: Set[str]) -> None:
+    if isinstance(value, EntryPoint):
+        _collect_callable_modules(value.resolve(), modules)
+    elif isinstance(value, partial):
+        _collect_callable_modules(value.func, modules)
+        for arg in (*value.args, *value.keywords.values()):
+            _collect_callable_modules(arg, modules)
+    elif isinstance(value, dict):
+        for arg in value.values():
+            _collect_callable_modules(arg, modules)
+    elif callable(value):
+        module = sys.modules.get(getattr(value, "__module__", None) or "")
+        if module:
+            _collect_dependencies(module, modules)
+
+
+def _collect_dependencies(module: ModuleType, modules: Set[str]) -> None:
+    if module.__name__.split(".")[0] != "aoc" or module.__name__ in modules:
+        return
+
+    modules.add(module.__name__)
+    for value in vars(module).values():
+        if isinstance(value, ModuleType):
+            dependency = value
+        else:
+            dependency = sys.modules.get(getattr(value, "__module__", None) or "")
+        if dependency:
+            _collect_dependencies(dependency, modules)
+
+
+@lru_cache(maxsize=None)
+def _module_version(name: str) -> str:
+    path = getattr(sys.modules[name], "__file__", None)
+    return hash_file(path) if path else name
+
+
+def input_digest(puzzle: Puzzle) -> str:
+    if puzzle.raw_input is not None:
+        return hash_text(puzzle.raw_input)
+
+    return hash_file(puzzle.input_path)
+
+
+def parsed_key(puzzle: Puzzle) -> str:
+    return make_key("parsed", input_digest(puzzle), version(puzzle.parse))
+
+
+def answer_key(puzzle: Puzzle, part: int) -> str:
+    return make_key("answer", input_digest(puzzle), version(puzzle.parse), version(puzzle.parts[part - 1]), str(part))
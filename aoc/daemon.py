@@ -0,0 +1,290 @@
+"""
+Long-lived solver, keeping the parsed inputs and the indexes built from them in memory between queries.
+
+Queries are JSON lines, read on stdin (answers are written on stdout), or on a Unix socket:
+
+    python -m aoc.daemon                       # stdin / stdout
+    python -m aoc.daemon --socket /tmp/aoc.sock
+
+    {"id": 1, "day": 7, "query": "containers", "bag": "shiny gold"}
+    {"id": 2, "day": 7, "query": "contents", "bag": "dark olive"}
+    {"id": 3, "day": 1, "query": "two_sum", "target": 2020}
+    {"id": 4, "day": 1, "query": "three_sum", "target": 2020}
+    {"id": 5, "day": 15, "query": "spoken", "turn": 30000000}
+    {"id": 6, "day": 20, "part": 2}
+
+and every query is answered by a line with the same id, once it is solved:
+
+    {"id": 1, "answer": 222, "ms": 0.02}
+    {"id": 9, "error": "KeyError: 'unknown bag'", "ms": 0.01}
+
+A sum without entries adding up to its target is answered null.
+
+Queries are solved concurrently: the long ones are running in threads, so the lookups in the warm indexes
+are not waiting behind them, and the answers can come back in a different order than the queries.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Dict, Any, Optional, Tuple, List, Callable, Awaitable
+
+from aoc.day1.k_sum import PairSumIndex, Indexes
+from aoc.day7.handy_haversacks import Bag
+from aoc.day15.rambunctious_recitation import _init, _play_turns
+from aoc.registry import get_puzzle
+
+Query = Dict[str, Any]
+
+
+class BagIndex:
+    """
+    The rules of day 7, with the answers memoized per bag.
+    """
+
+    def __init__(self, bags: Dict[str, Bag]):
+        # the parser is giving a defaultdict, which would answer 0 for a bag that does not exist
+        self.bags = dict(bags)
+        self._containers: Dict[str, int] = {}
+        self._contents: Dict[str, int] = {}
+
+    def _bag(self, bag_name: str) -> Bag:
+        try:
+            return self.bags[bag_name]
+        except KeyError:
+            raise KeyError(f"unknown bag {bag_name}")
+
+    def containers(self, bag_name: str) -> int:
+        if bag_name not in self._containers:
+            containers = set()
+            to_analyze = list(self._bag(bag_name).is_contained_by)
+            while to_analyze:
+                container = to_analyze.pop()
+                if container not in containers:
+                    containers.add(container)
+                    to_analyze.extend(self.bags[container].is_contained_by)
+            self._containers[bag_name] = len(containers)
+
+        return self._containers[bag_name]
+
+    def contents(self, bag_name: str) -> int:
+        if bag_name not in self._contents:
+            self._contents[bag_name] = sum(
+                quantity * (1 + self.contents(content_name))
+                for quantity, content_name in self._bag(bag_name).contains
+            )
+
+        return self._contents[bag_name]
+
+
+class ExpenseIndex:
+    """
+    The expense report of day 1, with its pair sums indexed, and the answers memoized per target
+    (None when no entries are summing to it).
+    """
+
+    def __init__(self, numbers: List[int]):
+        self.numbers = list(numbers)
+        self.pair_sums = PairSumIndex(self.numbers)
+        self._answers: Dict[Tuple[str, int], Optional[int]] = {}
+
+    def two_sum(self, target: int) -> Optional[int]:
+        return self._memoized("two_sum", target, self.pair_sums.two_sum)
+
+    def three_sum(self, target: int) -> Optional[int]:
+        return self._memoized("three_sum", target, self.pair_sums.three_sum)
+
+    def _memoized(self, name: str, target: int, find: Callable[[int], Optional[Indexes]]) -> Optional[int]:
+        key = (name, target)
+        if key not in self._answers:
+            indexes = find(target)
+            product = None
+            if indexes:
+                product = 1
+                for index in indexes:
+                    product *= self.numbers[index]
+            self._answers[key] = product
+
+        return self._answers[key]
+
+
+class MemoryGame:
+    """
+    The game of day 15, continued from its last turn when a later turn is asked.
+    """
+
+    def __init__(self, starting_numbers: List[int]):
+        self.starting_numbers = list(starting_numbers)
+        self._restart()
+
+    def _restart(self) -> None:
+        self._last_spoken_number, self._last_turn, self._memo = _init(self.starting_numbers)
+
+    def spoken(self, turn: int) -> int:
+        if turn < 1:
+            raise ValueError(f"turns are starting at 1, not {turn}")
+        if turn <= len(self.starting_numbers):
+            return self.starting_numbers[turn - 1]
+        if turn < self._last_turn:
+            # the memo only knows the last turns the numbers were spoken at, so the game is played again
+            self._restart()
+
+        self._last_spoken_number = _play_turns(self._last_spoken_number, self._last_turn, self._memo, turn)
+        self._last_turn = turn
+        return self._last_spoken_number
+
+
+class Daemon:
+    def __init__(self):
+        self._warm: Dict[int, Any] = {}
+        self._answers: Dict[Tuple[int, int], Any] = {}
+        # a single query at a time is touching the warm state of a day
+        self._locks: Dict[int, asyncio.Lock] = {}
+        # a part is solved once, the queries coming meanwhile are waiting for its answer
+        self._part_locks: Dict[Tuple[int, int], asyncio.Lock] = {}
+
+    async def answer(self, query: Query) -> Dict[str, Any]:
+        start = time.perf_counter()
+        response: Dict[str, Any] = {"id": query.get("id")}
+        try:
+            response["answer"] = await self._solve(query)
+        except Exception as e:  # a bad query should not stop the daemon
+            response["error"] = f"{type(e).__name__}: {e}"
+        response["ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+        return response
+
+    async def _solve(self, query: Query) -> Any:
+        day = int(query["day"])
+        if "part" in query:
+            return await self._solve_part(day, int(query["part"]))
+
+        handlers = _QUERIES.get(day, {})
+        name = query.get("query")
+        if name not in handlers:
+            raise ValueError(f"unknown query {name} for day {day}, expected a part or one of {sorted(handlers)}")
+
+        async with self._locks.setdefault(day, asyncio.Lock()):
+            warm = await self._warm_up(day)
+            return await asyncio.to_thread(handlers[name], warm, query)
+
+    async def _solve_part(self, day: int, part: int) -> Any:
+        async with self._part_locks.setdefault((day, part), asyncio.Lock()):
+            if (day, part) not in self._answers:
+                # imported here, as the runner is importing the daemon for its --daemon option
+                from aoc.main import run_part
+
+                result = await asyncio.to_thread(run_part, day, part, use_cache=True)
+                if result.error:
+                    raise RuntimeError(result.error)
+                self._answers[day, part] = result.answer
+
+        return self._answers[day, part]
+
+    async def _warm_up(self, day: int) -> Any:
+        if day not in self._warm:
+            puzzle = get_puzzle(day)
+            parsed = await asyncio.to_thread(lambda: puzzle.parse(puzzle.open_input()))
+            self._warm[day] = _INDEXES[day](parsed)
+
+        return self._warm[day]
+
+    async def serve(self, reader: asyncio.StreamReader, write: Callable[[bytes], Awaitable[None]]) -> None:
+        """
+        Answer the queries read from the stream until its end, without waiting for a query to be answered
+        before reading the next one.
+        """
+        pending = set()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+
+            task = asyncio.create_task(self._answer_line(line, write))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        if pending:
+            await asyncio.wait(pending)
+
+    async def _answer_line(self, line: bytes, write: Callable[[bytes], Awaitable[None]]) -> None:
+        try:
+            query = json.loads(line)
+            if not isinstance(query, dict):
+                raise ValueError("a query should be a JSON object")
+        except ValueError as e:
+            response: Dict[str, Any] = {"id": None, "error": f"invalid query: {e}"}
+        else:
+            response = await self.answer(query)
+
+        await write((json.dumps(response) + "\n").encode())
+
+
+_INDEXES: Dict[int, Callable[[Any], Any]] = {
+    1: ExpenseIndex,
+    7: BagIndex,
+    15: MemoryGame,
+}
+
+_QUERIES: Dict[int, Dict[str, Callable[[Any, Query], Any]]] = {
+    1: {
+        "two_sum": lambda index, query: index.two_sum(int(query["target"])),
+        "three_sum": lambda index, query: index.three_sum(int(query["target"])),
+    },
+    7: {
+        "containers": lambda index, query: index.containers(query["bag"]),
+        "contents": lambda index, query: index.contents(query["bag"]),
+    },
+    15: {
+        "spoken": lambda game, query: game.spoken(int(query["turn"])),
+    },
+}
+
+
+async def serve_stdio(daemon: Daemon) -> None:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    async def write(data: bytes) -> None:
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+    await daemon.serve(reader, write)
+
+
+async def serve_socket(daemon: Daemon, path: str) -> None:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        async def write(data: bytes) -> None:
+            writer.write(data)
+            await writer.drain()
+
+        try:
+            await daemon.serve(reader, write)
+        finally:
+            writer.close()
+
+    server = await asyncio.start_unix_server(handle, path=path)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Answer JSON-lines queries with the inputs kept in memory")
+    parser.add_argument("--socket", default=None, help="listen on this Unix socket instead of stdin")
+    args = parser.parse_args(argv)
+
+    daemon = Daemon()
+    try:
+        asyncio.run(serve_socket(daemon, args.socket) if args.socket else serve_stdio(daemon))
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
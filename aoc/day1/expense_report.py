@@ -35,7 +35,11 @@ In your expense report, what is the product of the three entries that sum to 202
 
 """
 import os
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Iterable
+
+from aoc.day1.k_sum import k_sum
+from aoc.day1.stream import first_two_sum
+from aoc.day1.subset_sum import SubsetSums
 
 
 def calculate_expense(numbers: List[int]) -> int:
@@ -46,8 +50,30 @@ def calculate_expense(numbers: List[int]) -> int:
     return numbers[res[0]] * numbers[res[1]]
 
 
+def calculate_expense_streamed(numbers: Iterable[int]) -> int:
+    """
+    Same as `calculate_expense`, reading the entries only up to the second one of the first pair.
+    """
+    pair = first_two_sum(numbers, 2020)
+    if not pair:
+        return 0
+
+    return pair.first * pair.second
+
+
 def calculate_expense_part2(numbers: List[int]) -> int:
-    res = _three_sum(numbers, 2020)
+    res = k_sum(numbers, 2020, 3)
+    if not res:
+        return 0
+
+    return numbers[res[0]] * numbers[res[1]] * numbers[res[2]]
+
+
+def calculate_expense_part2_with_bitsets(numbers: List[int]) -> int:
+    """
+    Same as `calculate_expense_part2`, from the table of all the sums of up to three entries.
+    """
+    res = SubsetSums(numbers, max_size=3, max_sum=2020).witness(2020, 3)
     if not res:
         return 0
 
@@ -99,13 +125,17 @@ def _three_sum(numbers: List[int], sum_to_find: int) -> Optional[Tuple[int, int,
     return None
 
 
+def _parse(lines: Iterable[str]) -> List[int]:
+    return [
+        int(line)
+        for line in lines
+        if line.strip()
+    ]
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as f:
-        input_numbers = [
-            int(line)
-            for line in f.readlines()
-            if line
-        ]
+        input_numbers = _parse(f.readlines())
 
         solution = calculate_expense(input_numbers)
         print(f"solution (part1): {solution}")
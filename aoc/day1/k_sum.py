@@ -0,0 +1,172 @@
+"""
+Find k entries of an expense report summing to a target, for any k, and for many targets at once.
+
+For a single target, the entries are sorted and all of them but the last two are fixed, the last two being
+found with two pointers, in O(n^(k-1)). From k=4, the report is combined by halves instead (meet in the
+middle), in O(n^(k/2)) time and memory.
+
+For many targets, the sums of all the pairs of entries are indexed once, so a pair is then found in O(1) and
+a triple in O(d) for every target, d being the number of distinct entries: the entries of a report are
+bounded, so a large report is mostly made of duplicates.
+
+All the functions give the indexes of the entries in the report, in increasing order.
+"""
+from bisect import bisect_left
+from collections import defaultdict, Counter
+from itertools import combinations
+from typing import List, Tuple, Optional, Dict, Iterable, Sequence
+
+Indexes = Tuple[int, ...]
+
+# from this k, the entries are combined by halves instead of fixing all of them but the last two
+MEET_IN_THE_MIDDLE_FROM = 4
+# above this number of pair sums, the pair sum index would not fit in memory, the targets are searched one by one
+MAX_INDEXED_PAIRS = 10 ** 7
+
+
+def k_sum(numbers: Sequence[int], target: int, k: int) -> Optional[Indexes]:
+    if k < 1:
+        raise ValueError(f"at least one entry should be summed, not {k}")
+    if k > len(numbers):
+        return None
+
+    order = sorted(range(len(numbers)), key=numbers.__getitem__)
+    values = [numbers[idx] for idx in order]
+    if k < MEET_IN_THE_MIDDLE_FROM:
+        positions = _k_sum_sorted(values, target, k, 0)
+    else:
+        positions = _meet_in_the_middle(values, target, k)
+
+    return tuple(sorted(order[position] for position in positions)) if positions else None
+
+
+def _k_sum_sorted(values: List[int], target: int, k: int, start: int) -> Optional[List[int]]:
+    """
+    Positions of k sorted values summing to the target, taken from `start`.
+    """
+    length = len(values)
+    if k == 1:
+        position = bisect_left(values, target, start)
+        return [position] if position < length and values[position] == target else None
+
+    if k == 2:
+        low, high = start, length - 1
+        while low < high:
+            pair_sum = values[low] + values[high]
+            if pair_sum == target:
+                return [low, high]
+            if pair_sum < target:
+                low += 1
+            else:
+                high -= 1
+        return None
+
+    largest = sum(values[length - k + 1:])
+    for first in range(start, length - k + 1):
+        value = values[first]
+        if first > start and value == values[first - 1]:
+            # the same value has already been tried with more entries available after it
+            continue
+        if value + sum(values[first + 1:first + k]) > target:
+            # the smallest sums are only growing from there
+            break
+        if value + largest < target:
+            continue
+
+        rest = _k_sum_sorted(values, target - value, k - 1, first + 1)
+        if rest:
+            return [first] + rest
+
+    return None
+
+
+def _meet_in_the_middle(values: List[int], target: int, k: int) -> Optional[List[int]]:
+    half = k // 2
+    # for every sum of `half` entries, the combination ending the soonest, so it can be completed by
+    # the combinations of the other half starting after it
+    lefts: Dict[int, Tuple[int, ...]] = {}
+    for combination in combinations(range(len(values)), half):
+        combination_sum = sum(values[position] for position in combination)
+        known = lefts.get(combination_sum)
+        if known is None or combination[-1] < known[-1]:
+            lefts[combination_sum] = combination
+
+    for combination in combinations(range(len(values)), k - half):
+        left = lefts.get(target - sum(values[position] for position in combination))
+        if left is not None and left[-1] < combination[0]:
+            return list(left + combination)
+
+    return None
+
+
+class PairSumIndex:
+    """
+    Sums of the pairs of distinct entries of a report, built once to answer many targets.
+
+    The pairs are indexed by values, not by entries: with d distinct values, there are at most d^2/2 sums,
+    and for every sum the pair with the greatest smallest value is kept, which is the one a triple can be
+    built on with a third value lower than its two.
+    """
+
+    def __init__(self, numbers: Sequence[int]):
+        self.indexes_by_value: Dict[int, List[int]] = defaultdict(list)
+        for idx, number in enumerate(numbers):
+            self.indexes_by_value[number].append(idx)
+        self.values = sorted(self.indexes_by_value)
+
+        self.pairs: Dict[int, Tuple[int, int]] = {}
+        for position, smallest in enumerate(self.values):
+            if len(self.indexes_by_value[smallest]) > 1:
+                self.pairs[2 * smallest] = (smallest, smallest)
+            # the greater smallest values are written last, so they are the ones kept
+            self.pairs.update({
+                smallest + value: (smallest, value)
+                for value in self.values[position + 1:]
+            })
+
+    def two_sum(self, target: int) -> Optional[Indexes]:
+        pair = self.pairs.get(target)
+        return self._indexes(pair) if pair else None
+
+    def three_sum(self, target: int) -> Optional[Indexes]:
+        for smallest in self.values:
+            if 3 * smallest > target:
+                break
+
+            pair = self.pairs.get(target - smallest)
+            if pair is None or pair[0] < smallest:
+                continue
+            triple = (smallest, *pair)
+            if triple.count(smallest) <= len(self.indexes_by_value[smallest]):
+                return self._indexes(triple)
+
+        return None
+
+    def find(self, target: int, k: int) -> Optional[Indexes]:
+        if k == 2:
+            return self.two_sum(target)
+        if k == 3:
+            return self.three_sum(target)
+
+        raise ValueError(f"only pairs and triples are found from the pair sums, not {k} entries")
+
+    def _indexes(self, values: Iterable[int]) -> Indexes:
+        used: Counter = Counter()
+        indexes = []
+        for value in values:
+            indexes.append(self.indexes_by_value[value][used[value]])
+            used[value] += 1
+
+        return tuple(sorted(indexes))
+
+
+def k_sums(numbers: Sequence[int], targets: Iterable[int], k: int) -> Dict[int, Optional[Indexes]]:
+    """
+    Entries summing to every target, through a pair sum index for pairs and triples when it fits in memory.
+    """
+    distinct = len(set(numbers))
+    if k in (2, 3) and distinct * (distinct + 1) // 2 <= MAX_INDEXED_PAIRS:
+        index = PairSumIndex(numbers)
+        return {target: index.find(target, k) for target in targets}
+
+    return {target: k_sum(numbers, target, k) for target in targets}
@@ -0,0 +1,190 @@
+"""
+Two-sum over a stream of expenses (a pipe, a memory-mapped file...), without holding the report in memory.
+
+A pair is given as soon as its second entry is read, with the index of the first entry of the stream having
+the complementary value. Only the values already seen are kept:
+- in an array of first indexes, when the values are known to be bounded (8 bytes per possible value),
+- in a bitmap, when the bounded values are enough and the indexes are not needed (1 bit per possible value),
+- in a dict otherwise (its memory is growing with the number of distinct values).
+
+All the pairs of an entry, with every earlier index of its complementary value, need all the indexes of the values
+seen, kept in a dict of lists (its memory is growing with the number of entries).
+
+    PYTHONPATH=. python -m aoc.day1.stream ledger.txt --target 2020 --bounds 0 100000 --all
+    cat ledger.txt | PYTHONPATH=. python -m aoc.day1.stream - --target 2020
+"""
+import argparse
+import mmap
+import os
+import sys
+from array import array
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple, BinaryIO, Union, Dict, List
+
+
+class Pair(NamedTuple):
+    # None when the values are only remembered in a bitmap
+    first_index: Optional[int]
+    second_index: int
+    first: int
+    second: int
+
+
+class _SeenIndexes:
+    def __init__(self):
+        self._first_indexes: Dict[int, int] = {}
+
+    def get(self, value: int) -> Optional[int]:
+        return self._first_indexes.get(value)
+
+    def add(self, value: int, idx: int) -> None:
+        self._first_indexes.setdefault(value, idx)
+
+
+class _AllSeenIndexes:
+    def __init__(self):
+        self._indexes: Dict[int, List[int]] = {}
+
+    def get(self, value: int) -> Optional[List[int]]:
+        return self._indexes.get(value)
+
+    def add(self, value: int, idx: int) -> None:
+        self._indexes.setdefault(value, []).append(idx)
+
+
+class _SeenIndexArray:
+    def __init__(self, bounds: Tuple[int, int]):
+        self._low = bounds[0]
+        # the first index of every value, -1 for the values not seen yet
+        self._first_indexes = array("q", [-1]) * (bounds[1] - bounds[0] + 1)
+
+    def get(self, value: int) -> Optional[int]:
+        offset = value - self._low
+        if 0 <= offset < len(self._first_indexes) and self._first_indexes[offset] >= 0:
+            return self._first_indexes[offset]
+        return None
+
+    def add(self, value: int, idx: int) -> None:
+        if self._first_indexes[value - self._low] < 0:
+            self._first_indexes[value - self._low] = idx
+
+
+class _SeenBitmap:
+    def __init__(self, bounds: Tuple[int, int]):
+        self._low = bounds[0]
+        self._size = bounds[1] - bounds[0] + 1
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def get(self, value: int) -> Optional[bool]:
+        offset = value - self._low
+        if 0 <= offset < self._size and self._bits[offset >> 3] >> (offset & 7) & 1:
+            return True
+        return None
+
+    def add(self, value: int, _: int) -> None:
+        offset = value - self._low
+        self._bits[offset >> 3] |= 1 << (offset & 7)
+
+
+def stream_two_sum(numbers: Iterable[int],
+                   target: int,
+                   bounds: Optional[Tuple[int, int]] = None,
+                   with_indexes: bool = True,
+                   all_indexes: bool = False) -> Iterator[Pair]:
+    """
+    Every entry summing to the target with an earlier one, as soon as it is read.
+
+    With `bounds`, the entries have to be between them (inclusive), and `with_indexes=False` is keeping
+    a bitmap of the values seen instead of their first indexes. With `all_indexes`, an entry is given in a pair
+    with every earlier index of its complementary value, instead of its first one only.
+    """
+    if not with_indexes and not bounds:
+        raise ValueError("the values can only be kept in a bitmap when they are bounded")
+    if not with_indexes and all_indexes:
+        raise ValueError("all the indexes can not be given when the values are kept in a bitmap")
+    if all_indexes:
+        seen: Union[_SeenIndexes, _AllSeenIndexes, _SeenIndexArray, _SeenBitmap] = _AllSeenIndexes()
+    elif not with_indexes:
+        seen = _SeenBitmap(bounds)
+    elif bounds:
+        seen = _SeenIndexArray(bounds)
+    else:
+        seen = _SeenIndexes()
+    low, high = bounds if bounds else (None, None)
+
+    for idx, number in enumerate(numbers):
+        if bounds and not low <= number <= high:
+            raise ValueError(f"entry {idx} ({number}) is out of the bounds {low}..{high}")
+
+        found = seen.get(target - number)
+        if found is not None and all_indexes:
+            for first_index in found:
+                yield Pair(first_index, idx, target - number, number)
+        elif found is not None:
+            yield Pair(found if with_indexes else None, idx, target - number, number)
+        seen.add(number, idx)
+
+
+def first_two_sum(numbers: Iterable[int],
+                  target: int,
+                  bounds: Optional[Tuple[int, int]] = None,
+                  with_indexes: bool = True) -> Optional[Pair]:
+    """
+    The first pair summing to the target, reading the stream only up to its second entry.
+    """
+    return next(stream_two_sum(numbers, target, bounds, with_indexes), None)
+
+
+def read_numbers(source: Union[str, BinaryIO]) -> Iterator[int]:
+    """
+    The numbers of a file, one per line, memory-mapped when given by its path, or read from a binary stream.
+    """
+    if not isinstance(source, str):
+        yield from _parse_lines(source)
+        return
+
+    with open(source, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            # an empty file can not be mapped
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from _parse_lines(iter(mapped.readline, b""))
+
+
+def _parse_lines(lines: Iterable[bytes]) -> Iterator[int]:
+    for line in lines:
+        if line.strip():
+            yield int(line)
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Find the pairs of entries of a stream summing to a target")
+    parser.add_argument("source", help="file of numbers, one per line, or - for stdin")
+    parser.add_argument("--target", type=int, default=2020)
+    parser.add_argument("--bounds", type=int, nargs=2, default=None, metavar=("MIN", "MAX"),
+                        help="bounds of the entries, to remember them in an array instead of a dict")
+    parser.add_argument("--no-indexes", action="store_true", help="remember the entries in a bitmap (needs --bounds)")
+    parser.add_argument("--all", action="store_true",
+                        help="print all the pairs, not only the first one (with --no-indexes, "
+                             "each entry completing a pair, once)")
+    args = parser.parse_args(argv)
+
+    numbers = read_numbers(sys.stdin.buffer if args.source == "-" else args.source)
+    pairs = stream_two_sum(
+        numbers,
+        args.target,
+        tuple(args.bounds) if args.bounds else None,
+        with_indexes=not args.no_indexes,
+        all_indexes=args.all and not args.no_indexes
+    )
+    found = False
+    for pair in pairs:
+        found = True
+        print(f"{pair.first_index} {pair.second_index} {pair.first} {pair.second}", flush=True)
+        if not args.all:
+            break
+
+    return 0 if found else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
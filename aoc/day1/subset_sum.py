@@ -0,0 +1,82 @@
+"""
+Every sum reachable with j entries of an expense report (j up to a given size), computed in one pass.
+
+The sums reachable with j entries are the bits of a big int, so adding an entry of value v is shifting the
+sums of j - 1 entries by v, for every j:
+
+    reachable[j] |= reachable[j - 1] << v
+
+which is O(n.k.T/64) for sums up to T: the whole table of a large report is computed once, then any target
+is answered in O(1). The entries have to be non-negative, which the expenses are.
+
+The first entry making a sum reachable is recorded, so a witness (the indexes of the entries) can be built
+on demand, by walking back from the last entry used.
+"""
+from array import array
+from typing import Sequence, Optional, List, Tuple
+
+Indexes = Tuple[int, ...]
+
+_UNREACHED = -1
+
+
+class SubsetSums:
+    def __init__(self, numbers: Sequence[int], max_size: int, max_sum: int):
+        if max_size < 1:
+            raise ValueError(f"the subsets should have at least one entry, not {max_size}")
+        self.numbers = numbers
+        self.max_size = max_size
+        self.max_sum = max_sum
+
+        mask = (1 << (max_sum + 1)) - 1
+        # bit s of reachable[j] is set when s is the sum of j entries, the empty subset summing to 0
+        self.reachable: List[int] = [1] + [0] * max_size
+        # index of the entry which made the sum s reachable with j entries, for the witnesses
+        self._origins = [array("l", [_UNREACHED]) * (max_sum + 1) for _ in range(max_size + 1)]
+
+        for idx, number in enumerate(numbers):
+            if number < 0:
+                raise ValueError(f"the entries should be non-negative, not {number}")
+            if number > max_sum:
+                continue
+
+            # from the largest subsets, so an entry is only used once
+            for size in range(min(max_size, idx + 1), 0, -1):
+                sums = self.reachable[size]
+                new_sums = (self.reachable[size - 1] << number) & mask & ~sums
+                if new_sums:
+                    self.reachable[size] = sums | new_sums
+                    self._record(size, new_sums, idx)
+
+    def _record(self, size: int, new_sums: int, idx: int) -> None:
+        origins = self._origins[size]
+        while new_sums:
+            lowest = new_sums & -new_sums
+            origins[lowest.bit_length() - 1] = idx
+            new_sums ^= lowest
+
+    def is_reachable(self, target: int, size: int) -> bool:
+        return 0 <= target <= self.max_sum and 0 <= size <= self.max_size and bool(self.reachable[size] >> target & 1)
+
+    def targets(self, size: int) -> List[int]:
+        """
+        All the sums of `size` entries, in increasing order.
+        """
+        sums = self.reachable[size]
+        return [target for target in range(sums.bit_length()) if sums >> target & 1]
+
+    def witness(self, target: int, size: int) -> Optional[Indexes]:
+        """
+        Indexes of `size` entries summing to the target, if any.
+        """
+        if not self.is_reachable(target, size):
+            return None
+
+        indexes = []
+        while size:
+            idx = self._origins[size][target]
+            indexes.append(idx)
+            target -= self.numbers[idx]
+            size -= 1
+
+        return tuple(sorted(indexes))
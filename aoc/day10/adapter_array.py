@@ -126,7 +126,7 @@ What is the total number of distinct ways you can arrange the adapters to connec
 """
 import os
 from collections import defaultdict
-from typing import List, Tuple, Set, Dict
+from typing import List, Tuple, Set, Dict, Iterable
 
 
 def _get_set_and_max(adapters: List[int]) -> Tuple[Set[int], int]:
@@ -215,9 +215,17 @@ def _build_adapters_tree(adapters_set: Set[int], max_joltage: int) -> Dict[int,
     return tree
 
 
+def _parse(lines: Iterable[str]) -> List[int]:
+    return [
+        int(line)
+        for line in lines
+        if line.strip()
+    ]
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
-        numbers_from_file = list(map(int, file.readlines()))
+        numbers_from_file = _parse(file.readlines())
 
         solution_part1 = find_joltage_difference(numbers_from_file)
         print(f"solution (part1): {solution_part1}")
@@ -197,172 +197,81 @@ Given the new visibility method and the rule change for occupied seats becoming
  many seats end up occupied?
 """
 import os
-from typing import List, Iterable, Callable, Optional, Tuple
+from typing import Iterable, Optional
 
-OCCUPIED_SEAT = "#"
-EMPTY_SEAT = "L"
-FLOOR = "."
+from aoc.util.automaton import Automaton, Rule, line_of_sight
+from aoc.util.matrix import Grid
 
+# the seats are stored as the codes of their characters
+OCCUPIED_SEAT = ord("#")
+EMPTY_SEAT = ord("L")
+FLOOR = ord(".")
 
-OccupiedPredicate = Callable[[int, int, List[List[str]], Callable[[int, int], Tuple[int, int]]], bool]
 
-
-def fill_seats(seats: List[List[str]],
-               is_occupied_predicate: OccupiedPredicate,
+def fill_seats(seats: Grid,
+               reach: Optional[int] = 1,
                empty_seat_threshold: int = 4) -> int:
-    counter = 0
-    number_of_modifications = 0
-    while counter == 0 or number_of_modifications > 0:
-        seat_predicate: Callable[[str], bool]
-        change_seat_state: Callable[[int], Optional[str]]
-        if counter % 2 == 0:
-            seat_predicate = _is_seat_empty
-            change_seat_state = _should_occupy_seat
-        else:
-            seat_predicate = _is_seat_occupied
-            change_seat_state = _should_empty_seat_factory(empty_seat_threshold)
-
-        # round to occupy some seats
-        number_of_modifications = _apply_round(
-            seats,
-            seat_predicate,
-            change_seat_state,
-            is_occupied_predicate
-        )
-
-        counter += 1
-
-    return _count_occupied_seats(seats)
-
-
-def _should_occupy_seat(occupied_adjacent_seats: int) -> Optional[str]:
-    return "#" if occupied_adjacent_seats == 0 else None
-
-
-def _should_empty_seat_factory(threshold: int) -> Callable[[int], Optional[str]]:
-    return lambda occupied_adjacent_seats: "L" if occupied_adjacent_seats >= threshold else None
-
-
-def _is_seat_occupied(seat: str) -> bool:
-    return seat == OCCUPIED_SEAT
-
-
-def _is_seat_empty(seat: str) -> bool:
-    return seat == EMPTY_SEAT
-
-
-def _is_floor(seat: str) -> bool:
-    return seat == FLOOR
-
-
-def _count_occupied_seats(seats: List[List[str]]):
-    return sum((_is_seat_occupied(seat) for row in seats for seat in row))
-
-
-def _apply_round(seats: List[List[str]],
-                 seat_predicate: Callable[[str], bool],
-                 change_seat_state: Callable[[int], Optional[str]],
-                 is_occupied_predicate: OccupiedPredicate) -> int:
-    seats_snapshot = _snapshot_seats(seats)
-    width = len(seats_snapshot)
-    height = len(seats_snapshot[0])
-    change_counter = 0
-    for row in range(width):
-        for col in range(height):
-            if seat_predicate(seats_snapshot[row][col]):
-                number_of_occupied_seats = _count_occupied_adjacent_seats(
-                    row,
-                    col,
-                    seats_snapshot,
-                    is_occupied_predicate
-                )
-                new_state = change_seat_state(number_of_occupied_seats)
-                if new_state:
-                    seats[row][col] = new_state
-                    change_counter += 1
-
-    return change_counter
-
-
-def _count_occupied_adjacent_seats(row: int,
-                                   col: int,
-                                   seats: List[List[str]],
-                                   is_occupied_predicate: OccupiedPredicate) -> int:
-    return sum([
-        is_occupied_predicate(row, col, seats, lambda r, c: (r - 1, c - 1)),
-        is_occupied_predicate(row, col, seats, lambda r, c: (r - 1, c)),
-        is_occupied_predicate(row, col, seats, lambda r, c: (r - 1, c + 1)),
-        is_occupied_predicate(row, col, seats, lambda r, c: (r, c - 1)),
-        is_occupied_predicate(row, col, seats, lambda r, c: (r, c + 1)),
-        is_occupied_predicate(row, col, seats, lambda r, c: (r + 1, c - 1)),
-        is_occupied_predicate(row, col, seats, lambda r, c: (r + 1, c)),
-        is_occupied_predicate(row, col, seats, lambda r, c: (r + 1, c + 1)),
-    ])
-
-
-def _is_occupied(row: int,
-                 col: int,
-                 seats: List[List[str]],
-                 move: Callable[[int, int], Tuple[int, int]]) -> bool:
-    next_row, next_col = move(row, col)
-    if 0 <= next_row < len(seats):
-        if 0 <= next_col < len(seats[next_row]):
-            return _is_seat_occupied(seats[next_row][next_col])
+    """
+    People are taking the seats without occupied neighbors, and leaving the seats with at least
+    `empty_seat_threshold` occupied neighbors, which is an automaton on the graph of the seats.
+    The neighbors of a seat are the first seats it sees in every direction, up to `reach` positions away
+    (or up to the border of the room for None).
+    The seats are updated to their state once nobody is moving anymore.
+    """
+    graph, positions = line_of_sight(
+        seats,
+        is_cell=lambda seat: seat != FLOOR,
+        reach=reach
+    )
+    automaton = Automaton(
+        graph,
+        Rule.of(birth={0}, survival=range(empty_seat_threshold)),
+        (seat for seat, (row, col) in enumerate(positions) if seats[row, col] == OCCUPIED_SEAT)
+    )
+    automaton.run()
 
-    return False  # out of bounds seat ar not occupied
+    occupied_seats = automaton.cells()
+    for seat, (row, col) in enumerate(positions):
+        seats[row, col] = OCCUPIED_SEAT if seat in occupied_seats else EMPTY_SEAT
 
+    return automaton.population
 
-def _is_direction_occupied(row: int,
-                           col: int,
-                           seats: List[List[str]],
-                           move: Callable[[int, int], Tuple[int, int]]) -> bool:
-    next_row, next_col = move(row, col)
-    if 0 <= next_row < len(seats):
-        if 0 <= next_col < len(seats[next_row]):
-            seat = seats[next_row][next_col]
-            if _is_floor(seat):
-                return _is_direction_occupied(next_row, next_col, seats, move)
-            else:
-                return _is_seat_occupied(seat)
 
-    return False  # out of bounds seat ar not occupied
+def solve_part1(seats: Grid) -> int:
+    return fill_seats(
+        _snapshot_seats(seats)  # because we are mutating the seats
+    )
 
 
-def _parse(raw_rows: Iterable[str]) -> List[List[str]]:
-    return [
-        _parse_row(raw_row)
-        for raw_row in raw_rows
-    ]
+def solve_part2(seats: Grid) -> int:
+    return fill_seats(
+        _snapshot_seats(seats),  # because we are mutating the seats
+        reach=None,
+        empty_seat_threshold=5
+    )
 
 
-def _parse_row(raw_row: str) -> List[str]:
-    return [c for c in raw_row.rstrip()]
+def _parse(raw_rows: Iterable[str]) -> Grid:
+    return Grid.parse(raw_rows)
 
 
-def _print_seats(seats: List[List[str]]) -> None:
-    for row in seats:
-        print("".join(row))
+def _print_seats(seats: Grid) -> None:
+    for row in seats.to_lines():
+        print(row)
 
 
-def _snapshot_seats(seats: List[List[str]]) -> List[List[str]]:
-    return [list(row) for row in seats]
+def _snapshot_seats(seats: Grid) -> Grid:
+    return seats.copy()
 
 
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
         seats_from_file = _parse(file.readlines())
 
-        solution_part1 = fill_seats(
-            _snapshot_seats(seats_from_file),  # because we are mutating the seats
-            is_occupied_predicate=_is_occupied
-        )
+        solution_part1 = solve_part1(seats_from_file)
         print(f"solution (part1): {solution_part1}")
         assert solution_part1 == 2289
 
-        solution_part2 = fill_seats(
-            _snapshot_seats(seats_from_file),  # because we are mutating the seats
-            is_occupied_predicate=_is_direction_occupied,
-            empty_seat_threshold=5
-        )
+        solution_part2 = solve_part2(seats_from_file)
         print(f"solution (part2): {solution_part2}")
         assert solution_part2 == 2059
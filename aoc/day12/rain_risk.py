@@ -199,6 +199,30 @@ def calculate_manhattan_distance(orig: Position, dest: Position) -> int:
     return abs(dest.x - orig.x) + abs(dest.y - orig.y)
 
 
+def solve_part1(instructions: List[Instruction]) -> int:
+    initial_position = Position()
+    return calculate_manhattan_distance(
+        orig=initial_position,
+        dest=move(
+            instructions=instructions,
+            position=initial_position,
+            direction=Direction.EAST
+        )
+    )
+
+
+def solve_part2(instructions: List[Instruction]) -> int:
+    initial_position = Position()
+    return calculate_manhattan_distance(
+        orig=initial_position,
+        dest=move2(
+            instructions=instructions,
+            position=initial_position,
+            waypoint=Position(10, 1)
+        )
+    )
+
+
 def _parse(lines: Iterable[str]) -> List[Instruction]:
     return [_parse_instruction(line) for line in lines]
 
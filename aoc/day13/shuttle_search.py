@@ -171,6 +171,23 @@ def _parse_shuttle_ids(line: str) -> List[Optional[int]]:
     ]
 
 
+def _parse_notes(lines: Iterable[str]) -> Tuple[int, List[Optional[int]]]:
+    iterator = iter(lines)
+    timestamp = int(next(iterator).rstrip())
+    return timestamp, _parse_shuttle_ids(next(iterator))
+
+
+def solve_part1(notes: Tuple[int, List[Optional[int]]]) -> int:
+    timestamp, shuttle_ids = notes
+    shuttle = get_best_shuttle(timestamp, [shuttle_id for shuttle_id in shuttle_ids if shuttle_id])
+    return shuttle.id * shuttle.waiting_time
+
+
+def solve_part2(notes: Tuple[int, List[Optional[int]]]) -> int:
+    _, shuttle_ids = notes
+    return get_earliest_timestamp(list(shuttle_ids))  # because the ids are consumed
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
         raw_lines = list(file.readlines())
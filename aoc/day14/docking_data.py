@@ -212,18 +212,22 @@ def execute_program_v2(lines: Iterable[str]) -> Dict[int, int]:
     return memory
 
 
+def solve_part1(lines: Iterable[str]) -> int:
+    return sum_memory(execute_program(lines))
+
+
+def solve_part2(lines: Iterable[str]) -> int:
+    return sum_memory(execute_program_v2(lines))
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
         raw_lines = list(file.readlines())
 
-        solution_part1 = sum_memory(
-            execute_program(raw_lines)
-        )
+        solution_part1 = solve_part1(raw_lines)
         print(f"solution (part1): {solution_part1}")
         assert solution_part1 == 17028179706934
 
-        solution_part2 = sum_memory(
-            execute_program_v2(raw_lines)
-        )
+        solution_part2 = solve_part2(raw_lines)
         print(f"solution (part2): {solution_part2}")
         assert solution_part2 == 3683236147222
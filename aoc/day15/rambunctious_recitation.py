@@ -39,8 +39,9 @@ Here are a few more examples:
 Given your starting numbers, what will be the 2020th number spoken?
 
 """
-import time
-from typing import List, Dict, Tuple
+from array import array
+from typing import List, Dict, Tuple, Iterable
+from aoc.util.profiling import phase
 
 
 def _init(starting_numbers: List[int]) -> Tuple[int, int, Dict[int, int]]:
@@ -59,6 +60,14 @@ def play_game(starting_numbers: List[int], number_of_turns: int) -> int:
         return starting_numbers[number_of_turns - 1]
 
     last_spoken_number, last_turn, memo = _init(starting_numbers)
+    return _play_turns(last_spoken_number, last_turn, memo, number_of_turns)
+
+
+def _play_turns(last_spoken_number: int, last_turn: int, memo: Dict[int, int], number_of_turns: int) -> int:
+    """
+    Continue a game from its last turn up to the given turn, updating the memo of the turns the numbers
+    were spoken at, so the game can be continued again later.
+    """
     for turn_index in range(last_turn + 1, number_of_turns + 1):
         if last_spoken_number not in memo:
             spoken_number = 0
@@ -71,15 +80,40 @@ def play_game(starting_numbers: List[int], number_of_turns: int) -> int:
     return last_spoken_number
 
 
+def play_game_with_array(starting_numbers: List[int], number_of_turns: int) -> int:
+    """
+    Same game as `play_game`, with the last turns the numbers were spoken at stored in an array indexed
+    by the numbers instead of a dict: a spoken number is an age, so it is always lower than the number of turns.
+    """
+    if number_of_turns <= len(starting_numbers):
+        return starting_numbers[number_of_turns - 1]
+
+    size = max(number_of_turns, max(starting_numbers) + 1)
+    # turn each number was last spoken at, 0 for the numbers never spoken
+    last_turns = array("I" if size < 2 ** 32 else "Q", [0]) * size
+    for turn, starting_number in enumerate(starting_numbers[:-1], start=1):
+        last_turns[starting_number] = turn
+
+    spoken_number = starting_numbers[-1]
+    for turn in range(len(starting_numbers), number_of_turns):
+        last_turn = last_turns[spoken_number]
+        last_turns[spoken_number] = turn
+        spoken_number = turn - last_turn if last_turn else 0
+
+    return spoken_number
+
+
+def _parse(lines: Iterable[str]) -> List[int]:
+    return list(map(int, next(iter(lines)).strip().split(",")))
+
+
 if __name__ == "__main__":
-    start = time.time()
-    solution_part1 = play_game([18, 11, 9, 0, 5, 1], 2020)
-    end = time.time()
-    print(f"solution (part1): {solution_part1} in {(end - start) * 1000}ms")
+    with phase("part1") as timing:
+        solution_part1 = play_game([18, 11, 9, 0, 5, 1], 2020)
+    print(f"solution (part1): {solution_part1} in {timing.wall_ms}ms")
     assert solution_part1 == 959
 
-    start = time.time()
-    solution_part2 = play_game([18, 11, 9, 0, 5, 1], 30000000)
-    end = time.time()
-    print(f"solution (part2): {solution_part2} in {(end - start) * 1000}ms")
+    with phase("part2") as timing:
+        solution_part2 = play_game([18, 11, 9, 0, 5, 1], 30000000)
+    print(f"solution (part2): {solution_part2} in {timing.wall_ms}ms")
     assert solution_part2 == 116590
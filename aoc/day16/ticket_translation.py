@@ -73,10 +73,11 @@ do you get if you multiply those six values together?
 """
 import os
 import re
-import time
 from functools import reduce
 from operator import mul
 from typing import List, Tuple, NamedTuple, Dict, Iterable, Set
+from aoc.util.profiling import phase
+from aoc.util.vectorized import numpy, use_numpy
 
 CONSTRAINT_REGEX = re.compile(r"^(.*?): (\d+)-(\d+) or (\d+)-(\d+)$")
 
@@ -140,6 +141,11 @@ def _parse_constraint(line: str) -> Constraint:
 
 
 def add_errors(tickets: List[Ticket], constraints: List[Constraint]) -> int:
+    if tickets and use_numpy():
+        values = numpy.array(tickets)
+        valid = numpy.logical_or.reduce(_match_constraints_with_numpy(values, constraints))
+        return int(values[~valid].sum())
+
     return sum((
         sum(_get_errors_in_ticket(ticket, constraints))
         for ticket in tickets
@@ -162,6 +168,21 @@ def _check_field_for_constraint(field: int, constraint: Constraint) -> bool:
     return any(map(lambda r: r.in_range(field), constraint.ranges))
 
 
+def _match_constraints_with_numpy(values: "numpy.ndarray",
+                                  constraints: List[Constraint]) -> List["numpy.ndarray"]:
+    """
+    For every constraint, the mask of the values matching it.
+    """
+    masks = []
+    for constraint in constraints:
+        mask = numpy.zeros(values.shape, dtype=bool)
+        for valid_range in constraint.ranges:
+            mask |= (values >= valid_range.min_bound) & (values <= valid_range.max_bound)
+        masks.append(mask)
+
+    return masks
+
+
 def _find_constraint_per_field(valid_tickets: Iterable[Ticket],
                                constraints: List[Constraint]) -> List[str]:
 
@@ -222,6 +243,9 @@ def _map_field_in_ticket(ticket: Ticket, constraints: List[str]) -> Dict[str, in
 def map_fields_for_my_ticket(my_ticket: Ticket,
                              other_tickets: List[Ticket],
                              constraints: List[Constraint]) -> Dict[str, int]:
+    if other_tickets and use_numpy():
+        return _map_field_in_ticket(my_ticket, _find_constraint_per_field_with_numpy(other_tickets, constraints))
+
     def _is_ticket_valid(ticket: Ticket) -> bool:
         return len(_get_errors_in_ticket(ticket, constraints)) == 0
 
@@ -232,6 +256,33 @@ def map_fields_for_my_ticket(my_ticket: Ticket,
     return _map_field_in_ticket(my_ticket, ordered_constraints)
 
 
+def _find_constraint_per_field_with_numpy(tickets: List[Ticket], constraints: List[Constraint]) -> List[str]:
+    values = numpy.array(tickets)
+    masks = _match_constraints_with_numpy(values, constraints)
+    valid_tickets = numpy.logical_or.reduce(masks).all(axis=1)
+    # the fields where every valid ticket is matching the constraint
+    matching_fields = [mask[valid_tickets].all(axis=0) for mask in masks]
+
+    return _reduce_constraints_per_fields([
+        {
+            constraint.name
+            for constraint, fields in zip(constraints, matching_fields)
+            if fields[idx]
+        }
+        for idx in range(values.shape[1])
+    ])
+
+
+def solve_part1(notes: Tuple[List[Constraint], Ticket, List[Ticket]]) -> int:
+    constraints, _, other_tickets = notes
+    return add_errors(other_tickets, constraints)
+
+
+def multiply_departure_fields(notes: Tuple[List[Constraint], Ticket, List[Ticket]]) -> int:
+    constraints, my_ticket, other_tickets = notes
+    return solve_part2(map_fields_for_my_ticket(my_ticket, other_tickets, constraints))
+
+
 def solve_part2(named_fields: Dict[str, int]) -> int:
     return reduce(
         mul,
@@ -248,15 +299,13 @@ if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
         _constraints, _my_ticket, _other_tickets = _parse(list(file.readlines()))
 
-        start = time.time()
-        solution_part1 = add_errors(_other_tickets, _constraints)
-        end = time.time()
-        print(f"solution (part1): {solution_part1} in {(end - start) * 1000}ms")
+        with phase("part1") as timing:
+            solution_part1 = add_errors(_other_tickets, _constraints)
+        print(f"solution (part1): {solution_part1} in {timing.wall_ms}ms")
         assert solution_part1 == 25972
 
-        start = time.time()
-        _named_fields = map_fields_for_my_ticket(_my_ticket, _other_tickets, _constraints)
-        solution_part2 = solve_part2(_named_fields)
-        end = time.time()
-        print(f"solution (part2): {solution_part2} in {(end - start) * 1000}ms")
+        with phase("part2") as timing:
+            _named_fields = map_fields_for_my_ticket(_my_ticket, _other_tickets, _constraints)
+            solution_part2 = solve_part2(_named_fields)
+        print(f"solution (part2): {solution_part2} in {timing.wall_ms}ms")
         assert solution_part2 == 622670335901
@@ -145,13 +145,17 @@ the sixth cycle?
 
 """
 import os
-import time
 from copy import deepcopy
-from typing import List, Tuple
+from typing import List, Tuple, Set
+from aoc.util.automaton import Automaton, Rule, hypercube
+from aoc.util.profiling import phase
 
 PocketDimension = List[List[List[bool]]]
 Coordinate = Tuple[int, int, int]
 
+# an active cube stays active with 2 or 3 active neighbors, an inactive cube becomes active with 3
+CONWAY_RULE = Rule.of(birth={3}, survival={2, 3})
+
 
 def count_active(pocket: PocketDimension) -> int:
     return sum((
@@ -177,16 +181,24 @@ def _count_active_neighbors(coord: Coordinate, pocket: PocketDimension) -> int:
 
 
 def execute_cycle(cycle_idx: int, cycles: int, pocket: PocketDimension) -> PocketDimension:
+    active_cubes = {
+        (x, y, z)
+        for z, z_layer in enumerate(pocket)
+        for y, line in enumerate(z_layer)
+        for x, cube in enumerate(line)
+        if cube
+    }
+    automaton = Automaton(hypercube(3), CONWAY_RULE, active_cubes)
+    automaton.run(1)
+
+    # the border of the pocket is never activated, it is only there to be counted as inactive neighbors
     margin = cycles - cycle_idx
     result = _init_empty_pocket(pocket)
-    for z in range(margin, len(pocket) - margin):
-        for y in range(margin, len(pocket[z]) - margin):
-            for x in range(margin, len(pocket[z][y]) - margin):
-                actives = _count_active_neighbors((x, y, z), pocket)
-                if pocket[z][y][x]:
-                    result[z][y][x] = actives in (2, 3)
-                else:
-                    result[z][y][x] = actives == 3
+    for x, y, z in automaton.cells():
+        if margin <= z < len(pocket) - margin and \
+                margin <= y < len(pocket[z]) - margin and \
+                margin <= x < len(pocket[z][y]) - margin:
+            result[z][y][x] = True
 
     return result
 
@@ -202,11 +214,27 @@ def _init_empty_pocket(pocket: PocketDimension) -> PocketDimension:
 
 
 def solve_part1(lines: List[str], cycles: int) -> int:
-    pocket = _parse(lines, cycles)
-    for cycle_idx in range(cycles):
-        pocket = execute_cycle(cycle_idx, cycles, pocket)
+    return run_cycles(lines, cycles, dimensions=3)
+
+
+def run_cycles(lines: List[str], cycles: int, dimensions: int) -> int:
+    """
+    Number of active cubes after the given cycles, in a pocket dimension having the given number of dimensions.
+    """
+    automaton = Automaton(hypercube(dimensions), CONWAY_RULE, _parse_active_cubes(lines, dimensions))
+    automaton.run(cycles)
+
+    return automaton.population
+
 
-    return count_active(pocket)
+def _parse_active_cubes(lines: List[str], dimensions: int) -> Set[Tuple[int, ...]]:
+    padding = (0,) * (dimensions - 2)
+    return {
+        (x, y, *padding)
+        for y, line in enumerate(lines)
+        for x, cube in enumerate(line.rstrip())
+        if cube == "#"
+    }
 
 
 def _parse(lines: List[str], cycles: int) -> PocketDimension:
@@ -285,8 +313,7 @@ if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
         _lines = list(file.readlines())
 
-        start = time.time()
-        solution_part1 = solve_part1(_lines, 6)
-        end = time.time()
-        print(f"solution (part1): {solution_part1} in {(end - start) * 1000}ms")
+        with phase("part1") as timing:
+            solution_part1 = solve_part1(_lines, 6)
+        print(f"solution (part1): {solution_part1} in {timing.wall_ms}ms")
         assert solution_part1 == 230
@@ -254,161 +254,20 @@ Starting with your given initial configuration, simulate six cycles in a 4-dimen
 
 """
 import os
-import time
-from copy import deepcopy
-from typing import List, Tuple
-
-PocketDimension = List[List[List[List[bool]]]]
-Coordinate = Tuple[int, int, int, int]
-
-
-def count_active(pocket: PocketDimension) -> int:
-    return sum((
-        sum((
-            sum((
-                sum(line)
-                for line in z_layer
-            ))
-            for z_layer in w_layer
-        ))
-        for w_layer in pocket
-    ))
-
-
-def _count_active_neighbors(coord: Coordinate, pocket: PocketDimension) -> int:
-    x, y, z, w = coord
-    counter = 0
-    for w_idx in range(w - 1, w + 2):
-        for z_idx in range(z - 1, z + 2):
-            for y_idx in range(y - 1, y + 2):
-                for x_idx in range(x - 1, x + 2):
-                    if w_idx != w or z_idx != z or y_idx != y or x_idx != x:
-                        if pocket[w_idx][z_idx][y_idx][x_idx]:
-                            counter += 1
-
-    return counter
-
-
-def execute_cycle(cycle_idx: int, cycles: int, pocket: PocketDimension) -> PocketDimension:
-    margin = cycles - cycle_idx
-    result = _init_empty_pocket(pocket)
-    for w in range(margin, len(pocket) - margin):
-        for z in range(margin, len(pocket[w]) - margin):
-            for y in range(margin, len(pocket[w][z]) - margin):
-                for x in range(margin, len(pocket[w][z][y]) - margin):
-                    actives = _count_active_neighbors((x, y, z, w), pocket)
-                    if pocket[w][z][y][x]:
-                        result[w][z][y][x] = actives in (2, 3)
-                    else:
-                        result[w][z][y][x] = actives == 3
-
-    return result
-
-
-def _init_empty_pocket(pocket: PocketDimension) -> PocketDimension:
-    return [
-        [
-            [
-                [False] * len(pocket[w][z][y])
-                for y in range(len(pocket[w][z]))
-            ]
-            for z in range(len(pocket[w]))
-        ]
-        for w in range(len(pocket))
-    ]
-
-
-def _init_empty_three_dimensions_pocket(x_size: int,
-                                        y_size: int,
-                                        z_size: int) -> List[List[List[int]]]:
-    return [
-        [
-            [False] * x_size
-            for _ in range(y_size)
-        ]
-        for _ in range(z_size)
-    ]
-
-
-# noinspection DuplicatedCode
-def solve_part2(lines: List[str], cycles: int) -> int:
-    pocket = _parse(lines, cycles)
-    for cycle_idx in range(cycles):
-        pocket = execute_cycle(cycle_idx, cycles, pocket)
-
-    return count_active(pocket)
-
-
-def _parse(lines: List[str], cycles: int) -> PocketDimension:
-    growth = 2 * (cycles + 1)
-    x_size = len(lines[0].rstrip()) + growth
-    y_size = len(lines) + growth
-
-    # parse the flat region
-    initial_flat_region = list(
-        map(
-            lambda l: list(map("#".__eq__, l.rstrip())),
-            lines
-        )
-    )
-
-    # put the flat region into the big cube that we will need for X cycles
-    half_growth = growth // 2
-    empty_layer = [[False] * x_size for _ in range(y_size)]
-    pocket = []
-
-    # add some empty w-layers
-    for _ in range(half_growth):
-        pocket.append(_init_empty_three_dimensions_pocket(
-            x_size=x_size,
-            y_size=y_size,
-            z_size=1 + growth
-        ))
-
-    main_w_layer = []
-    # add some empty z-layers
-    for _ in range(half_growth):
-        main_w_layer.append(deepcopy(empty_layer))
+from typing import List
+from aoc.day17.conway_cubes import run_cycles
+from aoc.util.profiling import phase
 
-    # add our initial flat region surrounded by inactive cubes
-    extended_initial_region = []
-    for _ in range(half_growth):
-        extended_initial_region.append([False] * x_size)
 
-    for line in initial_flat_region:
-        for _ in range(half_growth):
-            line.insert(0, False)
-            line.append(False)
-        extended_initial_region.append(line)
-
-    for _ in range(half_growth):
-        extended_initial_region.append([False] * x_size)
-
-    main_w_layer.append(extended_initial_region)
-
-    # add some empty z-layers
-    for _ in range(half_growth):
-        main_w_layer.append(deepcopy(empty_layer))
-
-    pocket.append(main_w_layer)
-
-    # add some empty w-layers
-    for _ in range(half_growth):
-        pocket.append(_init_empty_three_dimensions_pocket(
-            x_size=x_size,
-            y_size=y_size,
-            z_size=1 + growth
-        ))
-
-    return pocket
+def solve_part2(lines: List[str], cycles: int) -> int:
+    return run_cycles(lines, cycles, dimensions=4)
 
 
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
         _lines = list(file.readlines())
 
-        start = time.time()
-        solution_part2 = solve_part2(_lines, 6)
-        end = time.time()
-        print(f"solution (part2): {solution_part2} in {(end - start) * 1000}ms")
+        with phase("part2") as timing:
+            solution_part2 = solve_part2(_lines, 6)
+        print(f"solution (part2): {solution_part2} in {timing.wall_ms}ms")
         assert solution_part2 == 1600
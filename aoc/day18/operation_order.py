@@ -60,9 +60,9 @@ What do you get if you add up the results of evaluating the homework problems us
 
 """
 import os
-import time
 from enum import Enum
 from typing import List, NamedTuple, Union, Set, Tuple, Optional
+from aoc.util.profiling import phase
 
 
 class MyEnum(Enum):
@@ -242,14 +242,12 @@ if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
         _equations = list(file.readlines())
 
-        start = time.time()
-        solution_part1 = solve_part1(_equations)
-        end = time.time()
-        print(f"solution (part1): {solution_part1} in {(end - start) * 1000}ms")
+        with phase("part1") as timing:
+            solution_part1 = solve_part1(_equations)
+        print(f"solution (part1): {solution_part1} in {timing.wall_ms}ms")
         assert solution_part1 == 23507031841020
 
-        start = time.time()
-        solution_part2 = solve_part2(_equations)
-        end = time.time()
-        print(f"solution (part2): {solution_part2} in {(end - start) * 1000}ms")
+        with phase("part2") as timing:
+            solution_part2 = solve_part2(_equations)
+        print(f"solution (part2): {solution_part2} in {timing.wall_ms}ms")
         assert solution_part2 == 218621700997826
@@ -138,8 +138,9 @@ After updating rules 8 and 11, how many messages completely match rule 0?
 import os
 import re
 import sys
-import time
 from typing import List, Union, Tuple, Dict, Iterable, Set
+from aoc.util.budget import checkpoint
+from aoc.util.profiling import phase
 
 SubRule = List[List[int]]
 Matcher = str
@@ -308,6 +309,7 @@ def solve_part1(messages: List[str], rules: Rules, rule_idx: int) -> int:
     )
 
 
+@phase("build")
 def _build_automaton(rules: Rules,
                      rule_idx: int,
                      circuit_breaker: int = sys.maxsize) -> Automaton:
@@ -325,6 +327,7 @@ def _build_nodes(rule_idx: int,
                  rules: Rules,
                  circuit_breaker: int = sys.maxsize,
                  depth: int = 0) -> List[Node]:
+    checkpoint("build_nodes", rule=rule_idx, depth=depth)
     if depth > circuit_breaker:
         # break the circuit, so return a not used character, like that this path
         # will never match anything...
@@ -389,18 +392,22 @@ def solve_part2(messages: List[str], rules: Rules, rule_idx: int) -> bool:
     )
 
 
+def count_valid_messages(notes: Tuple[Rules, List[str]], with_loops: bool = False) -> int:
+    rules, messages = notes
+    solve = solve_part2 if with_loops else solve_part1
+    return solve(messages, rules, rule_idx=0)
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
         _rules, _messages = _parse(list(file.readlines()))
 
-        start = time.time()
-        solution_part1 = solve_part1(_messages, _rules, rule_idx=0)
-        end = time.time()
-        print(f"solution (part1): {solution_part1} in {(end - start) * 1000}ms")
+        with phase("part1") as timing:
+            solution_part1 = solve_part1(_messages, _rules, rule_idx=0)
+        print(f"solution (part1): {solution_part1} in {timing.wall_ms}ms")
         assert solution_part1 == 102
 
-        start = time.time()
-        solution_part2 = solve_part2(_messages, _rules, rule_idx=0)
-        end = time.time()
-        print(f"solution (part2): {solution_part2} in {(end - start) * 1000}ms")
+        with phase("part2") as timing:
+            solution_part2 = solve_part2(_messages, _rules, rule_idx=0)
+        print(f"solution (part2): {solution_part2} in {timing.wall_ms}ms")
         assert solution_part2 == 318
@@ -0,0 +1,154 @@
+"""
+Columnar password database: the entries are split in bulk into arrays of lowest and highest bounds, of
+policy chars, and of offsets of the passwords, all of them stored in a single buffer.
+
+No regex is run and no object is kept per entry, and both policies are validated by C loops (`map` over
+the columns), so a database of tens of millions of entries is validated in a few seconds:
+- policy 1 is counting the char in the buffer, between the offsets of the password (`bytes.count`),
+- policy 2 is reading the two bytes at the given positions of the password, directly in the buffer (entry
+  by entry when a position is out of its password, such a position never having the policy char).
+
+The database is split by blocks of lines, so the tokens of a single block only are alive at once. A block is
+split on all its separators at once only when every line is giving the four tokens of an entry: the blocks of
+passwords with separators (or empty, or of blank lines) are split line by line, at the first separators only.
+"""
+from array import array
+from itertools import accumulate, repeat
+from operator import add, and_, eq, gt, le, ne, sub
+from typing import NamedTuple, Iterable, List, Tuple
+
+# size of the blocks of the database split at once, in bytes
+BLOCK_SIZE = 1 << 20
+
+# the separators of "1-3 a: abcde", turned into spaces so the entries are split in a single pass
+_SEPARATORS = bytes.maketrans(b"-:", b"  ")
+# the whitespaces split by bytes.split, but the space and the newline
+_OTHER_WHITESPACES = (b"\t", b"\r", b"\x0b", b"\x0c")
+
+
+class PasswordColumns(NamedTuple):
+    lowest: array
+    highest: array
+    # the policy char of every entry, as a byte
+    chars: bytes
+    # the passwords, one after the other
+    passwords: bytes
+    # offset of every password in `passwords`, and of its end
+    starts: array
+    ends: array
+
+    def __len__(self) -> int:
+        return len(self.lowest)
+
+
+def parse_columns(data: bytes, block_size: int = BLOCK_SIZE) -> PasswordColumns:
+    lowest, highest = array("I"), array("I")
+    chars, passwords = [], []
+    starts = array("Q")
+    ends = array("Q")
+    offset = 0
+
+    start = 0
+    while start < len(data):
+        end = data.find(b"\n", min(start + block_size, len(data) - 1)) + 1 or len(data)
+        block = data[start:end]
+        tokens = block.translate(_SEPARATORS).split()
+        if _are_entry_tokens(block, tokens):
+            block_lowest, block_highest = tokens[0::4], tokens[1::4]
+            block_chars = b"".join(tokens[2::4])
+            block_passwords = tokens[3::4]
+        else:
+            block_lowest, block_highest, block_chars, block_passwords = _split_entries(block, start)
+        if len(block_chars) != len(block_passwords):
+            raise ValueError(f"A policy of the password entries of the bytes {start} to {end} is not a single char")
+
+        lengths = array("Q", map(len, block_passwords))
+        block_ends = array("Q", accumulate(lengths, initial=offset))
+        starts.extend(block_ends[:-1])
+        ends.extend(block_ends[1:])
+        offset = block_ends[-1]
+
+        lowest.extend(map(int, block_lowest))
+        highest.extend(map(int, block_highest))
+        chars.append(block_chars)
+        passwords.append(b"".join(block_passwords))
+        start = end
+
+    return PasswordColumns(lowest, highest, b"".join(chars), b"".join(passwords), starts, ends)
+
+
+def _are_entry_tokens(block: bytes, tokens: List[bytes]) -> bool:
+    # every entry is having at least a "-", a ":" and two spaces, so as many of them as lines, and four tokens
+    # per line, are telling that no line is having any other separator, nor an empty password
+    lines = block.count(b"\n") + (not block.endswith(b"\n"))
+    return (
+        len(tokens) == 4 * lines
+        and block.count(b"-") == lines
+        and block.count(b":") == lines
+        and block.count(b" ") == 2 * lines
+        and not any(map(block.count, _OTHER_WHITESPACES))
+    )
+
+
+def _split_entries(block: bytes, offset: int) -> Tuple[List[bytes], List[bytes], bytes, List[bytes]]:
+    # the entries split at the first "-", the first space and the first ": " of their lines, as the regex of
+    # the entries is doing, their passwords being anything up to the end of the line
+    lowest, highest, chars, passwords = [], [], [], []
+    for line in block.split(b"\n"):
+        if not line.strip():
+            continue
+        bounds, _, policy = line.removesuffix(b"\r").partition(b" ")
+        low, _, high = bounds.partition(b"-")
+        char, separator, password = policy.partition(b": ")
+        if not (low.isdigit() and high.isdigit() and separator and len(char) == 1 and (char.isalnum() or char == b"_")):
+            raise ValueError(f"Unable to split the password entry {line!r} of the bytes from {offset}")
+        lowest.append(low)
+        highest.append(high)
+        chars.append(char)
+        passwords.append(password)
+
+    return lowest, highest, b"".join(chars), passwords
+
+
+def _positions_in_passwords(columns: PasswordColumns) -> bool:
+    if 0 in columns.lowest or 0 in columns.highest:
+        return False
+    lengths = list(map(sub, columns.ends, columns.starts))
+    return not any(map(gt, columns.lowest, lengths)) and not any(map(gt, columns.highest, lengths))
+
+
+def _parse_columns(lines: Iterable[str]) -> PasswordColumns:
+    return parse_columns("".join(lines).encode())
+
+
+def count_valid_passwords(columns: PasswordColumns) -> int:
+    # bytes.count is accepting the code of a byte, which is what iterating the chars is giving
+    counts = list(map(columns.passwords.count, columns.chars, columns.starts, columns.ends))
+    return sum(map(and_, map(le, columns.lowest, counts), map(le, counts, columns.highest)))
+
+
+def count_valid_passwords_part2(columns: PasswordColumns) -> int:
+    if not _positions_in_passwords(columns):
+        return _count_valid_passwords_part2_out_of_range(columns)
+
+    first_positions = map(add, columns.starts, map(sub, columns.lowest, repeat(1)))
+    second_positions = map(add, columns.starts, map(sub, columns.highest, repeat(1)))
+    at_first = map(eq, map(columns.passwords.__getitem__, first_positions), columns.chars)
+    at_second = map(eq, map(columns.passwords.__getitem__, second_positions), columns.chars)
+    # exactly one of the two positions has to be the policy char
+    return sum(map(ne, at_first, at_second))
+
+
+def _count_valid_passwords_part2_out_of_range(columns: PasswordColumns) -> int:
+    # the positions are read directly in the buffer, so the ones out of their password (which would read
+    # another one) are checked one by one, and never having the policy char
+    passwords = columns.passwords
+    valid = 0
+    for lowest, highest, char, start, end in zip(
+            columns.lowest, columns.highest, columns.chars, columns.starts, columns.ends
+    ):
+        at_first = 1 <= lowest <= end - start and passwords[start + lowest - 1] == char
+        at_second = 1 <= highest <= end - start and passwords[start + highest - 1] == char
+        valid += at_first != at_second
+
+    return valid
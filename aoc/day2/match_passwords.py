@@ -39,7 +39,7 @@ How many passwords are valid according to the new interpretation of the policies
 """
 import os
 import re
-from typing import List, TypedDict
+from typing import List, TypedDict, Iterable
 
 
 class PasswordEntry(TypedDict):
@@ -94,13 +94,17 @@ def _parse_raw_password_item(item: str) -> PasswordEntry:
     raise ValueError(f"Unable to extract a password entry from string '{item}'!")
 
 
+def _parse(lines: Iterable[str]) -> List[PasswordEntry]:
+    return [
+        _parse_raw_password_item(line)
+        for line in lines
+        if line.strip()
+    ]
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as f:
-        input_passwords = [
-            _parse_raw_password_item(line)
-            for line in f.readlines()
-            if line
-        ]
+        input_passwords = _parse(f.readlines())
 
         solution = validate_passwords(input_passwords)
         print(f"solution (part1): {solution}")
@@ -0,0 +1,81 @@
+"""
+Validation of a large password database on all the cores.
+
+The file is cut into ranges of bytes ending on a newline, and every worker is mapping the file in memory to
+validate its ranges with the columnar pipeline, so only the bounds of the ranges and the counts are sent
+between the processes, never the entries.
+
+    PYTHONPATH=. python -m aoc.day2.parallel passwords.txt --workers 8
+"""
+import argparse
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Tuple, Optional, Iterable
+
+from aoc.day2.columnar import parse_columns, count_valid_passwords, count_valid_passwords_part2
+
+# bytes validated by a worker at once
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def newline_ranges(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """
+    Ranges of about `chunk_size` bytes covering the file, every one of them ending after a newline
+    (but the last one, if the file is not ending with a newline).
+    """
+    size = os.path.getsize(path)
+    if not size:
+        return []
+
+    ranges = []
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        start = 0
+        while start < size:
+            end = mapped.find(b"\n", min(start + chunk_size, size) - 1) + 1 or size
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def count_valid_in_range(path: str, start: int, end: int) -> Tuple[int, int]:
+    """
+    Number of passwords valid for each policy, in a range of the file.
+    """
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        columns = parse_columns(mapped[start:end])
+
+    return count_valid_passwords(columns), count_valid_passwords_part2(columns)
+
+
+def count_valid_in_file(path: str,
+                        workers: Optional[int] = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[int, int]:
+    ranges = newline_ranges(path, chunk_size)
+    if not ranges:
+        return 0, 0
+
+    with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count(), len(ranges))) as executor:
+        counts = list(executor.map(count_valid_in_range, repeat(path), *zip(*ranges)))
+
+    return sum(count for count, _ in counts), sum(count for _, count in counts)
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Count the valid passwords of a large database on all the cores")
+    parser.add_argument("path", help="password database, one entry per line")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="bytes validated at once by a worker")
+    args = parser.parse_args(argv)
+
+    valid, valid_part2 = count_valid_in_file(args.path, args.workers, args.chunk_size)
+    print(f"solution (part1): {valid}")
+    print(f"solution (part2): {valid_part2}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
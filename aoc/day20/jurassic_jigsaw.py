@@ -271,17 +271,18 @@ How many # are not part of a sea monster?
 """
 import os
 import re
-import time
 from dataclasses import dataclass
 from enum import Enum
 from functools import cached_property
 from math import prod, isqrt
-from typing import List, Tuple, Iterable, NamedTuple, Set, Dict, TypeVar, Optional, Callable
+from typing import List, Tuple, Iterable, NamedTuple, Set, Dict, TypeVar, Optional
 
+from aoc.util.budget import checkpoint
 from aoc.util.functional import compose
 from aoc.util.list import flat_map
-from aoc.util.matrix import initialize_matrix
-from aoc.util.text import generate_paragraphs
+from aoc.util.matrix import initialize_matrix, Grid
+from aoc.util.profiling import phase
+from aoc.util.text import generate_paragraphs, read_lines
 
 DEBUG = False
 
@@ -440,6 +441,15 @@ class Pattern(NamedTuple):
 
     shape: List[List[Optional[T]]]
 
+    def encode(self) -> 'Pattern':
+        """
+        Pattern of the codes of the characters, to be searched in a grid.
+        """
+        return Pattern(shape=[
+            [ord(c) if c else None for c in row]
+            for row in self.shape
+        ])
+
     def count_occurrences(self, drawing: List[List[T]]) -> int:
         shape_height = len(self.shape)
         shape_width = max(map(len, self.shape))
@@ -595,6 +605,11 @@ def solve_part1(tiles: List[Tile]) -> Tuple[int, List[int]]:
     return prod(corners), corners
 
 
+def multiply_corner_ids(tiles: List[Tile]) -> int:
+    corners_product, _ = solve_part1(tiles)
+    return corners_product
+
+
 def _flip_mut(matrix: List[List[T]]) -> List[List[T]]:
     height = len(matrix)
     width = len(matrix[0])
@@ -665,6 +680,7 @@ def _generate_empty_jigsaw(size: int) -> List[List[Optional[Tile]]]:
     ]
 
 
+@phase("build")
 def _do_jigsaw(tiles_by_id: Dict[int, Tile],
                corners: List[int]) -> Optional[List[List[Tile]]]:
     # generate an empty jigsaw and place the first corner
@@ -694,6 +710,7 @@ def _do_jigsaw_rec(jigsaw_size: int,
                    corners: Set[int],
                    coordinates: Tuple[int, int]) -> Optional[List[List[Tile]]]:
 
+    checkpoint("jigsaw", placed_tiles=len(used_tile_ids), of_tiles=len(tiles_by_id))
     DEBUG and print(f"trying to find a tile for coordinate {coordinates}")
 
     if _is_corner(jigsaw_size, coordinates):
@@ -793,48 +810,30 @@ def solve_part2(tiles: List[Tile],
         "                  #",
         "#    ##    ##    ###",
         " #  #  #  #  #  #"
-    ])
-
-    transformations: List[Callable[[List[List[str]]], List[List[str]]]] = [
-        lambda x: x,
-        _rotate_mut,
-        compose(_rotate_mut, _rotate_mut),
-        compose(_rotate_mut, _rotate_mut, _rotate_mut),
-        _flip_mut,
-        _rotate_mut,
-        compose(_rotate_mut, _rotate_mut),
-        compose(_rotate_mut, _rotate_mut, _rotate_mut),
-    ]
+    ]).encode()
+
+    # search the monsters in the rotated and flipped views of the picture, without copying it
+    picture = Grid.parse("".join(row) for row in drawing)
     number_of_monster = next(filter(
         lambda n: n > 0,
         (
-            pattern.count_occurrences(transformation(drawing))
-            for transformation in transformations
+            pattern.count_occurrences(list(view.rows()))
+            for view in picture.orientations()
         )
     ))
 
-    return _count_character(drawing, "#") - (15 * number_of_monster)
-
-
-def _count_character(drawing: List[List[str]], character: str) -> int:
-    return sum((
-        sum(map(character.__eq__, row))
-        for row in drawing
-    ))
+    return picture.count(ord("#")) - (15 * number_of_monster)
 
 
 if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input")) as file:
-        _tiles = _parse(file.readlines())
+    _tiles = _parse(read_lines(os.path.join(os.path.dirname(__file__), "input")))
 
-        start = time.time()
+    with phase("part1") as timing:
         solution_part1, _corners = solve_part1(_tiles)
-        end = time.time()
-        print(f"solution (part1): {solution_part1} in {(end - start) * 1000}ms")
-        assert solution_part1 == 19955159604613
+    print(f"solution (part1): {solution_part1} in {timing.wall_ms}ms")
+    assert solution_part1 == 19955159604613
 
-        start = time.time()
+    with phase("part2") as timing:
         solution_part2 = solve_part2(_tiles, _corners)
-        end = time.time()
-        print(f"solution (part2): {solution_part2} in {(end - start) * 1000}ms")
-        assert solution_part2 == 1639
+    print(f"solution (part2): {solution_part2} in {timing.wall_ms}ms")
+    assert solution_part2 == 1639
@@ -49,9 +49,9 @@ Time to stock your raft with supplies. What is your canonical dangerous ingredie
 import operator
 import os
 import re
-import time
 from collections import defaultdict
 from typing import NamedTuple, Set, Iterable, Dict, Tuple, List
+from aoc.util.profiling import phase
 
 DEBUG = False
 
@@ -64,8 +64,8 @@ class Food(NamedTuple):
     allergens: Set[str]
 
 
-def _parse(lines: Iterable[str]) -> Iterable[Food]:
-    return map(_parse_food, lines)
+def _parse(lines: Iterable[str]) -> List[Food]:
+    return list(map(_parse_food, lines))
 
 
 def _parse_food(line: str) -> Food:
@@ -132,18 +132,34 @@ def solve_part2(known_allergens: List[Tuple[str, str]]) -> str:
     ))
 
 
+def count_safe_ingredients(foods: List[Food]) -> int:
+    safe_ingredients, _ = solve_part1(_copy_foods(foods))
+    return safe_ingredients
+
+
+def list_dangerous_ingredients(foods: List[Food]) -> str:
+    _, known_allergens = solve_part1(_copy_foods(foods))
+    return solve_part2(known_allergens)
+
+
+def _copy_foods(foods: Iterable[Food]) -> List[Food]:
+    # solving is consuming the ingredient sets
+    return [
+        Food(set(food.ingredients), set(food.allergens))
+        for food in foods
+    ]
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
-        _foods = list(_parse(file.readlines()))
+        _foods = _parse(file.readlines())
 
-        start = time.time()
-        solution_part1, _known_allergens = solve_part1(_foods)
-        end = time.time()
-        print(f"solution (part1): {solution_part1} in {(end - start) * 1000}ms")
+        with phase("part1") as timing:
+            solution_part1, _known_allergens = solve_part1(_foods)
+        print(f"solution (part1): {solution_part1} in {timing.wall_ms}ms")
         assert solution_part1 == 2230
 
-        start = time.time()
-        solution_part2 = solve_part2(_known_allergens)
-        end = time.time()
-        print(f"solution (part2): {solution_part2} in {(end - start) * 1000}ms")
+        with phase("part2") as timing:
+            solution_part2 = solve_part2(_known_allergens)
+        print(f"solution (part2): {solution_part2} in {timing.wall_ms}ms")
         assert solution_part2 == "qqskn,ccvnlbp,tcm,jnqcd,qjqb,xjqd,xhzr,cjxv"
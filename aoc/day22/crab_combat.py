@@ -403,13 +403,14 @@ before. What is the winning player's score?
 
 """
 import os
-import time
 from collections import deque
 from functools import reduce
 from itertools import islice
 from typing import Tuple, Iterable, Deque
 
-from aoc.util.text import generate_paragraphs
+from aoc.util.budget import current_budget
+from aoc.util.profiling import phase
+from aoc.util.text import generate_paragraphs, read_lines
 
 
 DEBUG = False
@@ -469,7 +470,11 @@ def play_recurse_game(deck1: Deck, deck2: Deck) -> int:
 def _play_recurse_game_rec(deck1: Deck, deck2: Deck, depth: int) -> Tuple[int, Deck, Deck]:
     round_idx = 1
     known_states = set()
+    # this loop is too tight to go through a checkpoint on every round
+    budget = current_budget()
     while deck1 and deck2:
+        if budget is not None:
+            budget.check("recursive combat", 1, {"depth": depth, "round": round_idx})
         DEBUG and print(f"""-- Round {round_idx} (Game {depth}) --
 Player 1's deck: {deck1}
 Player 2's deck: {deck2}
@@ -504,22 +509,29 @@ Player 2's deck: {deck2}
     return 0 if deck1 else 1, deck1, deck2
 
 
+def solve_part1(decks: Tuple[Deck, Deck]) -> int:
+    deck1, deck2 = decks
+    return play_game(deck1.copy(), deck2.copy())
+
+
+def solve_part2(decks: Tuple[Deck, Deck]) -> int:
+    deck1, deck2 = decks
+    return play_recurse_game(deck1.copy(), deck2.copy())
+
+
 def _generate_game_state(deck1: Deck, deck2: Deck) -> Tuple[Tuple[int], Tuple[int]]:
     return tuple(deck1), tuple(deck2)
 
 
 if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input")) as file:
-        _deck1, _deck2 = _parse(file.readlines())
-
-        start = time.time()
-        solution_part1 = play_game(_deck1.copy(), _deck2.copy())
-        end = time.time()
-        print(f"solution (part1): {solution_part1} in {(end - start) * 1000}ms")
-        assert solution_part1 == 32413
-
-        start = time.time()
-        solution_part2 = play_recurse_game(_deck1.copy(), _deck2.copy())
-        end = time.time()
-        print(f"solution (part2): {solution_part2} in {(end - start) * 1000}ms")
-        assert solution_part2 == 31596
+    _deck1, _deck2 = _parse(read_lines(os.path.join(os.path.dirname(__file__), "input")))
+
+    with phase("part1") as timing:
+        solution_part1 = solve_part1((_deck1, _deck2))
+    print(f"solution (part1): {solution_part1} in {timing.wall_ms}ms")
+    assert solution_part1 == 32413
+
+    with phase("part2") as timing:
+        solution_part2 = solve_part2((_deck1, _deck2))
+    print(f"solution (part2): {solution_part2} in {timing.wall_ms}ms")
+    assert solution_part2 == 31596
@@ -102,15 +102,16 @@ together?
 
 
 """
-import time
 from collections.abc import Iterator, Iterable
 from typing import List, Optional
+from aoc.util.profiling import phase
 
 DEBUG = False
 
 
 class Cups(Iterable[int]):
     @staticmethod
+    @phase("build")
     def parse(raw_cups: str, cups_wanted: Optional[int] = None) -> 'Cups':
         # create a linked list to store the cups
         # the linked list will be stored in an array of successors
@@ -236,29 +237,41 @@ def generate_prod_part2(cups: Cups) -> int:
     return next_1 * next_2
 
 
+def solve_part1(raw_cups: str, cups_wanted: Optional[int] = None, iterations: int = 100) -> str:
+    return generate_labels(play_game(Cups.parse(raw_cups, cups_wanted), iterations))
+
+
+def solve_part2(raw_cups: str, cups_wanted: int = 1000000, iterations: int = 10000000) -> int:
+    return generate_prod_part2(play_game(
+        cups=Cups.parse(raw_cups, cups_wanted=cups_wanted),
+        iterations=iterations
+    ))
+
+
+def _parse(lines: Iterable[str]) -> str:
+    return next(iter(lines)).strip()
+
+
 if __name__ == "__main__":
     _input = "538914762"
 
-    start = time.time()
-    _cups = play_game(Cups.parse(_input))
-    solution_part1 = generate_labels(_cups)
-    end = time.time()
-    print(f"solution (part1): {solution_part1} in {(end - start) * 1000}ms")
+    with phase("part1") as timing:
+        _cups = play_game(Cups.parse(_input))
+        solution_part1 = generate_labels(_cups)
+    print(f"solution (part1): {solution_part1} in {timing.wall_ms}ms")
     assert solution_part1 == "54327968"
 
-    start = time.time()
-    _cups = play_game(Cups.parse(_input), iterations=1_000_000)
-    solution_part11 = generate_labels(_cups)
-    end = time.time()
-    print(f"solution (part11): {solution_part11} in {(end - start) * 1000}ms")
+    with phase("part11") as timing:
+        _cups = play_game(Cups.parse(_input), iterations=1_000_000)
+        solution_part11 = generate_labels(_cups)
+    print(f"solution (part11): {solution_part11} in {timing.wall_ms}ms")
     assert solution_part11 == "53296487"
 
-    start = time.time()
-    _cups = play_game(
-        cups=Cups.parse(_input, cups_wanted=1000000),
-        iterations=10000000
-    )
-    solution_part2 = generate_prod_part2(_cups)
-    end = time.time()
-    print(f"solution (part2): {solution_part2} in {(end - start) * 1000}ms")
+    with phase("part2") as timing:
+        _cups = play_game(
+            cups=Cups.parse(_input, cups_wanted=1000000),
+            iterations=10000000
+        )
+        solution_part2 = generate_prod_part2(_cups)
+    print(f"solution (part2): {solution_part2} in {timing.wall_ms}ms")
     assert solution_part2 == 157410423276
@@ -85,12 +85,14 @@ How many tiles will be black after 100 days?
 
 """
 import os
-import time
 from collections import defaultdict
 from collections.abc import Iterator, Iterable
 from enum import Enum
 from functools import reduce
-from typing import DefaultDict, Dict
+from typing import DefaultDict, Dict, List
+from aoc.util.automaton import Automaton, Rule, hexagonal
+from aoc.util.profiling import phase
+from aoc.util.text import read_lines
 
 DEBUG = False
 
@@ -136,6 +138,13 @@ def _parse(lines: Iterable[str]) -> Iterable[Iterable[Direction]]:
     return map(_parse_directions, lines)
 
 
+def _parse_all(lines: Iterable[str]) -> List[List[Direction]]:
+    return [
+        list(directions)
+        for directions in _parse(lines)
+    ]
+
+
 def _parse_directions(line: str) -> Iterator[Direction]:
     safe_line = line.strip()
     index = 0
@@ -170,81 +179,44 @@ def _count_black(tiles: Dict[Coordinate, bool]) -> int:
     return sum(filter(True.__eq__, tiles.values()))
 
 
-def _get_neighbors(coord: Coordinate, include_self: bool = False) -> Iterator[Coordinate]:
-    if include_self:
-        yield coord
-    for increment in DIRECTION_INCREMENTS.values():
-        yield coord + increment
-
-
-def _count_neighbors_black(coord: Coordinate,
-                           tiles: Dict[Coordinate, bool]) -> int:
-    return sum((
-        1
-        for neighbor in _get_neighbors(coord)
-        if tiles.get(neighbor)
-    ))
-
-
-def _get_black_tiles(tiles: Dict[Coordinate, bool]) -> Iterable[Coordinate]:
-    return (
-        coord
-        for coord, black in tiles.items()
-        if black
-    )
-
-
-def _should_be_black(tile: Coordinate,
-                     tiles: Dict[Coordinate, bool]) -> bool:
+def do_x_daily_flips(tiles: Dict[Coordinate, bool], number_of_days: int) -> Dict[Coordinate, bool]:
     # Any black tile with zero or more than 2 black tiles immediately
     # adjacent to it is flipped to white.
     # Any white tile with exactly 2 black tiles immediately adjacent
     # to it is flipped to black.
-    black_neighbors = _count_neighbors_black(tile, tiles)
-    if tiles.get(tile):
-        # the tile is already black, so it will stay black if 1 or 2 neighbors are black
-        return 0 < black_neighbors < 3
-
-    # the tile is white, we want exactly 2 black neighbors
-    return black_neighbors == 2
-
-
-def _do_daily_flips(tiles: Dict[Coordinate, bool]) -> Dict[Coordinate, bool]:
-    # we get all the black tiles and we analyze the neighbors
-    tiles_to_analyze = {
-        tile
-        for black_tile in _get_black_tiles(tiles)
-        for tile in _get_neighbors(black_tile, include_self=True)
-    }
+    automaton = Automaton(
+        hexagonal(),
+        Rule.of(birth={2}, survival={1, 2}),
+        ((int(coord.real), int(coord.imag)) for coord, black in tiles.items() if black)
+    )
+    automaton.run(number_of_days)
 
     return {
-        tile: True
-        for tile in tiles_to_analyze
-        if _should_be_black(tile, tiles)
+        complex(*tile): True
+        for tile in automaton.cells()
     }
 
 
-def do_x_daily_flips(tiles: Dict[Coordinate, bool], number_of_days: int) -> Dict[Coordinate, bool]:
-    return reduce(
-        lambda acc, _: _do_daily_flips(acc),
-        range(number_of_days),
-        tiles
-    )
+def count_black_tiles(tiles_to_flip: Iterable[Iterable[Direction]]) -> int:
+    black_tiles, _ = solve_part1(tiles_to_flip)
+    return black_tiles
+
+
+def count_black_tiles_after(tiles_to_flip: Iterable[Iterable[Direction]], number_of_days: int = 100) -> int:
+    _, tiles = solve_part1(tiles_to_flip)
+    return _count_black(do_x_daily_flips(tiles, number_of_days))
 
 
 if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input")) as file:
-        _list_of_directions = _parse(file.readlines())
+    _list_of_directions = _parse(read_lines(os.path.join(os.path.dirname(__file__), "input")))
 
-        start = time.time()
+    with phase("part1") as timing:
         solution_part1, _tiles = solve_part1(_list_of_directions)
-        end = time.time()
-        print(f"solution (part1): {solution_part1} in {(end - start) * 1000}ms")
-        assert solution_part1 == 277
+    print(f"solution (part1): {solution_part1} in {timing.wall_ms}ms")
+    assert solution_part1 == 277
 
-        start = time.time()
+    with phase("part2") as timing:
         _tiles_after_day100 = do_x_daily_flips(_tiles, number_of_days=100)
         solution_part2 = _count_black(_tiles_after_day100)
-        end = time.time()
-        print(f"solution (part2): {solution_part2} in {(end - start) * 1000}ms")
-        assert solution_part2 == 3531
+    print(f"solution (part2): {solution_part2} in {timing.wall_ms}ms")
+    assert solution_part2 == 3531
@@ -56,8 +56,12 @@ What encryption key is the handshake trying to establish?
 
 """
 import os
-import time
 from typing import List, Tuple
+from aoc.util.budget import checkpoint
+from aoc.util.profiling import phase
+
+# the loop is too tight to go through a checkpoint on every iteration
+CHECKPOINT_INTERVAL = 1 << 16
 
 
 def _parse(lines: List[str]) -> Tuple[int, int]:
@@ -80,11 +84,14 @@ def _find_loop_size(subject: int,
                     initial: int = 1,
                     max_iterations: int = 1000) -> int:
     value = initial
-    for idx in range(max_iterations):
-        value *= subject
-        value %= 20201227
-        if value == expected_key:
-            return idx + 1
+    for start in range(0, max_iterations, CHECKPOINT_INTERVAL):
+        end = min(start + CHECKPOINT_INTERVAL, max_iterations)
+        for idx in range(start, end):
+            value *= subject
+            value %= 20201227
+            if value == expected_key:
+                return idx + 1
+        checkpoint("find_loop_size", steps=end - start, loop_size=end)
 
     raise ValueError(f"Unable to find the loop size after {max_iterations} iterations :(")
 
@@ -102,12 +109,16 @@ def solve_part1(card_pub_key: int, door_pub_key: int) -> int:
     )
 
 
+def find_encryption_key(public_keys: Tuple[int, int]) -> int:
+    card_pub_key, door_pub_key = public_keys
+    return solve_part1(card_pub_key, door_pub_key)
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
         _card_pub_key, _door_pub_key = _parse(list(file.readlines()))
 
-        start = time.time()
-        solution_part1 = solve_part1(_card_pub_key, _door_pub_key)
-        end = time.time()
-        print(f"solution (part1): {solution_part1} in {(end - start) * 1000}ms")
+        with phase("part1") as timing:
+            solution_part1 = solve_part1(_card_pub_key, _door_pub_key)
+        print(f"solution (part1): {solution_part1} in {timing.wall_ms}ms")
         assert solution_part1 == 15467093
@@ -0,0 +1,103 @@
+"""
+Tree map packed in ints, one per row, read as binary numbers ("#" being 1 and "." 0): the tree of the
+column c of a row is its bit `width - 1 - c`, so a whole map is turned into ints by a single translation.
+
+All the slopes are followed in a single pass over the rows: every slope is keeping its own column, and only
+moves on the rows it is landing on (every `down` rows), so a tall map is read once for any number of slopes.
+With the NumPy backend, the rows are unpacked in a matrix of bits once, and the trees of every slope are
+picked from it at once.
+"""
+from collections import defaultdict
+from math import prod
+from typing import List, Tuple, Iterable, NamedTuple, Dict
+
+from aoc.util.vectorized import numpy, use_numpy
+
+Trajectory = Tuple[int, int]
+
+# "#" and "." turned into binary digits
+_DIGITS = str.maketrans("#.", "10")
+
+
+class TreeMap(NamedTuple):
+    width: int
+    rows: List[int]
+
+    def has_tree(self, row_idx: int, col_idx: int) -> bool:
+        return bool(self.rows[row_idx] >> (self.width - 1 - col_idx % self.width) & 1)
+
+
+def parse_tree_map(lines: Iterable[str]) -> TreeMap:
+    digits = "\n".join(map(str.strip, lines)).translate(_DIGITS).split()
+    if not digits:
+        return TreeMap(0, [])
+
+    width = len(digits[0])
+    if any(len(line) != width for line in digits):
+        raise ValueError(f"the rows of the map should all be {width} wide")
+
+    return TreeMap(width, [int(line, 2) for line in digits])
+
+
+def check_trajectories(trajectories: Iterable[Trajectory]) -> List[Trajectory]:
+    """
+    The trajectories as a list, every one of them going down at least one row.
+    """
+    trajectories = list(trajectories)
+    for _, down in trajectories:
+        if down < 1:
+            raise ValueError(f"a trajectory should go down at least one row, not {down}")
+
+    return trajectories
+
+
+def count_trees_by_trajectory(tree_map: TreeMap, trajectories: Iterable[Trajectory]) -> List[int]:
+    """
+    Number of trees on every trajectory, given in the order of the trajectories.
+    """
+    trajectories = check_trajectories(trajectories)
+    if tree_map.rows and use_numpy():
+        return _count_trees_by_trajectory_with_numpy(tree_map, trajectories)
+
+    # the trajectories landing on the same rows, by number of rows they go down at once
+    by_down: Dict[int, List[int]] = defaultdict(list)
+    for position, (_, down) in enumerate(trajectories):
+        by_down[down].append(position)
+    rights = [right for right, _ in trajectories]
+    width = tree_map.width
+    # the bit of the column of every trajectory, from the highest bit for the first column
+    shifts = [width - 1] * len(trajectories)
+    trees = [0] * len(trajectories)
+
+    for row_idx, row in enumerate(tree_map.rows):
+        for down, positions in by_down.items():
+            if row_idx % down:
+                continue
+            for position in positions:
+                trees[position] += row >> shifts[position] & 1
+                shifts[position] = (shifts[position] - rights[position]) % width
+
+    return trees
+
+
+def _count_trees_by_trajectory_with_numpy(tree_map: TreeMap, trajectories: List[Trajectory]) -> List[int]:
+    width = tree_map.width
+    row_bytes = (width + 7) // 8
+    packed = numpy.frombuffer(b"".join(row.to_bytes(row_bytes, "big") for row in tree_map.rows), dtype=numpy.uint8)
+    # the padding bits of the first byte of the rows are dropped, so the column c is the bit c
+    trees = numpy.unpackbits(packed.reshape(len(tree_map.rows), row_bytes), axis=1)[:, row_bytes * 8 - width:]
+    counts = []
+    for right, down in trajectories:
+        rows = numpy.arange(0, len(tree_map.rows), down)
+        cols = numpy.arange(len(rows)) * right % width
+        counts.append(int(trees[rows, cols].sum()))
+
+    return counts
+
+
+def count_trees(tree_map: TreeMap, right: int, down: int) -> int:
+    return count_trees_by_trajectory(tree_map, [(right, down)])[0]
+
+
+def analyze_trajectories(tree_map: TreeMap, trajectories: Iterable[Trajectory]) -> int:
+    return prod(count_trees_by_trajectory(tree_map, trajectories))
@@ -0,0 +1,100 @@
+"""
+Index of the trees of a map, built once to count the trees of many slopes.
+
+The column of the k-th step of a slope (right, down) is `k * right % width`, which is repeating every
+P = width / gcd(right, width) steps, so all the steps k = j (mod P) are in the same column, on the rows
+equal to j * down modulo P * down. With the number of trees of every column on the rows of every residue
+modulo M = P * down (a table of M * width counts, built once per modulus by counting the trees of strided
+slices of the columns of the map), a slope is counted in O(width) lookups instead of O(height / down) steps, and all the slopes of the same
+modulus are sharing their table.
+
+The slopes with a modulus too large for its table are followed over the rows, all of them in a single pass.
+"""
+from array import array
+from collections import defaultdict
+from math import gcd
+from typing import List, Iterable, Dict
+
+from aoc.day3.bitmap import TreeMap, Trajectory, count_trees_by_trajectory, check_trajectories
+
+# above this number of counts, a table is not built and the slopes of its modulus are followed over the rows
+MAX_PERIOD_CELLS = 1 << 20
+
+
+class TreeIndex:
+    def __init__(self, tree_map: TreeMap, max_cells: int = MAX_PERIOD_CELLS):
+        self.tree_map = tree_map
+        self.max_cells = max_cells
+        # every column of the map, from the first row, a tree being a b"1"
+        digits = "".join(f"{row:0{tree_map.width}b}" for row in tree_map.rows).encode()
+        self.columns: List[bytes] = [digits[col::tree_map.width] for col in range(tree_map.width)]
+        self._period_counts: Dict[int, array] = {}
+
+    def modulus(self, right: int, down: int) -> int:
+        """
+        Number of rows after which a slope is back in the same column, on the rows it is landing on.
+        """
+        width = self.tree_map.width
+        return width // gcd(right % width, width) * down
+
+    def _is_indexed(self, modulus: int) -> bool:
+        # a modulus of the height or more is not sharing any step, the slope is as fast to follow
+        return modulus < len(self.tree_map.rows) and modulus * self.tree_map.width <= self.max_cells
+
+    def period_counts(self, modulus: int) -> array:
+        """
+        Number of trees of every column on the rows of every residue, the count of the residue r and the
+        column c being at r * width + c.
+        """
+        counts = self._period_counts.get(modulus)
+        if counts is None:
+            counts = array("L", (
+                column[residue::modulus].count(b"1")
+                for residue in range(modulus)
+                for column in self.columns
+            ))
+            self._period_counts[modulus] = counts
+
+        return counts
+
+    def _count_indexed(self, right: int, down: int, modulus: int) -> int:
+        width = self.tree_map.width
+        counts = self.period_counts(modulus)
+        return sum(
+            counts[step * down * width + step * right % width]
+            for step in range(modulus // down)
+        )
+
+    def count(self, right: int, down: int) -> int:
+        return self.count_all([(right, down)])[0]
+
+    def count_all(self, trajectories: Iterable[Trajectory]) -> List[int]:
+        """
+        Same as `count_trees_by_trajectory`, the slopes of a short period being counted from the tables of the index.
+        """
+        trajectories = check_trajectories(trajectories)
+        if not self.tree_map.rows:
+            return [0] * len(trajectories)
+
+        trees = [0] * len(trajectories)
+        # the slopes of the same modulus are counted together, so its table is built once for all of them
+        by_modulus: Dict[int, List[int]] = defaultdict(list)
+        followed = []
+        for position, (right, down) in enumerate(trajectories):
+            modulus = self.modulus(right, down)
+            if self._is_indexed(modulus):
+                by_modulus[modulus].append(position)
+            else:
+                followed.append(position)
+
+        for modulus, positions in by_modulus.items():
+            for position in positions:
+                right, down = trajectories[position]
+                trees[position] = self._count_indexed(right, down, modulus)
+
+        if followed:
+            counts = count_trees_by_trajectory(self.tree_map, [trajectories[position] for position in followed])
+            for position, count in zip(followed, counts):
+                trees[position] = count
+
+        return trees
@@ -0,0 +1,65 @@
+"""
+Trees of slopes counted over a stream of rows (a pipe, a memory-mapped file...), without loading the map.
+
+Every slope is keeping its column and only looks at the rows it is landing on, so only the current row is
+held at once: the memory is O(width) whatever the height of the map.
+
+    PYTHONPATH=. python -m aoc.day3.stream forest.txt --slope 3 1 --slope 1 2
+    cat forest.txt | PYTHONPATH=. python -m aoc.day3.stream -
+"""
+import argparse
+import sys
+from math import prod
+from typing import Iterable, List, Optional
+
+from aoc.day3.bitmap import Trajectory, check_trajectories
+from aoc.day3.tobogan_trajectory import TRAJECTORIES
+from aoc.util.text import read_lines
+
+
+def stream_trees_by_trajectory(lines: Iterable[str], trajectories: Iterable[Trajectory]) -> List[int]:
+    """
+    Same as `count_trees_by_trajectory`, reading the rows of the map once, as they come.
+    """
+    trajectories = check_trajectories(trajectories)
+
+    columns = [0] * len(trajectories)
+    trees = [0] * len(trajectories)
+    width = None
+    row_idx = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if width is None:
+            width = len(line)
+        elif len(line) != width:
+            raise ValueError(f"row {row_idx} should be {width} wide, not {len(line)}")
+
+        for position, (right, down) in enumerate(trajectories):
+            if row_idx % down == 0:
+                trees[position] += line[columns[position]] == "#"
+                columns[position] = (columns[position] + right) % width
+        row_idx += 1
+
+    return trees
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Count the trees of slopes over a map streamed row by row")
+    parser.add_argument("source", help="map of the trees, one row per line, or - for stdin")
+    parser.add_argument("--slope", type=int, nargs=2, action="append", metavar=("RIGHT", "DOWN"),
+                        help="slope to follow, can be repeated (default: the slopes of part 2)")
+    args = parser.parse_args(argv)
+
+    trajectories = [tuple(slope) for slope in args.slope] if args.slope else TRAJECTORIES
+    lines = sys.stdin if args.source == "-" else read_lines(args.source)
+    trees = stream_trees_by_trajectory(lines, trajectories)
+    for (right, down), count in zip(trajectories, trees):
+        print(f"right {right}, down {down}: {count}")
+    print(f"product: {prod(trees)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -73,12 +73,28 @@ What do you get if you multiply together the number of trees encountered on each
 """
 import os
 from math import prod
-from typing import List, Tuple
+from typing import List, Tuple, Iterable, Sequence
 
+from aoc.util.matrix import Grid
+from aoc.util.vectorized import numpy, use_numpy
 
-def count_trees_in_trajectory(slope: List[List[int]], right: int, down: int) -> int:
+# a slope is either a grid of 0/1 or a list of rows of booleans
+Slope = Sequence[Sequence[int]]
+
+TRAJECTORIES = [
+    (1, 1),
+    (3, 1),
+    (5, 1),
+    (7, 1),
+    (1, 2)
+]
+
+
+def count_trees_in_trajectory(slope: Slope, right: int, down: int) -> int:
     if not slope:
         return 0
+    if isinstance(slope, Grid) and use_numpy():
+        return _count_trees_with_numpy(slope, right, down)
 
     number_of_trees = 0
     right_idx = 0
@@ -92,36 +108,38 @@ def count_trees_in_trajectory(slope: List[List[int]], right: int, down: int) ->
     return number_of_trees
 
 
-def analyze_trajectories(slope: List[List[int]], trajectories: List[Tuple[int, int]]) -> int:
+def _count_trees_with_numpy(slope: Grid, right: int, down: int) -> int:
+    data = slope.data if slope.is_compact else slope.copy().data
+    trees = numpy.frombuffer(data, dtype=numpy.uint8, count=slope.height * slope.width)
+    rows = numpy.arange(0, slope.height, down)
+    cols = (numpy.arange(len(rows)) * right) % slope.width
+    return int(trees.reshape(slope.height, slope.width)[rows, cols].sum())
+
+
+def analyze_trajectories(slope: Slope, trajectories: List[Tuple[int, int]]) -> int:
     return prod(map(
         lambda t: count_trees_in_trajectory(slope, t[0], t[1]),
         trajectories
     ))
 
 
+def _parse(lines: Iterable[str]) -> Grid:
+    return Grid.parse(lines, {"#": 1, ".": 0})
+
+
 def _parse_line(line: str) -> List[int]:
     return list(map("#".__eq__, line))
 
 
 if __name__ == "__main__":
+    from aoc.day3.stream import stream_trees_by_trajectory
+
     with open(os.path.join(os.path.dirname(__file__), "input")) as f:
-        input_slope = [
-            _parse_line(line.rstrip())
-            for line in f.readlines()
-            if line
-        ]
+        # the rows are streamed, the slopes of both parts being followed in the same read
+        trees = stream_trees_by_trajectory(f, [(3, 1)] + TRAJECTORIES)
 
-        solution_part1 = count_trees_in_trajectory(input_slope, right=3, down=1)
+        solution_part1 = trees[0]
         print(f"solution (part1): {solution_part1}")
 
-        solution_part2 = analyze_trajectories(
-            input_slope,
-            [
-                (1, 1),
-                (3, 1),
-                (5, 1),
-                (7, 1),
-                (1, 2)
-            ]
-        )
+        solution_part2 = prod(trees[1:])
         print(f"solution (part2): {solution_part2}")
@@ -0,0 +1,128 @@
+"""
+Audit of a large batch of passports on all the cores.
+
+The records are separated by blank lines, so the file is cut into ranges of bytes ending after a blank line
+(an empty line, or one of whitespace only, as with CRLF line endings), never inside a record, and every worker is mapping the file in memory to scan its ranges: only the bounds
+of the ranges and the counts are sent between the processes, never the passports.
+
+With the failures, the fields missing from the incomplete passports, and the ones of invalid values, are
+counted too, as well as the passports with malformed entries (without a colon).
+
+    PYTHONPATH=. python -m aoc.day4.parallel passports.txt --workers 8 --failures
+"""
+import argparse
+import mmap
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import NamedTuple, Dict, List, Tuple, Optional, Iterable
+
+from aoc.day4.scanner import BINARY_PASSPORT_SCHEMA, Buffer, records, scan_passports
+
+# bytes scanned by a worker at once
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+# the end of a line, then a line of whitespace only (the blank lines between the records of the scanner)
+_BLANK_LINE = re.compile(rb"\n[^\S\n]*\n")
+
+
+class PassportAudit(NamedTuple):
+    # passports with all the required fields
+    complete: int
+    # passports with all the required fields, of correct values
+    valid: int
+    # number of passports failing on every field, as "missing byr" or "invalid hgt", or with "malformed entries"
+    failures: Dict[str, int]
+
+
+def record_ranges(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """
+    Ranges of about `chunk_size` bytes covering the file, every one of them ending after a blank line
+    (but the last one), so none of the records is split.
+    """
+    size = os.path.getsize(path)
+    if not size:
+        return []
+
+    ranges = []
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        start = 0
+        while start < size:
+            blank_line = _BLANK_LINE.search(mapped, min(start + chunk_size, size) - 1)
+            end = blank_line.end() if blank_line else size
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def audit_passports(data: Buffer, with_failures: bool = False) -> PassportAudit:
+    if not with_failures:
+        complete, valid = scan_passports(data)
+        return PassportAudit(complete, valid, {})
+
+    complete = 0
+    valid = 0
+    failures: Counter = Counter()
+    for record in records(data):
+        has_fields, has_values = BINARY_PASSPORT_SCHEMA.check(record)
+        complete += has_fields
+        valid += has_values
+        if not has_values:
+            # only the passports failing are checked field by field, by the same expressions as the schema
+            missing, invalid = BINARY_PASSPORT_SCHEMA.failing_fields(record)
+            failures.update(f"missing {field}" for field in missing)
+            failures.update(f"invalid {field}" for field in invalid)
+            if any(b":" not in entry for entry in record.split()):
+                failures["malformed entries"] += 1
+
+    return PassportAudit(complete, valid, dict(failures))
+
+
+def audit_range(path: str, start: int, end: int, with_failures: bool = False) -> PassportAudit:
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return audit_passports(mapped[start:end], with_failures)
+
+
+def audit_file(path: str,
+               workers: Optional[int] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE,
+               with_failures: bool = False) -> PassportAudit:
+    ranges = record_ranges(path, chunk_size)
+    if not ranges:
+        return PassportAudit(0, 0, {})
+
+    with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count(), len(ranges))) as executor:
+        audits = list(executor.map(audit_range, repeat(path), *zip(*ranges), repeat(with_failures)))
+
+    failures: Counter = Counter()
+    for audit in audits:
+        failures.update(audit.failures)
+    return PassportAudit(
+        complete=sum(audit.complete for audit in audits),
+        valid=sum(audit.valid for audit in audits),
+        failures=dict(failures)
+    )
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Count the complete and valid passports of a large batch on all the cores")
+    parser.add_argument("path", help="batch of passports, separated by blank lines")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="bytes scanned at once by a worker")
+    parser.add_argument("--failures", action="store_true", help="count the passports failing on every field")
+    args = parser.parse_args(argv)
+
+    audit = audit_file(args.path, args.workers, args.chunk_size, args.failures)
+    print(f"solution (part1): {audit.complete}")
+    print(f"solution (part2): {audit.valid}")
+    for failure, count in sorted(audit.failures.items(), key=lambda item: (-item[1], item[0])):
+        print(f"{failure}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -113,26 +113,32 @@ optional. In your batch file, how many passports are valid?
 
 """
 import os
-from typing import Iterator, Set, Dict, List, Callable
+from typing import Iterator, Iterable, Dict, List, Callable
 
-from aoc.util.functional import compose
-from aoc.day4.validators import ValueValidator, number_validator, or_validator, regex_extractor, in_validator, \
-    regex_validator
+from aoc.day4.validators import ValueValidator, Rule, NumberRule, AnyRule, PatternRule, InRule, CompiledSchema, \
+    rule_validator
 from aoc.util.text import generate_paragraphs
 
+PASSPORT_SCHEMA: Dict[str, Rule] = {
+    "byr": NumberRule(min_bound=1920, max_bound=2002),
+    "iyr": NumberRule(min_bound=2010, max_bound=2020),
+    "eyr": NumberRule(min_bound=2020, max_bound=2030),
+    "hgt": AnyRule((
+        NumberRule(min_bound=150, max_bound=193, unit="cm"),
+        NumberRule(min_bound=59, max_bound=76, unit="in")
+    )),
+    "hcl": PatternRule(r"#[0-9abcdef]{6}"),
+    "ecl": InRule(frozenset({"amb", "blu", "brn", "gry", "grn", "hzl", "oth"})),
+    "pid": PatternRule(r"\d{9}")
+}
+
 REQUIRED_PASSPORT_FIELDS: Dict[str, ValueValidator] = {
-    "byr": number_validator(min_bound=1920, max_bound=2002),
-    "iyr": number_validator(min_bound=2010, max_bound=2020),
-    "eyr": number_validator(min_bound=2020, max_bound=2030),
-    "hgt": or_validator([
-        compose(number_validator(min_bound=150, max_bound=193), regex_extractor(r"^(\d+)cm$")),
-        compose(number_validator(min_bound=59, max_bound=76), regex_extractor(r"^(\d+)in$"))
-    ]),
-    "hcl": regex_validator(r"#[0-9abcdef]{6}"),
-    "ecl": in_validator({"amb", "blu", "brn", "gry", "grn", "hzl", "oth"}),
-    "pid": regex_validator(r"\d{9}")
+    key: rule_validator(rule)
+    for key, rule in PASSPORT_SCHEMA.items()
 }
 
+COMPILED_PASSPORT_SCHEMA = CompiledSchema(PASSPORT_SCHEMA)
+
 
 def count_valid_passports(raw_entries: Iterator[str],
                           passport_checker: Callable[[Dict[str, str]], bool]) -> int:
@@ -147,8 +153,16 @@ def count_valid_passports(raw_entries: Iterator[str],
     )
 
 
+def count_valid_records(raw_entries: Iterator[str],
+                        record_checker: Callable[[str], bool]) -> int:
+    """
+    Same as `count_valid_passports`, the checker being given the whole record instead of a dict of its fields.
+    """
+    return sum(map(record_checker, map(" ".join, generate_paragraphs(raw_entries))))
+
+
 def has_required_fields(entries: Dict[str, str],
-                        required_field_keys: Set[str]) -> bool:
+                        required_field_keys: Iterable[str]) -> bool:
     return all((f in entries for f in required_field_keys))
 
 
@@ -172,17 +186,13 @@ def generate_passport(entries: List[str]) -> Dict[str, str]:
 
 
 if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input")) as file:
-        lines = list(file.readlines())
+    from aoc.day4.scanner import scan_file
 
-        solution_part1 = count_valid_passports(
-            lines,
-            lambda p: has_required_fields(p, set(REQUIRED_PASSPORT_FIELDS.keys()))
-        )
-        print(f"solution (part1): {solution_part1}")
+    # a single read of the input is answering both parts
+    counts = scan_file(os.path.join(os.path.dirname(__file__), "input"))
 
-        solution_part2 = count_valid_passports(
-            lines,
-            lambda p: has_correct_values(p, REQUIRED_PASSPORT_FIELDS)
-        )
-        print(f"solution (part2): {solution_part2}")
+    solution_part1 = counts.complete
+    print(f"solution (part1): {solution_part1}")
+
+    solution_part2 = counts.valid
+    print(f"solution (part2): {solution_part2}")
@@ -0,0 +1,93 @@
+"""
+Both parts of a batch of passports answered from a single read of its bytes.
+
+The file is memory-mapped, and its records (runs of non-blank lines) are found by a regex over the bytes, never
+decoded: every record is checked once by the binary passport schema, telling both whether it has all the
+required fields (part 1) and whether their values are correct (part 2).
+
+The registry is reading the batch as bytes too, but every part is scanning the records on its own, so each one
+is timed as the solve of its part.
+
+    PYTHONPATH=. python -m aoc.day4.scanner passports.txt
+"""
+import argparse
+import mmap
+import os
+import re
+import sys
+from typing import NamedTuple, Iterable, Optional, Union, Iterator, AnyStr
+
+from aoc.day4.passport_processing import PASSPORT_SCHEMA
+from aoc.day4.validators import CompiledSchema
+
+BINARY_PASSPORT_SCHEMA = CompiledSchema(PASSPORT_SCHEMA, binary=True)
+
+# a run of lines with something else than whitespace, a blank line ending a record
+_RECORD = re.compile(rb"(?:[^\S\n]*\S[^\n]*(?:\n|\Z))+")
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class PassportCounts(NamedTuple):
+    # passports with all the required fields
+    complete: int
+    # passports with all the required fields, of correct values
+    valid: int
+
+
+def scan_passports(data: Buffer, schema: CompiledSchema = BINARY_PASSPORT_SCHEMA) -> PassportCounts:
+    complete = 0
+    valid = 0
+    for record in _RECORD.finditer(data):
+        has_fields, has_values = schema.check(record.group())
+        complete += has_fields
+        valid += has_values
+
+    return PassportCounts(complete, valid)
+
+
+def records(data: Buffer) -> Iterator[bytes]:
+    """
+    The records of a batch, as the bytes of their lines.
+    """
+    return (match.group() for match in _RECORD.finditer(data))
+
+
+def scan_file(path: str, schema: CompiledSchema = BINARY_PASSPORT_SCHEMA) -> PassportCounts:
+    with open(path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            # an empty file can not be mapped
+            return PassportCounts(0, 0)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return scan_passports(mapped, schema)
+
+
+def _parse(chunks: Iterable[AnyStr]) -> bytearray:
+    # the bytes of the input are kept as they are, lines of text are encoded one by one into the same buffer
+    data = bytearray()
+    for chunk in chunks:
+        data += chunk if isinstance(chunk, bytes) else chunk.encode()
+    return data
+
+
+def count_complete_passports(data: Buffer) -> int:
+    return sum(BINARY_PASSPORT_SCHEMA.has_required_fields(record) for record in records(data))
+
+
+def count_valid_passports(data: Buffer) -> int:
+    return sum(BINARY_PASSPORT_SCHEMA.has_correct_values(record) for record in records(data))
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Count the complete and valid passports of a batch file")
+    parser.add_argument("path", help="batch of passports, separated by blank lines")
+    args = parser.parse_args(argv)
+
+    counts = scan_file(args.path)
+    print(f"solution (part1): {counts.complete}")
+    print(f"solution (part2): {counts.valid}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,5 @@
 import re
-from typing import Callable, List, Optional, Set
+from typing import Callable, List, Optional, Set, NamedTuple, FrozenSet, Tuple, Union, Dict, AnyStr, Any
 
 from aoc.util.functional import compose
 
@@ -44,3 +44,184 @@ def regex_extractor(regex: str) -> ValueExtractor:
         return None
 
     return extractor
+
+
+class NumberRule(NamedTuple):
+    """
+    A number between two bounds (inclusive), followed by its unit if any.
+    """
+    min_bound: int
+    max_bound: int
+    unit: str = ""
+
+
+class PatternRule(NamedTuple):
+    """
+    A value fully matching a regex.
+    """
+    regex: str
+
+
+class InRule(NamedTuple):
+    """
+    A value being one of the allowed ones.
+    """
+    allowed_values: FrozenSet[str]
+
+
+class AnyRule(NamedTuple):
+    """
+    A value valid for any of the rules.
+    """
+    rules: Tuple["Rule", ...]
+
+
+Rule = Union[NumberRule, PatternRule, InRule, AnyRule]
+
+
+def rule_validator(rule: Rule) -> ValueValidator:
+    """
+    The validator of a single value for a rule, made of the validators above.
+    """
+    if isinstance(rule, NumberRule):
+        if not rule.unit:
+            return number_validator(rule.min_bound, rule.max_bound)
+        return compose(
+            number_validator(rule.min_bound, rule.max_bound),
+            regex_extractor(rf"^(\d+){re.escape(rule.unit)}$")
+        )
+    if isinstance(rule, PatternRule):
+        return regex_validator(rule.regex)
+    if isinstance(rule, InRule):
+        return in_validator(set(rule.allowed_values))
+    if isinstance(rule, AnyRule):
+        return or_validator([rule_validator(sub_rule) for sub_rule in rule.rules])
+
+    raise ValueError(f"unknown rule {rule!r}")
+
+
+# the key and the value of every entry of a record, the key ending at its first colon (only tried at the start
+# of the entries, so an entry without a colon is skipped in linear time)
+_ENTRY = r"(?<!\S)([^\s:]*):(\S*)"
+
+
+class CompiledSchema:
+    """
+    Rules of the fields of a record compiled into the source of a function checking all of them, generated once
+    per field set.
+
+    The entries of a record ("key:value", separated by whitespace) are split by a single regex into a dict,
+    keeping the last value of a key (as `generate_passport`), then the value of every field is checked by an
+    expression inlined in the function: integer comparisons of its digits, a lookup in a set, or a match of its
+    regex for the patterns only. Checking a record is a single regex call and a few comparisons, without calling
+    any validator.
+
+    A binary schema is checking records of bytes, as read from a file without decoding it. Its digits are ASCII
+    only, so a record out of ASCII is decoded to be checked as text.
+    """
+
+    def __init__(self, fields: Dict[str, Rule], binary: bool = False):
+        self._binary = binary
+        self._entries = re.compile(_ENTRY.encode() if binary else _ENTRY)
+        # the digits of int(), and of \d: any decimal digit in a string, the ASCII ones in bytes
+        self._digits = "isdigit" if binary else "isdecimal"
+        self._constants: Dict[str, Any] = {}
+        self._text_schema = CompiledSchema(fields) if binary else None
+
+        expressions = {self._encode(key): self._compile_rule(rule) for key, rule in fields.items()}
+        self._keys = frozenset(expressions)
+        exec(self._generate_check(expressions), self._constants)
+        self._check: Callable[[AnyStr], Tuple[bool, bool]] = self._constants["check"]
+        # the same expressions, one function per field, to tell which ones a record is failing on
+        self._field_checks: List[Tuple[str, AnyStr, Callable[[AnyStr], bool]]] = [
+            (key, self._encode(key), eval(f"lambda v: {expressions[self._encode(key)]}", self._constants))
+            for key in fields
+        ]
+
+    def _encode(self, text: str) -> AnyStr:
+        return text.encode() if self._binary else text
+
+    def _constant(self, value: Any) -> str:
+        name = f"_{len(self._constants)}"
+        self._constants[name] = value
+        return name
+
+    def _compile_rule(self, rule: Rule) -> str:
+        """
+        The expression telling whether the value `v` is valid for a rule.
+        """
+        if isinstance(rule, NumberRule):
+            min_bound, max_bound = rule.min_bound, rule.max_bound
+            if not rule.unit:
+                # plain digits are compared right away, any other value is read as int() would (with a sign...)
+                fallback = self._constant(number_validator(min_bound, max_bound))
+                return f"({min_bound} <= int(v) <= {max_bound} if v.{self._digits}() else {fallback}(v))"
+            unit = self._encode(rule.unit)
+            return f"(v.endswith({unit!r}) and v[:-{len(unit)}].{self._digits}() " \
+                   f"and {min_bound} <= int(v[:-{len(unit)}]) <= {max_bound})"
+        if isinstance(rule, PatternRule):
+            pattern = self._constant(re.compile(self._encode(rule.regex)))
+            return f"{pattern}.fullmatch(v) is not None"
+        if isinstance(rule, InRule):
+            return f"v in {self._constant(frozenset(map(self._encode, rule.allowed_values)))}"
+        if isinstance(rule, AnyRule):
+            return "(" + " or ".join(f"({self._compile_rule(sub_rule)})" for sub_rule in rule.rules) + ")"
+
+        raise ValueError(f"unknown rule {rule!r}")
+
+    def _generate_check(self, expressions: Dict[AnyStr, str]) -> str:
+        lines = ["def check(record):"]
+        if self._binary:
+            text_check = self._constant(self._text_schema.check)
+            lines += [
+                "    if not record.isascii():",
+                f"        return {text_check}(record.decode(errors='replace'))",
+            ]
+        keys = self._constant(self._keys)
+        lines.append(f"    entries = dict({self._constant(self._entries.findall)}(record))")
+        for key, expression in expressions.items():
+            lines += [
+                f"    v = entries.get({key!r})",
+                f"    if v is None or not ({expression}):",
+                f"        return {keys}.issubset(entries), False",
+            ]
+        lines.append("    return True, True")
+
+        return "\n".join(lines) + "\n"
+
+    def entries(self, record: AnyStr) -> Dict[AnyStr, AnyStr]:
+        """
+        The value of every key of the record, the last one when a key is given several times.
+        """
+        return dict(self._entries.findall(record))
+
+    def failing_fields(self, record: AnyStr) -> Tuple[List[str], List[str]]:
+        """
+        The fields missing from the record, and the ones of incorrect values, as checked by `check`.
+        """
+        if self._binary and not record.isascii():
+            return self._text_schema.failing_fields(record.decode(errors="replace"))
+
+        entries = self.entries(record)
+        missing = []
+        invalid = []
+        for field, key, check_value in self._field_checks:
+            value = entries.get(key)
+            if value is None:
+                missing.append(field)
+            elif not check_value(value):
+                invalid.append(field)
+
+        return missing, invalid
+
+    def has_required_fields(self, record: AnyStr) -> bool:
+        return self._check(record)[0]
+
+    def has_correct_values(self, record: AnyStr) -> bool:
+        return self._check(record)[1]
+
+    def check(self, record: AnyStr) -> Tuple[bool, bool]:
+        """
+        Whether the record has all the fields, and whether their values are correct, splitting its entries once.
+        """
+        return self._check(record)
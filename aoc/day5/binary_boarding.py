@@ -50,7 +50,11 @@ What is the ID of your seat?
 """
 import os
 from functools import reduce
-from typing import NamedTuple, Tuple, List, Iterable
+from typing import NamedTuple, Tuple, List, Iterable, Optional
+
+from aoc.util.vectorized import numpy, use_numpy
+
+BOARDING_PASS_LENGTH = 10
 
 
 class Seat(NamedTuple):
@@ -95,26 +99,72 @@ def find_missing_seat(seat_ids: List[int]) -> int:
     raise ValueError("Unable to find seat")
 
 
-if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input")) as file:
-        boarding_passes = list(map(str.rstrip, file.readlines()))
+def find_highest_seat_id(boarding_passes: Iterable[str]) -> int:
+    if use_numpy():
+        boarding_passes = list(boarding_passes)
+        seat_ids = _seat_ids_with_numpy(boarding_passes)
+        if seat_ids is not None:
+            return int(seat_ids.max())
 
-        solution_part1 = max(
-            map(
-                calculate_seat_id,
-                map(
-                    get_seat_from_boarding_pass,
-                    boarding_passes
-                )
-            )
-        )
-        print(f"solution (part1): {solution_part1}")
-
-        solution_part2 = find_missing_seat(list(sorted(map(
+    return max(
+        map(
             calculate_seat_id,
             map(
                 get_seat_from_boarding_pass,
                 boarding_passes
             )
-        ))))
+        )
+    )
+
+
+def find_my_seat_id(boarding_passes: Iterable[str]) -> int:
+    if use_numpy():
+        boarding_passes = list(boarding_passes)
+        seat_ids = _seat_ids_with_numpy(boarding_passes)
+        if seat_ids is not None:
+            seat_ids.sort()
+            gaps = numpy.flatnonzero(numpy.diff(seat_ids) != 1)
+            if not gaps.size:
+                raise ValueError("Unable to find seat")
+            return int(seat_ids[gaps[0]]) + 1
+
+    return find_missing_seat(list(sorted(map(
+        calculate_seat_id,
+        map(
+            get_seat_from_boarding_pass,
+            boarding_passes
+        )
+    ))))
+
+
+def _seat_ids_with_numpy(boarding_passes: List[str]) -> Optional["numpy.ndarray"]:
+    """
+    A boarding pass is the binary writing of the seat id, B and R being the ones.
+    Give None if the boarding passes can not be decoded all at once.
+    """
+    raw = "".join(boarding_passes).encode()
+    if not boarding_passes or len(raw) != BOARDING_PASS_LENGTH * len(boarding_passes):
+        return None
+
+    characters = numpy.frombuffer(raw, dtype=numpy.uint8).reshape(-1, BOARDING_PASS_LENGTH)
+    bits = (characters == ord("B")) | (characters == ord("R"))
+    return bits @ (1 << numpy.arange(BOARDING_PASS_LENGTH - 1, -1, -1))
+
+
+def _parse(lines: Iterable[str]) -> List[str]:
+    return [
+        line.rstrip()
+        for line in lines
+        if line.strip()
+    ]
+
+
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input")) as file:
+        boarding_passes = _parse(file.readlines())
+
+        solution_part1 = find_highest_seat_id(boarding_passes)
+        print(f"solution (part1): {solution_part1}")
+
+        solution_part2 = find_my_seat_id(boarding_passes)
         print(f"solution (part2): {solution_part2}")
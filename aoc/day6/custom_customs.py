@@ -73,7 +73,7 @@ import os
 from functools import reduce
 from typing import List, Iterator, Callable, Set
 
-from aoc.util.text import generate_paragraphs
+from aoc.util.text import generate_paragraphs, read_lines
 
 
 def count_in_groups(raw_lines: Iterator[str], count_method: Callable[[List[str]], int]) -> int:
@@ -95,11 +95,10 @@ def _count_same_answers_in_group(group: List[str]) -> int:
 
 
 if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input")) as file:
-        lines = list(file.readlines())
+    _input_path = os.path.join(os.path.dirname(__file__), "input")
 
-        solution_part1 = count_in_groups(lines, _count_answers_in_group)
-        print(f"solution (part1): {solution_part1}")
+    solution_part1 = count_in_groups(read_lines(_input_path), _count_answers_in_group)
+    print(f"solution (part1): {solution_part1}")
 
-        solution_part2 = count_in_groups(lines, _count_same_answers_in_group)
-        print(f"solution (part2): {solution_part2}")
+    solution_part2 = count_in_groups(read_lines(_input_path), _count_same_answers_in_group)
+    print(f"solution (part2): {solution_part2}")
@@ -173,6 +173,11 @@ def fix_program(instructions: List[Instruction]) -> int:
     raise ValueError("Unable to fix the program")
 
 
+def solve_part1(instructions: List[Instruction]) -> int:
+    accumulator, _ = play_instructions(instructions, {})
+    return accumulator
+
+
 def _parse_instruction(raw_instruction: str) -> Instruction:
     matcher = INSTRUCTION_REGEX.search(raw_instruction)
     if not matcher or len(matcher.groups()) != 2:
@@ -188,7 +193,7 @@ if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
         raw_instructions_from_file = list(file.readlines())
 
-        solution_part1, _ = play_instructions(_parse(raw_instructions_from_file), {})
+        solution_part1 = solve_part1(_parse(raw_instructions_from_file))
         print(f"solution (part1): {solution_part1}")
 
         solution_part2 = fix_program(_parse(raw_instructions_from_file))
@@ -153,14 +153,26 @@ def generate_solution_part2(contiguous_set: List[int]):
     return sorted_set[0] + sorted_set[-1]
 
 
+def solve_part2(numbers: List[int], preamble_size: int = 25) -> int:
+    return generate_solution_part2(
+        contiguous_set=find_contiguous_set(numbers, analyze_numbers(numbers, preamble_size))
+    )
+
+
+def _parse(lines: Iterable[str]) -> List[int]:
+    return [
+        int(line)
+        for line in lines
+        if line.strip()
+    ]
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input")) as file:
-        numbers_from_file = list(map(int, file.readlines()))
+        numbers_from_file = _parse(file.readlines())
 
         solution_part1 = analyze_numbers(numbers_from_file)
         print(f"solution (part1): {solution_part1}")
 
-        solution_part2 = generate_solution_part2(
-            contiguous_set=find_contiguous_set(numbers_from_file, solution_part1)
-        )
+        solution_part2 = solve_part2(numbers_from_file)
         print(f"solution (part2): {solution_part2}")
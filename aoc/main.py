@@ -1,9 +1,29 @@
 """
-Empty main...
+Run the puzzles of the calendar, every part in its own worker, and print a timing table.
+
+    python -m aoc.main            # the whole calendar
+    python -m aoc.main 1 5-7 20   # a subset of days
+    python -m aoc.main 20 --profile --memory   # with cProfile stats and memory peaks
+    python -m aoc.main --clear-cache              # forget the cached parsed inputs and answers
+    python -m aoc.main 11 17 --backend python     # without NumPy, even if it is installed
+    python -m aoc.main --daemon [--socket PATH]   # answer JSON-lines queries, see aoc.daemon
+    python -m aoc.main 19 20 --time-budget 30     # give up on a part after 30s, see aoc.util.budget
+    python -m aoc.main 4 --import-profile         # what the runner is importing to run day 4
 """
+import argparse
 import logging
-
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import NamedTuple, Any, List, Optional, Tuple, Dict
+
+from aoc.cache import Cache, answer_key, parsed_key
+from aoc.registry import Puzzle, get_puzzle, parse_days
+from aoc.util.budget import Budget, BudgetExceeded, add_budget_arguments, budget_from_arguments
+from aoc.util.imports import measure_imports, format_imports
+from aoc.util.profiling import Profiler, phase
+from aoc.util.vectorized import BACKENDS, set_backend
 
 logging.basicConfig(
     stream=sys.stdout,
@@ -15,9 +35,213 @@ logging.basicConfig(
 log = logging.getLogger(__name__)
 
 
-def main():
-    log.info("nothing to run, see sub-modules for problems, and check the tests directory to execute the problems")
+class PartResult(NamedTuple):
+    day: int
+    part: int
+    answer: Any
+    parse_ms: float
+    solve_ms: float
+    error: Optional[str] = None
+    # time spent building intermediate structures, included in the solve time
+    build_ms: float = 0
+    peak_kib: Optional[float] = None
+    profile: Optional[str] = None
+    # what has been found in the cache: "answer", "parsed" or nothing
+    cached: Optional[str] = None
+    # progress of the solver when it has been stopped by its budget
+    budget_exceeded: Optional[Dict[str, Any]] = None
+
+
+def run_part(day: int,
+             part: int,
+             cprofile: bool = False,
+             memory: bool = False,
+             use_cache: bool = False,
+             budget: Optional[Budget] = None) -> PartResult:
+    # imported before the timed phases, so the import of the day is not counted as parsing
+    puzzle = get_puzzle(day).resolve()
+    cache = Cache() if use_cache else None
+
+    if cache:
+        try:
+            return PartResult(day, part, cache.get(answer_key(puzzle, part)), 0, 0, cached="answer")
+        except KeyError:
+            pass
+
+    with Profiler(f"day {day} part {part}", cprofile=cprofile, memory=memory) as profiler:
+        cached = None
+        exceeded = None
+        try:
+            with phase("parse"):
+                parsed, cached = _parse_input(puzzle, cache)
+            with phase("solve"), budget or nullcontext():
+                answer = puzzle.parts[part - 1](parsed)
+            error = None
+            if cache:
+                cache.put(answer_key(puzzle, part), answer)
+        except BudgetExceeded as e:
+            answer = None
+            error = f"{type(e).__name__}: {e}"
+            exceeded = e.progress
+        except Exception as e:  # a broken input or part should not take the whole run down
+            answer = None
+            error = f"{type(e).__name__}: {e}"
+
+    return PartResult(
+        day=day,
+        part=part,
+        answer=answer,
+        parse_ms=profiler.wall_ms("parse"),
+        solve_ms=profiler.wall_ms("solve"),
+        error=error,
+        build_ms=profiler.wall_ms("build"),
+        peak_kib=profiler.peak_kib("solve"),
+        profile=profiler.report() if cprofile else None,
+        cached=cached,
+        budget_exceeded=exceeded
+    )
+
+
+def _parse_input(puzzle: Puzzle, cache: Optional[Cache]) -> Tuple[Any, Optional[str]]:
+    if cache:
+        try:
+            return cache.get(parsed_key(puzzle)), "parsed"
+        except KeyError:
+            pass
+
+    parsed = puzzle.parse(puzzle.open_input())
+    if cache:
+        # store it before solving, as some solvers are consuming their input
+        cache.put(parsed_key(puzzle), parsed)
+
+    return parsed, None
+
+
+def run_days(days: List[int],
+             workers: Optional[int] = None,
+             cprofile: bool = False,
+             memory: bool = False,
+             use_cache: bool = False,
+             budget: Optional[Budget] = None) -> List[PartResult]:
+    tasks = [
+        (day, part)
+        for day in days
+        for part in range(1, len(get_puzzle(day).parts) + 1)
+    ]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(run_part, day, part, cprofile, memory, use_cache, budget)
+            for day, part in tasks
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            log.debug(f"day {result.day} part {result.part} done in {result.parse_ms + result.solve_ms:.1f}ms")
+            results.append(result)
+
+    return sorted(results, key=lambda r: (r.day, r.part))
+
+
+def format_table(results: List[PartResult]) -> str:
+    with_memory = any(result.peak_kib is not None for result in results)
+    headers = ("day", "part", "answer", "cache", "parse (ms)", "build (ms)", "solve (ms)") + (("peak (KiB)",) if with_memory else ())
+    rows = [
+        (
+            str(result.day),
+            str(result.part),
+            str(result.answer) if result.error is None else f"ERROR {result.error}",
+            result.cached or "-",
+            f"{result.parse_ms:.1f}",
+            f"{result.build_ms:.1f}",
+            f"{result.solve_ms:.1f}",
+        ) + ((f"{result.peak_kib or 0:.0f}",) if with_memory else ())
+        for result in results
+    ]
+    widths = [
+        max(len(cell) for cell in column)
+        for column in zip(headers, *rows)
+    ]
+
+    def format_row(row) -> str:
+        return " | ".join(cell.rjust(width) for cell, width in zip(row, widths))
+
+    return "\n".join([
+        format_row(headers),
+        "-+-".join("-" * width for width in widths),
+        *map(format_row, rows),
+    ])
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run the Advent of Code 2020 solvers")
+    parser.add_argument("days", nargs="*", help="days to run, like 7 or 1-5 (default: all)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--profile", action="store_true", help="print the cProfile stats of every part")
+    parser.add_argument("--memory", action="store_true", help="trace the memory peak of every part")
+    parser.add_argument("--no-cache", action="store_true", help="parse and solve everything from scratch")
+    parser.add_argument("--clear-cache", action="store_true", help="remove all the cached entries and exit")
+    parser.add_argument("--backend", choices=BACKENDS, default=None,
+                        help="vectorise with numpy or not (default: $AOC_BACKEND, or numpy when installed)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="keep the inputs in memory and answer JSON-lines queries on stdin, or on --socket")
+    parser.add_argument("--socket", default=None, help="Unix socket the daemon is listening on")
+    add_budget_arguments(parser)
+    parser.add_argument("--import-profile", action="store_true",
+                        help="print the modules imported to run the days, and their cost, instead of running them")
+    args = parser.parse_args(argv)
+
+    if args.backend:
+        try:
+            set_backend(args.backend)
+        except ImportError as e:
+            parser.error(str(e))
+
+    if args.daemon:
+        from aoc import daemon
+
+        # stdout is carrying the answers of the daemon
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, logging.StreamHandler):
+                handler.setStream(sys.stderr)
+        return daemon.main(["--socket", args.socket] if args.socket else [])
+
+    if args.clear_cache:
+        cache = Cache()
+        print(f"removed {cache.clear()} entries from {cache.directory}")
+        return 0
+
+    days = parse_days(args.days)
+    if args.import_profile:
+        print(format_imports(measure_imports(
+            "from aoc.main import run_part; from aoc.registry import get_puzzle; "
+            f"[get_puzzle(day).resolve() for day in {days}]"
+        )))
+        return 0
+
+    log.info(f"running days {days}")
+
+    with phase("total") as total:
+        results = run_days(
+            days,
+            args.workers,
+            cprofile=args.profile,
+            memory=args.memory,
+            # profiling a cached answer would not make much sense
+            use_cache=not (args.no_cache or args.profile or args.memory),
+            budget=budget_from_arguments(args)
+        )
+
+    for result in results:
+        if result.profile:
+            print(result.profile)
+        if result.budget_exceeded:
+            print(f"day {result.day} part {result.part} stopped: {result.budget_exceeded}")
+    print(format_table(results))
+    print(f"total: {total.wall_ms:.1f}ms")
+
+    return 1 if any(result.error for result in results) else 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
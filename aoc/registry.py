@@ -0,0 +1,387 @@
+"""
+Registry of all the puzzles of the calendar.
+
+Every puzzle knows how to read its input, how to parse it, and how to solve each of its parts
+from the parsed input, so any day can be run the same way without going through its `__main__`.
+
+The parsers and solvers are given as entry points ("module:attribute"), only imported when they are
+called, so running a day is not paying for the import of the others (their regexes, validators...).
+"""
+import importlib
+import os
+from functools import partial, reduce
+from typing import NamedTuple, Callable, Any, Tuple, Optional, List, Dict, Iterable, Iterator, AnyStr
+
+from aoc.util.text import read_lines
+
+Parser = Callable[[Iterable[str]], Any]
+Solver = Callable[[Any], Any]
+
+
+class EntryPoint:
+    """
+    An attribute of a module, given as "module:attribute" (or "module:object.attribute") and imported the
+    first time it is needed, with the arguments to bind to it when it is a function (which can be entry points
+    too, for the constants of a day).
+    """
+
+    def __init__(self, target: str, *args: Any, **keywords: Any):
+        self.target = target
+        self.args = args
+        self.keywords = keywords
+        self._resolved: Any = None
+
+    def resolve(self) -> Any:
+        if self._resolved is None:
+            module_name, attribute = self.target.split(":")
+            value = reduce(getattr, attribute.split("."), importlib.import_module(module_name))
+            if self.args or self.keywords:
+                value = partial(
+                    value,
+                    *map(_resolve, self.args),
+                    **{key: _resolve(arg) for key, arg in self.keywords.items()}
+                )
+            self._resolved = value
+
+        return self._resolved
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"EntryPoint({self.target!r})"
+
+
+def _resolve(value: Any) -> Any:
+    return value.resolve() if isinstance(value, EntryPoint) else value
+
+
+class Puzzle(NamedTuple):
+    day: int
+    title: str
+    parse: Parser
+    parts: Tuple[Solver, ...]
+    # some puzzles are given inline instead of through an input file
+    raw_input: Optional[str] = None
+    # the parser is accepting any iterable, so the input can be streamed instead of being read at once
+    streamed: bool = False
+    # another input than the one of the package of the day
+    path: Optional[str] = None
+    # the parser is given the bytes of the input, read at once without decoding them
+    binary: bool = False
+
+    @property
+    def input_path(self) -> str:
+        return self.path or os.path.join(os.path.dirname(__file__), f"day{self.day}", "input")
+
+    def with_input(self, path: str) -> "Puzzle":
+        return self._replace(path=path, raw_input=None)
+
+    def resolve(self) -> "Puzzle":
+        """
+        The puzzle with its entry points imported.
+        """
+        return self._replace(parse=_resolve(self.parse), parts=tuple(map(_resolve, self.parts)))
+
+    def read_lines(self) -> List[str]:
+        if self.raw_input is not None:
+            return self.raw_input.splitlines(keepends=True)
+
+        with open(self.input_path) as file:
+            return list(file.readlines())
+
+    def stream_lines(self) -> Iterator[str]:
+        if self.raw_input is not None:
+            return iter(self.raw_input.splitlines(keepends=True))
+
+        return read_lines(self.input_path)
+
+    def read_bytes(self) -> bytes:
+        if self.raw_input is not None:
+            return self.raw_input.encode()
+
+        with open(self.input_path, "rb") as file:
+            return file.read()
+
+    def open_input(self) -> Iterable[AnyStr]:
+        if self.binary:
+            return [self.read_bytes()]
+
+        return self.stream_lines() if self.streamed else self.read_lines()
+
+
+PUZZLES: Dict[int, Puzzle] = {
+    puzzle.day: puzzle
+    for puzzle in [
+        Puzzle(
+            day=1,
+            title="Report Repair",
+            parse=EntryPoint("aoc.day1.expense_report:_parse"),
+            parts=(
+                EntryPoint("aoc.day1.expense_report:calculate_expense"),
+                EntryPoint("aoc.day1.expense_report:calculate_expense_part2"),
+            )
+        ),
+        Puzzle(
+            day=2,
+            title="Password Philosophy",
+            parse=EntryPoint("aoc.day2.columnar:_parse_columns"),
+            parts=(
+                EntryPoint("aoc.day2.columnar:count_valid_passwords"),
+                EntryPoint("aoc.day2.columnar:count_valid_passwords_part2"),
+            )
+        ),
+        Puzzle(
+            day=3,
+            title="Toboggan Trajectory",
+            parse=EntryPoint("aoc.day3.bitmap:parse_tree_map"),
+            parts=(
+                EntryPoint("aoc.day3.bitmap:count_trees", right=3, down=1),
+                EntryPoint(
+                    "aoc.day3.bitmap:analyze_trajectories",
+                    trajectories=EntryPoint("aoc.day3.tobogan_trajectory:TRAJECTORIES")
+                ),
+            )
+        ),
+        Puzzle(
+            day=4,
+            title="Passport Processing",
+            parse=EntryPoint("aoc.day4.scanner:_parse"),
+            parts=(
+                EntryPoint("aoc.day4.scanner:count_complete_passports"),
+                EntryPoint("aoc.day4.scanner:count_valid_passports"),
+            ),
+            binary=True
+        ),
+        Puzzle(
+            day=5,
+            title="Binary Boarding",
+            parse=EntryPoint("aoc.day5.binary_boarding:_parse"),
+            parts=(
+                EntryPoint("aoc.day5.binary_boarding:find_highest_seat_id"),
+                EntryPoint("aoc.day5.binary_boarding:find_my_seat_id"),
+            )
+        ),
+        Puzzle(
+            day=6,
+            title="Custom Customs",
+            parse=iter,
+            parts=(
+                EntryPoint(
+                    "aoc.day6.custom_customs:count_in_groups",
+                    count_method=EntryPoint("aoc.day6.custom_customs:_count_answers_in_group")
+                ),
+                EntryPoint(
+                    "aoc.day6.custom_customs:count_in_groups",
+                    count_method=EntryPoint("aoc.day6.custom_customs:_count_same_answers_in_group")
+                ),
+            ),
+            streamed=True
+        ),
+        Puzzle(
+            day=7,
+            title="Handy Haversacks",
+            parse=EntryPoint("aoc.day7.handy_haversacks:_parse"),
+            parts=(
+                EntryPoint("aoc.day7.handy_haversacks:count_bags_containing", "shiny gold"),
+                EntryPoint("aoc.day7.handy_haversacks:count_bags_into", "shiny gold"),
+            )
+        ),
+        Puzzle(
+            day=8,
+            title="Handheld Halting",
+            parse=EntryPoint("aoc.day8.handheld_halting:_parse"),
+            parts=(
+                EntryPoint("aoc.day8.handheld_halting:solve_part1"),
+                EntryPoint("aoc.day8.handheld_halting:fix_program"),
+            )
+        ),
+        Puzzle(
+            day=9,
+            title="Encoding Error",
+            parse=EntryPoint("aoc.day9.encoding_error:_parse"),
+            parts=(
+                EntryPoint("aoc.day9.encoding_error:analyze_numbers"),
+                EntryPoint("aoc.day9.encoding_error:solve_part2"),
+            )
+        ),
+        Puzzle(
+            day=10,
+            title="Adapter Array",
+            parse=EntryPoint("aoc.day10.adapter_array:_parse"),
+            parts=(
+                EntryPoint("aoc.day10.adapter_array:find_joltage_difference"),
+                EntryPoint("aoc.day10.adapter_array:find_adapters_arrangements"),
+            )
+        ),
+        Puzzle(
+            day=11,
+            title="Seating System",
+            parse=EntryPoint("aoc.day11.seating_system:_parse"),
+            parts=(
+                EntryPoint("aoc.day11.seating_system:solve_part1"),
+                EntryPoint("aoc.day11.seating_system:solve_part2"),
+            )
+        ),
+        Puzzle(
+            day=12,
+            title="Rain Risk",
+            parse=EntryPoint("aoc.day12.rain_risk:_parse"),
+            parts=(
+                EntryPoint("aoc.day12.rain_risk:solve_part1"),
+                EntryPoint("aoc.day12.rain_risk:solve_part2"),
+            )
+        ),
+        Puzzle(
+            day=13,
+            title="Shuttle Search",
+            parse=EntryPoint("aoc.day13.shuttle_search:_parse_notes"),
+            parts=(
+                EntryPoint("aoc.day13.shuttle_search:solve_part1"),
+                EntryPoint("aoc.day13.shuttle_search:solve_part2"),
+            )
+        ),
+        Puzzle(
+            day=14,
+            title="Docking Data",
+            parse=list,
+            parts=(
+                EntryPoint("aoc.day14.docking_data:solve_part1"),
+                EntryPoint("aoc.day14.docking_data:solve_part2"),
+            )
+        ),
+        Puzzle(
+            day=15,
+            title="Rambunctious Recitation",
+            parse=EntryPoint("aoc.day15.rambunctious_recitation:_parse"),
+            parts=(
+                EntryPoint("aoc.day15.rambunctious_recitation:play_game_with_array", number_of_turns=2020),
+                EntryPoint("aoc.day15.rambunctious_recitation:play_game_with_array", number_of_turns=30000000),
+            ),
+            raw_input="18,11,9,0,5,1"
+        ),
+        Puzzle(
+            day=16,
+            title="Ticket Translation",
+            parse=EntryPoint("aoc.day16.ticket_translation:_parse"),
+            parts=(
+                EntryPoint("aoc.day16.ticket_translation:solve_part1"),
+                EntryPoint("aoc.day16.ticket_translation:multiply_departure_fields"),
+            )
+        ),
+        Puzzle(
+            day=17,
+            title="Conway Cubes",
+            parse=list,
+            parts=(
+                EntryPoint("aoc.day17.conway_cubes:solve_part1", cycles=6),
+                EntryPoint("aoc.day17.conway_cubes_part2:solve_part2", cycles=6),
+            )
+        ),
+        Puzzle(
+            day=18,
+            title="Operation Order",
+            parse=list,
+            parts=(
+                EntryPoint("aoc.day18.operation_order:solve_part1"),
+                EntryPoint("aoc.day18.operation_order:solve_part2"),
+            )
+        ),
+        Puzzle(
+            day=19,
+            title="Monster Messages",
+            parse=EntryPoint("aoc.day19.monster_messages:_parse"),
+            parts=(
+                EntryPoint("aoc.day19.monster_messages:count_valid_messages"),
+                EntryPoint("aoc.day19.monster_messages:count_valid_messages", with_loops=True),
+            )
+        ),
+        Puzzle(
+            day=20,
+            title="Jurassic Jigsaw",
+            parse=EntryPoint("aoc.day20.jurassic_jigsaw:_parse"),
+            parts=(
+                EntryPoint("aoc.day20.jurassic_jigsaw:multiply_corner_ids"),
+                EntryPoint("aoc.day20.jurassic_jigsaw:solve_part2"),
+            ),
+            streamed=True
+        ),
+        Puzzle(
+            day=21,
+            title="Allergen Assessment",
+            parse=EntryPoint("aoc.day21.allergen_assessment:_parse"),
+            parts=(
+                EntryPoint("aoc.day21.allergen_assessment:count_safe_ingredients"),
+                EntryPoint("aoc.day21.allergen_assessment:list_dangerous_ingredients"),
+            )
+        ),
+        Puzzle(
+            day=22,
+            title="Crab Combat",
+            parse=EntryPoint("aoc.day22.crab_combat:_parse"),
+            parts=(
+                EntryPoint("aoc.day22.crab_combat:solve_part1"),
+                EntryPoint("aoc.day22.crab_combat:solve_part2"),
+            ),
+            streamed=True
+        ),
+        Puzzle(
+            day=23,
+            title="Crab Cups",
+            parse=EntryPoint("aoc.day23.crab_cups:_parse"),
+            parts=(
+                EntryPoint("aoc.day23.crab_cups:solve_part1"),
+                EntryPoint("aoc.day23.crab_cups:solve_part2"),
+            ),
+            raw_input="538914762"
+        ),
+        Puzzle(
+            day=24,
+            title="Lobby Layout",
+            parse=EntryPoint("aoc.day24.lobby_layout:_parse_all"),
+            parts=(
+                EntryPoint("aoc.day24.lobby_layout:count_black_tiles"),
+                EntryPoint("aoc.day24.lobby_layout:count_black_tiles_after"),
+            ),
+            streamed=True
+        ),
+        Puzzle(
+            day=25,
+            title="Combo Breaker",
+            parse=EntryPoint("aoc.day25.combo_breaker:_parse"),
+            parts=(
+                EntryPoint("aoc.day25.combo_breaker:find_encryption_key"),
+            )
+        ),
+    ]
+}
+
+
+def get_puzzle(day: int) -> Puzzle:
+    puzzle = PUZZLES.get(day)
+    if not puzzle:
+        raise ValueError(f"No puzzle registered for day {day}")
+
+    return puzzle
+
+
+def parse_days(raw_days: Iterable[str]) -> List[int]:
+    """
+    Parse a selection of days, each entry being either a single day ("7") or a range ("1-5").
+    An empty selection means the whole calendar.
+    """
+    days = []
+    for raw_day in raw_days:
+        if "-" in raw_day:
+            first, last = raw_day.split("-", 1)
+            days.extend(range(int(first), int(last) + 1))
+        else:
+            days.append(int(raw_day))
+
+    if not days:
+        return sorted(PUZZLES.keys())
+
+    for day in days:
+        get_puzzle(day)
+
+    return sorted(set(days))
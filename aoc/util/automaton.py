@@ -0,0 +1,525 @@
+"""
+Cellular automata: at every generation, cells are born, survive or die depending on how many of their
+neighbors are alive.
+
+An automaton is made of a topology, giving the neighbors of every cell, and of a rule, giving the numbers
+of live neighbors for which a dead cell is born and a live cell survives:
+
+    automaton = Automaton(hypercube(3), Rule.of(birth={3}, survival={2, 3}), live_cells)
+    automaton.run(6)
+    print(automaton.population)
+
+The generations are computed by one of two backends:
+- the dense backend stores one byte per cell (of a box around the live cells, or of a finite graph) in a
+  big integer, and counts the live neighbors of all the cells at once, by adding shifted copies of this
+  integer: as a byte can count up to 127 neighbors, the counts never overflow in the next cell. The rule
+  is then applied to all the cells with a single `bytes.translate`.
+  When NumPy is available (see `aoc.util.vectorized`), the same cells are counted with NumPy arrays.
+- the sparse backend only stores the set of the live cells, and counts the neighbors of these cells.
+Unless one is forced, the backend is chosen from the density of the live cells in their bounding box,
+and chosen again every few generations as the live cells spread or die.
+"""
+from collections import Counter
+from functools import lru_cache
+from itertools import chain, product
+from operator import itemgetter
+from typing import NamedTuple, FrozenSet, Iterable, Tuple, List, Set, Optional, Union, Dict, Callable, Hashable
+
+from aoc.util.matrix import Grid
+from aoc.util.vectorized import numpy, use_numpy
+
+DENSE = "dense"
+SPARSE = "sparse"
+
+# the dense backend is chosen over the sparse one, when at least this ratio of the bounding box is alive
+DENSE_MIN_DENSITY = 1 / 64
+# number of generations after which the backend is chosen again
+RESELECT_EVERY = 16
+# maximum number of generations a dense box is sized for
+DENSE_CHUNK = 16
+
+# a cell of the dense backend is a byte holding its number of live neighbors, and its state in the high bit
+_ALIVE_BIT = 0x80
+_MAX_DENSE_DEGREE = _ALIVE_BIT - 1
+
+# coordinates of a lattice are packed in a single int by the sparse backend
+_PACK_BITS = 32
+_PACK_BIAS = 1 << (_PACK_BITS - 1)
+_PACK_MASK = (1 << _PACK_BITS) - 1
+
+Cell = Hashable
+Coordinates = Tuple[int, ...]
+
+
+class Rule(NamedTuple):
+    birth: FrozenSet[int]
+    survival: FrozenSet[int]
+
+    @staticmethod
+    def of(birth: Iterable[int], survival: Iterable[int]) -> 'Rule':
+        return Rule(frozenset(birth), frozenset(survival))
+
+    def next_state(self, alive: bool, live_neighbors: int) -> bool:
+        return live_neighbors in (self.survival if alive else self.birth)
+
+    def table(self) -> bytes:
+        """
+        Translation table from a cell of the dense backend to its next state.
+        """
+        return bytes(
+            self.next_state(code >= _ALIVE_BIT, code & _MAX_DENSE_DEGREE)
+            for code in range(256)
+        )
+
+
+class Lattice(NamedTuple):
+    """
+    An infinite lattice, the cells being identified by their coordinates and their neighbors being at
+    fixed offsets.
+    """
+    offsets: Tuple[Coordinates, ...]
+
+    @property
+    def dimensions(self) -> int:
+        return len(self.offsets[0])
+
+    @property
+    def degree(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def reach(self) -> int:
+        return max(abs(delta) for offset in self.offsets for delta in offset)
+
+    def neighbors(self, cell: Coordinates) -> List[Coordinates]:
+        return [
+            tuple(coord + delta for coord, delta in zip(cell, offset))
+            for offset in self.offsets
+        ]
+
+    def _key(self, cell: Coordinates) -> int:
+        key = 0
+        for dimension, coord in enumerate(cell):
+            key |= (coord + _PACK_BIAS) << (_PACK_BITS * dimension)
+
+        return key
+
+    def _cell(self, key: int) -> Coordinates:
+        return tuple(
+            ((key >> (_PACK_BITS * dimension)) & _PACK_MASK) - _PACK_BIAS
+            for dimension in range(self.dimensions)
+        )
+
+    def _count_neighbors(self, keys: Set[int]) -> Dict[int, int]:
+        offsets = _packed_offsets(self)
+        return Counter(key + offset for offset in offsets for key in keys)
+
+
+class Graph(NamedTuple):
+    """
+    A finite set of cells, numbered from 0, with the list of the neighbors of every cell.
+    """
+    adjacency: List[List[int]]
+
+    @property
+    def degree(self) -> int:
+        return max(map(len, self.adjacency), default=0)
+
+    def neighbors(self, cell: int) -> List[int]:
+        return self.adjacency[cell]
+
+    def _key(self, cell: int) -> int:
+        return cell
+
+    def _cell(self, key: int) -> int:
+        return key
+
+    def _count_neighbors(self, keys: Set[int]) -> Dict[int, int]:
+        return Counter(chain.from_iterable(map(self.adjacency.__getitem__, keys)))
+
+
+Topology = Union[Lattice, Graph]
+
+
+@lru_cache(maxsize=None)
+def _packed_offsets(lattice: Lattice) -> List[int]:
+    # adding a packed offset to a packed cell moves all its coordinates at once
+    origin = lattice._key((0,) * lattice.dimensions)
+    return [lattice._key(offset) - origin for offset in lattice.offsets]
+
+
+def square(diagonals: bool = True) -> Lattice:
+    if diagonals:
+        return hypercube(2)
+
+    return Lattice(((-1, 0), (0, -1), (0, 1), (1, 0)))
+
+
+def hypercube(dimensions: int) -> Lattice:
+    """
+    Lattice in N dimensions, where the neighbors of a cell are all the cells touching it (3^N - 1 cells).
+    """
+    return Lattice(tuple(
+        offset
+        for offset in product((-1, 0, 1), repeat=dimensions)
+        if any(offset)
+    ))
+
+
+def hexagonal() -> Lattice:
+    """
+    Lattice of hexagons, with axial coordinates: east is (1, 0), south-east is (0, 1), and so on.
+    """
+    return Lattice(((1, -1), (1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1)))
+
+
+def line_of_sight(grid: Grid,
+                  is_cell: Callable[[int], bool],
+                  reach: Optional[int] = None,
+                  diagonals: bool = True) -> Tuple[Graph, List[Tuple[int, int]]]:
+    """
+    Graph of the cells of a grid, where the neighbors of a cell are the first cells seen in every direction,
+    looking up to `reach` positions away (or up to the border of the grid).
+    Also give the position in the grid of every cell of the graph.
+    """
+    positions = [
+        (row, col)
+        for row, cells in enumerate(grid.rows())
+        for col, value in enumerate(cells)
+        if is_cell(value)
+    ]
+    cell_ids = {position: cell for cell, position in enumerate(positions)}
+
+    directions = square(diagonals).offsets
+    adjacency = []
+    for row, col in positions:
+        neighbors = []
+        for d_row, d_col in directions:
+            distance = 1
+            n_row, n_col = row + d_row, col + d_col
+            while grid.in_bounds(n_row, n_col) and (reach is None or distance <= reach):
+                if (n_row, n_col) in cell_ids:
+                    neighbors.append(cell_ids[n_row, n_col])
+                    break
+                distance += 1
+                n_row, n_col = n_row + d_row, n_col + d_col
+        adjacency.append(neighbors)
+
+    return Graph(adjacency), positions
+
+
+class SparseBackend:
+    """
+    Store the set of the live cells, and only look at them and at their neighbors.
+    """
+    name = SPARSE
+
+    def __init__(self, topology: Topology, rule: Rule, cells: Iterable[Cell]):
+        if 0 in rule.birth:
+            raise ValueError("cells born without live neighbors can only be computed by the dense backend")
+
+        self.topology = topology
+        self.rule = rule
+        self._live = set(map(topology._key, cells))
+
+    @property
+    def population(self) -> int:
+        return len(self._live)
+
+    def cells(self) -> Set[Cell]:
+        return set(map(self.topology._cell, self._live))
+
+    def step(self) -> bool:
+        live = self._live
+        birth, survival = self.rule
+        counts = self.topology._count_neighbors(live)
+        new_live = {
+            key
+            for key, count in counts.items()
+            if count in (survival if key in live else birth)
+        }
+        if 0 in survival:
+            new_live.update(key for key in live if key not in counts)
+
+        changed = new_live != live
+        self._live = new_live
+        return changed
+
+    def plan(self, steps: int) -> None:
+        pass
+
+
+class DenseBackend:
+    """
+    Store a byte per cell of a finite graph, or of a box around the live cells of a lattice.
+
+    The box is big enough for the live cells to never reach its border during the next `steps_ahead`
+    generations, so the counts of the cells on the border are never wrong, even if adding the shifted
+    integers is wrapping the neighbors of one side of the box to the other side. Once these generations
+    are computed, a new box is taken around the live cells.
+    """
+    name = DENSE
+
+    def __init__(self, topology: Topology, rule: Rule, cells: Iterable[Cell], steps_ahead: int = DENSE_CHUNK):
+        if topology.degree > _MAX_DENSE_DEGREE:
+            raise ValueError(f"the dense backend can not count more than {_MAX_DENSE_DEGREE} neighbors")
+        if isinstance(topology, Lattice) and 0 in rule.birth:
+            raise ValueError("cells born without live neighbors would fill an infinite lattice")
+
+        self.topology = topology
+        self.rule = rule
+        self.steps_ahead = steps_ahead
+        self._table = rule.table()
+        self._bytes = b""
+        self._safe_steps = 0
+        if isinstance(topology, Graph):
+            self._init_graph(cells)
+        else:
+            self._init_box(cells)
+
+    @property
+    def population(self) -> int:
+        return self._bytes.count(1)
+
+    def cells(self) -> Set[Cell]:
+        if isinstance(self.topology, Graph):
+            return set(self._live_indices())
+
+        return set(map(self._coordinates, self._live_indices()))
+
+    def step(self) -> bool:
+        if isinstance(self.topology, Lattice):
+            if self._safe_steps == 0:
+                self._init_box(self.cells())
+            self._safe_steps -= 1
+
+        new_bytes = self._next_generation()
+        if isinstance(self.topology, Graph):
+            new_bytes += b"\0"
+
+        changed = new_bytes != self._bytes
+        self._bytes = new_bytes
+        return changed
+
+    def _next_generation(self) -> bytes:
+        state = int.from_bytes(self._bytes[:self._size], "little")
+        if isinstance(self.topology, Graph):
+            counts = sum(
+                int.from_bytes(bytes(gather(self._bytes)), "little")
+                for gather in self._gathers
+            )
+        else:
+            counts = sum(
+                state >> (8 * offset) if offset > 0 else state << (-8 * offset)
+                for offset in self._offsets
+            )
+
+        coded = counts | (state << 7)
+        return coded.to_bytes(self._size, "little").translate(self._table)
+
+    def plan(self, steps: int) -> None:
+        """
+        Size the box for the given number of generations.
+        """
+        self.steps_ahead = max(1, min(steps, DENSE_CHUNK))
+        if isinstance(self.topology, Lattice) and self._safe_steps != self.steps_ahead:
+            self._init_box(self.cells())
+
+    def _init_graph(self, cells: Iterable[int]) -> None:
+        adjacency = self.topology.adjacency
+        self._size = len(adjacency)
+        # the missing neighbors are read in a dead cell, added after the last cell
+        missing = self._size
+        self._gathers = [
+            itemgetter(*(
+                neighbors[slot] if slot < len(neighbors) else missing
+                for neighbors in adjacency
+            ), missing)
+            for slot in range(max(map(len, adjacency), default=0))
+        ]
+        self._set_cells(cells)
+
+    def _init_box(self, cells: Iterable[Coordinates]) -> None:
+        cells = list(cells)
+        dimensions = self.topology.dimensions
+        margin = self.topology.reach * self.steps_ahead
+        if cells:
+            lows = [min(cell[d] for cell in cells) for d in range(dimensions)]
+            highs = [max(cell[d] for cell in cells) for d in range(dimensions)]
+        else:
+            lows = highs = [0] * dimensions
+
+        self._origin = [low - margin for low in lows]
+        self._shape = [high - low + 1 + 2 * margin for low, high in zip(lows, highs)]
+        self._strides = []
+        stride = 1
+        for size in self._shape:
+            self._strides.append(stride)
+            stride *= size
+        self._size = stride
+        self._offsets = [self._index(offset, origin=[0] * dimensions) for offset in self.topology.offsets]
+        self._safe_steps = self.steps_ahead
+        self._set_cells(map(self._index, cells))
+
+    def _set_cells(self, indices: Iterable[int]) -> None:
+        # the graph is followed by the dead cell read for its missing neighbors
+        cells = bytearray(self._size + isinstance(self.topology, Graph))
+        for index in indices:
+            cells[index] = 1
+
+        self._bytes = bytes(cells)
+
+    def _index(self, cell: Coordinates, origin: Optional[List[int]] = None) -> int:
+        origin = origin if origin is not None else self._origin
+        return sum((coord - low) * stride for coord, low, stride in zip(cell, origin, self._strides))
+
+    def _coordinates(self, index: int) -> Coordinates:
+        coordinates = []
+        for low, size in zip(self._origin, self._shape):
+            index, coord = divmod(index, size)
+            coordinates.append(low + coord)
+
+        return tuple(coordinates)
+
+    def _live_indices(self) -> Iterable[int]:
+        index = self._bytes.find(1)
+        while index >= 0:
+            yield index
+            index = self._bytes.find(1, index + 1)
+
+
+class NumpyBackend(DenseBackend):
+    """
+    Same cells as the dense backend, but counting the neighbors with NumPy arrays.
+    """
+
+    def _init_graph(self, cells: Iterable[int]) -> None:
+        super()._init_graph(cells)
+        missing = self._size
+        degree = self.topology.degree
+        self._neighbors = numpy.array(
+            [
+                neighbors + [missing] * (degree - len(neighbors))
+                for neighbors in self.topology.adjacency
+            ],
+            dtype=numpy.intp
+        ).reshape(self._size, degree)
+
+    def _next_generation(self) -> bytes:
+        cells = numpy.frombuffer(self._bytes, dtype=numpy.uint8)
+        if isinstance(self.topology, Graph):
+            counts = cells[self._neighbors].sum(axis=1, dtype=numpy.uint8)
+            state = cells[:self._size]
+        else:
+            state = cells
+            counts = numpy.zeros(self._size, dtype=numpy.uint8)
+            for offset in self._offsets:
+                if offset > 0:
+                    counts[:-offset] += state[offset:]
+                else:
+                    counts[-offset:] += state[:offset]
+
+        coded = counts | (state << 7)
+        return numpy.frombuffer(self._table, dtype=numpy.uint8)[coded].tobytes()
+
+
+Backend = Union[SparseBackend, DenseBackend]
+
+
+def density(topology: Topology, cells: Set[Cell]) -> float:
+    """
+    Ratio of live cells in the graph, or in the box around the live cells of a lattice.
+    """
+    if not cells:
+        return 0.
+
+    if isinstance(topology, Graph):
+        return len(cells) / len(topology.adjacency)
+
+    volume = 1
+    for dimension in range(topology.dimensions):
+        coords = [cell[dimension] for cell in cells]
+        volume *= max(coords) - min(coords) + 1 + 2 * topology.reach
+
+    return len(cells) / volume
+
+
+def choose_backend(topology: Topology, rule: Rule, cells: Set[Cell]) -> str:
+    if 0 in rule.birth:
+        return DENSE
+    if topology.degree > _MAX_DENSE_DEGREE:
+        return SPARSE
+
+    return DENSE if density(topology, cells) >= DENSE_MIN_DENSITY else SPARSE
+
+
+class Automaton:
+    def __init__(self,
+                 topology: Topology,
+                 rule: Rule,
+                 cells: Iterable[Cell],
+                 backend: Optional[str] = None):
+        """
+        Automaton starting with the given live cells, computed by the given backend (`DENSE` or `SPARSE`),
+        or by the backend suiting the density of the live cells.
+        """
+        self.topology = topology
+        self.rule = rule
+        self.generation = 0
+        self._last_generation: Optional[int] = None
+        self._forced_backend = backend
+        self._backend = self._make_backend(set(cells))
+
+    @property
+    def backend(self) -> str:
+        return self._backend.name
+
+    @property
+    def population(self) -> int:
+        return self._backend.population
+
+    def cells(self) -> Set[Cell]:
+        return self._backend.cells()
+
+    def step(self) -> bool:
+        """
+        Compute the next generation, telling if any cell changed.
+        """
+        if self._forced_backend is None and self.generation and self.generation % RESELECT_EVERY == 0:
+            cells = self.cells()
+            if choose_backend(self.topology, self.rule, cells) != self.backend:
+                self._backend = self._make_backend(cells)
+
+        self.generation += 1
+        return self._backend.step()
+
+    def run(self, generations: Optional[int] = None) -> int:
+        """
+        Compute the given number of generations, or compute generations until they do not change anymore.
+        Give the number of generations computed.
+        """
+        start = self.generation
+        self._last_generation = None if generations is None else start + generations
+        self._backend.plan(self._steps_ahead())
+
+        while generations is None or self.generation - start < generations:
+            if not self.step() and generations is None:
+                break
+
+        return self.generation - start
+
+    def _steps_ahead(self) -> int:
+        if self._last_generation is None:
+            return DENSE_CHUNK
+
+        return self._last_generation - self.generation
+
+    def _make_backend(self, cells: Set[Cell]) -> Backend:
+        backend = self._forced_backend or choose_backend(self.topology, self.rule, cells)
+        if backend == DENSE:
+            dense_backend = NumpyBackend if use_numpy() else DenseBackend
+            return dense_backend(self.topology, self.rule, cells, steps_ahead=max(1, min(self._steps_ahead(), DENSE_CHUNK)))
+        if backend == SPARSE:
+            return SparseBackend(self.topology, self.rule, cells)
+
+        raise ValueError(f"unknown backend {backend}")
@@ -0,0 +1,140 @@
+"""
+Budgets of wall time, iterations and memory for the solvers, enforced by cooperative checkpoints.
+
+The loops which can run away on adversarial inputs are calling `checkpoint` on every step (or every block
+of steps):
+
+    def _do_jigsaw_rec(...):
+        checkpoint("jigsaw", placed_tiles=len(used_tile_ids))
+
+It does nothing when no budget is active, and raises `BudgetExceeded` once a limit of the active budget
+is hit. The loops too tight to pay a function call per step are checking the budget themselves:
+
+    budget = current_budget()
+    while deck1 and deck2:
+        if budget is not None:
+            budget.check("recursive combat", 1, {"depth": depth})
+
+and a budget is set around the code to bound:
+
+    with Budget(wall_s=10, iterations=10 ** 8, memory_mib=512):
+        answer = solve_part2(decks)
+
+The exception is carrying the progress of the solver when it was stopped (the checkpoint, the iterations,
+the elapsed time, the memory, and the stats given to the last checkpoint), which the runner is giving back
+as the result of the part.
+"""
+import argparse
+import time
+import tracemalloc
+from contextvars import ContextVar
+from typing import Optional, Dict, Any
+
+_active_budget: ContextVar[Optional["Budget"]] = ContextVar("active_budget", default=None)
+
+
+class BudgetExceeded(Exception):
+    def __init__(self, limit: str, progress: Dict[str, Any]):
+        super().__init__(
+            f"{limit} budget exceeded in {progress['checkpoint']} after {progress['iterations']} iterations "
+            f"and {progress['elapsed_s']:.1f}s"
+        )
+        self.limit = limit
+        self.progress = progress
+
+
+class Budget:
+    """
+    Limits for the code running in its context, any of them can be left unbounded.
+
+    The memory is measured with tracemalloc, which is started for the budget if it is not already tracing,
+    so a memory budget is slowing down the solver.
+    """
+
+    def __init__(self,
+                 wall_s: Optional[float] = None,
+                 iterations: Optional[int] = None,
+                 memory_mib: Optional[float] = None):
+        self.wall_s = wall_s
+        self.max_iterations = iterations
+        self.memory_mib = memory_mib
+        self.iterations = 0
+        self._start = 0.0
+        self._memory_baseline = 0
+        self._started_tracing = False
+        self._token = None
+
+    def __enter__(self) -> "Budget":
+        self.iterations = 0
+        if self.memory_mib is not None:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            self._memory_baseline = tracemalloc.get_traced_memory()[0]
+        self._token = _active_budget.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_) -> None:
+        _active_budget.reset(self._token)
+        self._token = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @property
+    def elapsed_s(self) -> float:
+        return time.perf_counter() - self._start
+
+    @property
+    def memory_used_mib(self) -> float:
+        if not tracemalloc.is_tracing():
+            return 0
+        return max(0, tracemalloc.get_traced_memory()[0] - self._memory_baseline) / (1024 * 1024)
+
+    def check(self, where: str, steps: int, stats: Dict[str, Any]) -> None:
+        self.iterations += steps
+        if self.max_iterations is not None and self.iterations > self.max_iterations:
+            self._exceeded("iterations", where, stats)
+        if self.wall_s is not None and self.elapsed_s > self.wall_s:
+            self._exceeded("wall time", where, stats)
+        if self.memory_mib is not None and self.memory_used_mib > self.memory_mib:
+            self._exceeded("memory", where, stats)
+
+    def _exceeded(self, limit: str, where: str, stats: Dict[str, Any]) -> None:
+        raise BudgetExceeded(limit, {
+            "checkpoint": where,
+            "iterations": self.iterations,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "memory_mib": round(self.memory_used_mib, 3),
+            **stats,
+        })
+
+
+def checkpoint(where: str, steps: int = 1, **stats: Any) -> None:
+    """
+    Count `steps` iterations against the active budget, if any, and stop the solver when it is exceeded.
+    """
+    budget = _active_budget.get()
+    if budget is not None:
+        budget.check(where, steps, stats)
+
+
+def current_budget() -> Optional[Budget]:
+    return _active_budget.get()
+
+
+def add_budget_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--time-budget", type=float, default=None, metavar="SECONDS",
+                        help="stop a part after this wall time")
+    parser.add_argument("--iteration-budget", type=int, default=None, metavar="N",
+                        help="stop a part after this number of iterations of its main loop")
+    parser.add_argument("--memory-budget", type=float, default=None, metavar="MIB",
+                        help="stop a part allocating more memory than this (traced, so slower)")
+
+
+def budget_from_arguments(args: argparse.Namespace) -> Optional[Budget]:
+    if args.time_budget is None and args.iteration_budget is None and args.memory_budget is None:
+        return None
+
+    return Budget(wall_s=args.time_budget, iterations=args.iteration_budget, memory_mib=args.memory_budget)
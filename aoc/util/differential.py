@@ -0,0 +1,149 @@
+"""
+Differential testing of an optimised engine against the reference one it is replacing.
+
+Both engines are run on the same randomly generated inputs, and any divergence (a different answer,
+or one of them raising while the other does not) is minimised before being reported:
+
+    check_equivalence(
+        reference=play_game,
+        candidate=play_game_with_array,
+        generate=lambda rnd: ([rnd.randint(0, 9) for _ in range(rnd.randint(1, 6))], rnd.randint(1, 500)),
+        shrink=shrink_args(partial(shrink_list, min_length=1), shrink_int),
+    )
+
+The inputs are the tuples of arguments given to the engines. They are generated from a `Random` seeded
+with `seed + case_index`, so a failing case can be replayed from its seed alone. Without an explicit budget,
+`AOC_DIFFERENTIAL_BUDGET` inputs are checked (default: 200), to run longer campaigns than the test suite.
+"""
+import os
+from random import Random
+from typing import Callable, Any, Tuple, Iterable, Iterator, List, Optional
+
+Args = Tuple[Any, ...]
+Shrinker = Callable[[Any], Iterable[Any]]
+
+BUDGET_ENV = "AOC_DIFFERENTIAL_BUDGET"
+DEFAULT_BUDGET = 200
+# bound of the number of shrinks tried, so a slow engine is not minimised forever
+MAX_SHRINKS = 2000
+
+
+class Divergence(AssertionError):
+    def __init__(self, seed: int, args: Args, minimal_args: Args, reference: Any, candidate: Any):
+        super().__init__(
+            f"engines diverging for the case of seed {seed}, minimised to {minimal_args!r}: "
+            f"reference gives {reference!r}, candidate gives {candidate!r}"
+        )
+        self.seed = seed
+        self.args = args
+        self.minimal_args = minimal_args
+        self.reference = reference
+        self.candidate = candidate
+
+
+def _outcome(engine: Callable[..., Any], args: Args) -> Tuple[str, Any]:
+    try:
+        return "answer", engine(*args)
+    except Exception as e:  # raising is an outcome too, which the other engine has to share
+        return "error", type(e).__name__
+
+
+def _diverge(reference: Callable[..., Any], candidate: Callable[..., Any], args: Args) -> bool:
+    return _outcome(reference, args) != _outcome(candidate, args)
+
+
+def minimise(reference: Callable[..., Any],
+             candidate: Callable[..., Any],
+             args: Args,
+             shrink: Callable[[Args], Iterable[Args]]) -> Args:
+    """
+    Shrink a diverging input, greedily, as long as one of its shrinks is still diverging.
+    """
+    tries = 0
+    shrunk = True
+    while shrunk and tries < MAX_SHRINKS:
+        shrunk = False
+        for smaller in shrink(args):
+            tries += 1
+            if _diverge(reference, candidate, smaller):
+                args, shrunk = smaller, True
+                break
+            if tries >= MAX_SHRINKS:
+                break
+
+    return args
+
+
+def check_equivalence(reference: Callable[..., Any],
+                      candidate: Callable[..., Any],
+                      generate: Callable[[Random], Args],
+                      shrink: Optional[Callable[[Args], Iterable[Args]]] = None,
+                      budget: Optional[int] = None,
+                      seed: int = 0) -> int:
+    """
+    Compare the engines on `budget` generated inputs, raising a `Divergence` with the minimised input at the
+    first one they do not agree on, and give the number of inputs checked.
+    """
+    if budget is None:
+        budget = int(os.environ.get(BUDGET_ENV, DEFAULT_BUDGET))
+
+    for case_seed in range(seed, seed + budget):
+        args = generate(Random(case_seed))
+        if _diverge(reference, candidate, args):
+            minimal_args = minimise(reference, candidate, args, shrink) if shrink else args
+            raise Divergence(
+                case_seed,
+                args,
+                minimal_args,
+                _outcome(reference, minimal_args)[1],
+                _outcome(candidate, minimal_args)[1]
+            )
+
+    return budget
+
+
+def shrink_int(value: int) -> Iterator[int]:
+    """
+    Smaller integers, closer to 0, the closest first.
+    """
+    if value == 0:
+        return
+    yield 0
+    sign = 1 if value > 0 else -1
+    distance = abs(value) // 2
+    while distance:
+        yield value - sign * distance
+        distance //= 2
+
+
+def shrink_list(values: List[Any],
+                shrink_item: Optional[Shrinker] = shrink_int,
+                min_length: int = 0) -> Iterator[List[Any]]:
+    """
+    Shorter lists (without their halves, then without a single item), down to `min_length`, then lists
+    with a smaller item.
+    """
+    length = len(values)
+    chunk = min(length // 2, length - min_length)
+    while chunk > 0:
+        for start in range(0, length - chunk + 1, chunk):
+            yield values[:start] + values[start + chunk:]
+        chunk //= 2
+
+    if shrink_item:
+        for idx, value in enumerate(values):
+            for smaller in shrink_item(value):
+                yield values[:idx] + [smaller] + values[idx + 1:]
+
+
+def shrink_args(*shrinkers: Optional[Shrinker]) -> Callable[[Args], Iterator[Args]]:
+    """
+    Shrink a tuple of arguments one argument at a time, with the shrinker of its position (None to keep it).
+    """
+    def shrink(args: Args) -> Iterator[Args]:
+        for idx, (arg, shrinker) in enumerate(zip(args, shrinkers)):
+            if shrinker:
+                for smaller in shrinker(arg):
+                    yield args[:idx] + (smaller,) + args[idx + 1:]
+
+    return shrink
@@ -0,0 +1,73 @@
+"""
+Cost of the imports of a statement, measured with `python -X importtime` in a fresh interpreter, so the
+modules already imported by the caller are not hiding anything.
+
+    for timing in slowest_imports(measure_imports("import aoc.day4.passport_processing")):
+        print(timing)
+"""
+import os
+import subprocess
+import sys
+from typing import NamedTuple, List
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PREFIX = "import time:"
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    # how deep the module is in the tree of imports, 0 for the ones imported by the statement itself
+    depth: int
+
+
+def measure_imports(statement: str) -> List[ImportTime]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [_ROOT, env.get("PYTHONPATH")]))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"unable to run {statement!r}: {process.stderr.strip().splitlines()[-1:]}")
+
+    return [
+        timing
+        for line in process.stderr.splitlines()
+        if line.startswith(_PREFIX)
+        for timing in _parse_line(line[len(_PREFIX):])
+    ]
+
+
+def _parse_line(line: str) -> List[ImportTime]:
+    self_us, cumulative_us, name = line.split("|")
+    if not self_us.strip().isdigit():
+        # the header
+        return []
+
+    depth = (len(name) - len(name.lstrip()) - 1) // 2
+    return [ImportTime(name.strip(), int(self_us), int(cumulative_us), depth)]
+
+
+def slowest_imports(timings: List[ImportTime], limit: int = 20) -> List[ImportTime]:
+    return sorted(timings, key=lambda timing: timing.self_us, reverse=True)[:limit]
+
+
+def format_imports(timings: List[ImportTime], limit: int = 20) -> str:
+    total_us = sum(timing.self_us for timing in timings)
+    aoc_us = sum(timing.self_us for timing in timings if timing.module.split(".")[0] == "aoc")
+    width = max([len("module")] + [len(timing.module) for timing in timings])
+    lines = [
+        f"{'module'.ljust(width)} | self (ms) | cumulative (ms)",
+        f"{'-' * width}-+-----------+----------------",
+        *(
+            f"{timing.module.ljust(width)} | {timing.self_us / 1000:9.1f} | {timing.cumulative_us / 1000:15.1f}"
+            for timing in slowest_imports(timings, limit)
+        ),
+        f"{len(timings)} modules imported in {total_us / 1000:.1f}ms, {aoc_us / 1000:.1f}ms in aoc",
+    ]
+
+    return "\n".join(lines)
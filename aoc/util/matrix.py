@@ -1,4 +1,4 @@
-from typing import List, TypeVar
+from typing import List, TypeVar, Optional, Iterable, Dict, Union, Tuple, Iterator
 
 T = TypeVar('T')
 
@@ -12,3 +12,195 @@ def initialize_matrix(fill: T, row: int, col: int = None) -> List[List[T]]:
         ]
         for _ in range(row)
     ]
+
+
+class Grid:
+    """
+    A 2D grid of bytes, stored row after row in a single bytearray.
+
+    The cells are addressed through an offset and a stride per axis, so a rotated, flipped or
+    transposed grid is only a view sharing the buffer of the original grid: no cell is copied,
+    and writing in a view is writing in the original grid.
+    Rows and columns are given as memoryviews on the buffer, also without copying.
+    """
+    __slots__ = ("data", "height", "width", "_offset", "_row_stride", "_col_stride")
+
+    def __init__(self,
+                 height: int,
+                 width: int,
+                 fill: int = 0,
+                 data: Optional[bytearray] = None,
+                 offset: int = 0,
+                 row_stride: Optional[int] = None,
+                 col_stride: int = 1):
+        self.data = data if data is not None else bytearray([fill]) * (height * width)
+        self.height = height
+        self.width = width
+        self._offset = offset
+        self._row_stride = row_stride if row_stride is not None else width
+        self._col_stride = col_stride
+
+    @staticmethod
+    def parse(lines: Iterable[str], mapping: Optional[Dict[str, int]] = None) -> 'Grid':
+        """
+        Parse the non blank lines of a drawing, every character being stored as its code,
+        or as the value it is mapped to.
+        """
+        rows = [line.rstrip("\n").encode() for line in lines if line.strip()]
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("all the rows of a grid should have the same width")
+
+        data = bytearray(b"".join(rows))
+        if mapping:
+            data = data.translate(bytes(
+                mapping.get(chr(code), code)
+                for code in range(256)
+            ))
+
+        return Grid(len(rows), width, data=data)
+
+    @property
+    def is_compact(self) -> bool:
+        return self._offset == 0 and self._row_stride == self.width and self._col_stride == 1
+
+    def index(self, row: int, col: int) -> int:
+        return self._offset + row * self._row_stride + col * self._col_stride
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def get(self, row: int, col: int, default: Optional[int] = None) -> Optional[int]:
+        """
+        Value of a cell, or the default value for a cell out of the grid.
+        """
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return self.data[self._offset + row * self._row_stride + col * self._col_stride]
+
+        return default
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, key: Union[int, Tuple[int, int]]) -> Union[int, memoryview]:
+        if isinstance(key, tuple):
+            row, col = key
+            return self.data[self._offset + row * self._row_stride + col * self._col_stride]
+
+        return self.row(key)
+
+    def __setitem__(self, key: Tuple[int, int], value: int) -> None:
+        row, col = key
+        self.data[self._offset + row * self._row_stride + col * self._col_stride] = value
+
+    def __iter__(self) -> Iterator[memoryview]:
+        return self.rows()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+
+        return (self.height, self.width) == (other.height, other.width) and \
+            all(a == b for a, b in zip(self.rows(), other.rows()))
+
+    def _view(self, start: int, length: int, step: int) -> memoryview:
+        stop = start + length * step
+        # a negative stop would wrap around, when walking backward to the first cell of the buffer
+        return memoryview(self.data)[start:stop if stop >= 0 else None:step]
+
+    def row(self, row: int) -> memoryview:
+        if not 0 <= row < self.height:
+            raise IndexError(f"row {row} out of the grid")
+
+        return self._view(self.index(row, 0), self.width, self._col_stride)
+
+    def column(self, col: int) -> memoryview:
+        if not 0 <= col < self.width:
+            raise IndexError(f"column {col} out of the grid")
+
+        return self._view(self.index(0, col), self.height, self._row_stride)
+
+    def rows(self) -> Iterator[memoryview]:
+        return (self.row(row) for row in range(self.height))
+
+    def neighbors(self, row: int, col: int, diagonals: bool = True) -> Iterator[Tuple[int, int]]:
+        """
+        Coordinates of the neighbors of a cell, that are in the grid.
+        """
+        for d_row, d_col in (_DIRECTIONS_WITH_DIAGONALS if diagonals else _DIRECTIONS):
+            n_row, n_col = row + d_row, col + d_col
+            if 0 <= n_row < self.height and 0 <= n_col < self.width:
+                yield n_row, n_col
+
+    def rotate(self) -> 'Grid':
+        """
+        View of the grid rotated by 90° clockwise.
+        """
+        return Grid(
+            self.width,
+            self.height,
+            data=self.data,
+            offset=self.index(self.height - 1, 0),
+            row_stride=self._col_stride,
+            col_stride=-self._row_stride
+        )
+
+    def flip(self) -> 'Grid':
+        """
+        View of the grid flipped upside down.
+        """
+        return Grid(
+            self.height,
+            self.width,
+            data=self.data,
+            offset=self.index(self.height - 1, 0),
+            row_stride=-self._row_stride,
+            col_stride=self._col_stride
+        )
+
+    def transpose(self) -> 'Grid':
+        return Grid(
+            self.width,
+            self.height,
+            data=self.data,
+            offset=self._offset,
+            row_stride=self._col_stride,
+            col_stride=self._row_stride
+        )
+
+    def orientations(self) -> Iterator['Grid']:
+        """
+        The 8 views of the grid, rotated and flipped.
+        """
+        for grid in (self, self.flip()):
+            for _ in range(4):
+                yield grid
+                grid = grid.rotate()
+
+    def copy(self) -> 'Grid':
+        """
+        Compact copy of the grid (or of the view), not sharing its buffer anymore.
+        """
+        if self.is_compact:
+            return Grid(self.height, self.width, data=self.data[:self.height * self.width])
+
+        return Grid(self.height, self.width, data=bytearray(b"".join(row.tobytes() for row in self.rows())))
+
+    def count(self, value: int) -> int:
+        if self.is_compact:
+            return self.data.count(value)
+
+        return sum(row.tobytes().count(value) for row in self.rows())
+
+    def to_lines(self, mapping: Optional[Dict[int, str]] = None) -> List[str]:
+        return [
+            "".join(mapping.get(cell, chr(cell)) for cell in row) if mapping else row.tobytes().decode()
+            for row in self.rows()
+        ]
+
+    def __repr__(self) -> str:
+        return f"Grid({self.height}x{self.width})"
+
+
+_DIRECTIONS = ((-1, 0), (0, -1), (0, 1), (1, 0))
+_DIRECTIONS_WITH_DIAGONALS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
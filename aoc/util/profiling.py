@@ -0,0 +1,187 @@
+"""
+Instrumentation of the phases of a puzzle (parse, build, solve...).
+
+A phase is timed wherever it is used, as a context manager or as a decorator:
+
+    with phase("parse") as parsing:
+        tiles = _parse(lines)
+    print(f"parsed in {parsing.wall_ms}ms")
+
+    @phase("build")
+    def _do_jigsaw(...):
+
+and, when a `Profiler` is active, every phase is also recorded into it, optionally with its cProfile
+stats and its tracemalloc peak:
+
+    with Profiler("day20", memory=True) as profiler:
+        ...
+    print(profiler.report())
+"""
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Optional, List, Callable, TypeVar, Dict, Any
+
+T = TypeVar("T")
+
+_active_profiler: ContextVar[Optional["Profiler"]] = ContextVar("active_profiler", default=None)
+
+
+@dataclass
+class PhaseRecord:
+    name: str
+    wall_ms: float = 0
+    # memory allocated at the peak of the phase, when the profiler is tracing the memory
+    peak_kib: Optional[float] = None
+    # only the outermost phase is profiled, as cProfile can not be nested
+    stats: Optional[pstats.Stats] = None
+
+    def format_stats(self, limit: int = 20, sort_by: str = "cumulative") -> str:
+        if not self.stats:
+            return ""
+
+        stream = io.StringIO()
+        self.stats.stream = stream
+        self.stats.sort_stats(sort_by).print_stats(limit)
+        return stream.getvalue()
+
+
+@dataclass
+class _MemoryFrame:
+    baseline: int
+    peak: int = 0
+
+
+class Profiler:
+    def __init__(self, label: str = "", cprofile: bool = False, memory: bool = False):
+        self.label = label
+        self.cprofile = cprofile
+        self.memory = memory
+        self.phases: List[PhaseRecord] = []
+        self._memory_frames: List[_MemoryFrame] = []
+        self._profiling = False
+        self._started_tracing = False
+        self._token = None
+
+    def __enter__(self) -> "Profiler":
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._token = _active_profiler.set(self)
+        return self
+
+    def __exit__(self, *_) -> None:
+        _active_profiler.reset(self._token)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def wall_ms(self, name: str) -> float:
+        return sum(record.wall_ms for record in self.phases if record.name == name)
+
+    def peak_kib(self, name: str) -> Optional[float]:
+        peaks = [record.peak_kib for record in self.phases if record.name == name and record.peak_kib is not None]
+        return max(peaks) if peaks else None
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        summary: Dict[str, Dict[str, Any]] = {}
+        for record in self.phases:
+            summary[record.name] = {
+                "wall_ms": self.wall_ms(record.name),
+                "peak_kib": self.peak_kib(record.name),
+                "calls": sum(1 for r in self.phases if r.name == record.name),
+            }
+
+        return summary
+
+    def report(self, stats_limit: int = 20) -> str:
+        lines = [f"{self.label}:" if self.label else "profile:"]
+        for name, summary in self.as_dict().items():
+            peak = f", peak {summary['peak_kib']:.0f}KiB" if summary["peak_kib"] is not None else ""
+            lines.append(f"  {name}: {summary['wall_ms']:.1f}ms in {summary['calls']} call(s){peak}")
+        for record in self.phases:
+            if record.stats:
+                lines.append(f"  -- {record.name} --")
+                lines.append(record.format_stats(stats_limit))
+
+        return "\n".join(lines)
+
+    def _enter_phase(self, record: PhaseRecord) -> Optional[cProfile.Profile]:
+        self.phases.append(record)
+
+        if self.memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if self._memory_frames:
+                self._memory_frames[-1].peak = max(self._memory_frames[-1].peak, peak)
+            tracemalloc.reset_peak()
+            self._memory_frames.append(_MemoryFrame(baseline=current))
+
+        if self.cprofile and not self._profiling:
+            self._profiling = True
+            profile = cProfile.Profile()
+            profile.enable()
+            return profile
+
+        return None
+
+    def _exit_phase(self, record: PhaseRecord, profile: Optional[cProfile.Profile]) -> None:
+        if profile:
+            profile.disable()
+            self._profiling = False
+            record.stats = pstats.Stats(profile)
+
+        if self._memory_frames:
+            _, peak = tracemalloc.get_traced_memory()
+            frame = self._memory_frames.pop()
+            frame.peak = max(frame.peak, peak)
+            record.peak_kib = max(0, frame.peak - frame.baseline) / 1024
+            if self._memory_frames:
+                self._memory_frames[-1].peak = max(self._memory_frames[-1].peak, frame.peak)
+
+
+@dataclass
+class _PhaseContext:
+    record: PhaseRecord
+    start: float
+    profiler: Optional[Profiler] = None
+    profile: Optional[cProfile.Profile] = field(default=None)
+
+
+class phase:
+    """
+    Time a phase, as a context manager (giving the record of the phase) or as a decorator.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._contexts: List[_PhaseContext] = []
+
+    def __enter__(self) -> PhaseRecord:
+        record = PhaseRecord(self.name)
+        profiler = _active_profiler.get()
+        profile = profiler._enter_phase(record) if profiler else None
+        self._contexts.append(_PhaseContext(record, time.perf_counter(), profiler, profile))
+        return record
+
+    def __exit__(self, *_) -> None:
+        context = self._contexts.pop()
+        context.record.wall_ms = (time.perf_counter() - context.start) * 1000
+        if context.profiler:
+            context.profiler._exit_phase(context.record, context.profile)
+
+    def __call__(self, fn: Callable[..., T]) -> Callable[..., T]:
+        @wraps(fn)
+        def wrapper(*args, **kwargs) -> T:
+            with phase(self.name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+
+def current_profiler() -> Optional[Profiler]:
+    return _active_profiler.get()
@@ -1,3 +1,5 @@
+import mmap
+import os
 from typing import Iterator, List, Iterable
 
 
@@ -14,3 +16,22 @@ def generate_paragraphs(raw_entries: Iterable[str]) -> Iterator[List[str]]:
 
     if buf:
         yield buf
+
+
+def read_lines(path: str, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Stream the lines of a file through a memory map: only the current line is decoded
+    as a python string, so files of any size can be read in constant memory.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # an empty file can not be mapped
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for raw_line in iter(mapped.readline, b""):
+                yield raw_line.decode(encoding)
+
+
+def read_paragraphs(path: str, encoding: str = "utf-8") -> Iterator[List[str]]:
+    return generate_paragraphs(read_lines(path, encoding))
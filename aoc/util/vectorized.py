@@ -0,0 +1,47 @@
+"""
+Optional NumPy backend.
+
+NumPy is not a dependency of the project: when it is installed, the grid automata and a few numeric solvers
+(the trees of day 3, the boarding passes of day 5 and the tickets of day 16) are vectorised with it, otherwise
+they are running their pure Python code.
+
+The backend is chosen with the `AOC_BACKEND` environment variable (or the `--backend` option of the runner):
+- `auto` (default): NumPy when it can be imported, pure Python otherwise,
+- `numpy`: NumPy, failing if it is not installed,
+- `python`: pure Python, even if NumPy is installed.
+"""
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BACKEND_ENV = "AOC_BACKEND"
+
+AUTO = "auto"
+NUMPY = "numpy"
+PYTHON = "python"
+BACKENDS = (AUTO, NUMPY, PYTHON)
+
+
+def use_numpy() -> bool:
+    backend = os.environ.get(BACKEND_ENV) or AUTO
+    if backend == PYTHON:
+        return False
+    if backend == NUMPY and numpy is None:
+        raise ImportError(f"{BACKEND_ENV}={NUMPY} but numpy is not installed")
+
+    return numpy is not None
+
+
+def set_backend(backend: str) -> None:
+    """
+    Select the backend, for this process and for the processes it is starting.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend}, expected one of {', '.join(BACKENDS)}")
+    if backend == NUMPY and numpy is None:
+        raise ImportError("the numpy backend needs numpy to be installed")
+
+    os.environ[BACKEND_ENV] = backend
@@ -0,0 +1,858 @@
+"""
+Seeded generators of puzzle inputs, of any size, for every day of the calendar.
+
+Every generator is returning the lines of the input, and the answers of the parts whenever they
+are known by construction (a planted pair of expenses, a program with a single corruption...).
+
+    python -m benchmarks.generators 20 12 --seed 42 --output /tmp/day20
+
+is writing `/tmp/day20/input` and, next to it, `/tmp/day20/answers.json`.
+"""
+import argparse
+import json
+import os
+import string
+import sys
+from functools import reduce
+from itertools import product
+from math import prod
+from random import Random
+from typing import NamedTuple, List, Dict, Any, Callable, Optional, Set, Tuple
+
+
+class Generated(NamedTuple):
+    lines: List[str]
+    # answers known by construction, by part number
+    answers: Dict[int, Any] = {}
+
+
+Generator = Callable[[int, Random], Generated]
+
+
+def _lines(raw_lines: List[str]) -> List[str]:
+    return [
+        line + "\n"
+        for line in raw_lines
+    ]
+
+
+def _random_word(rnd: Random, min_length: int = 4, max_length: int = 8) -> str:
+    return "".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(min_length, max_length)))
+
+
+def _unique_words(rnd: Random, count: int, min_length: int = 4, max_length: int = 8) -> List[str]:
+    words: Set[str] = set()
+    while len(words) < count:
+        words.add(_random_word(rnd, min_length, max_length))
+
+    return sorted(words)
+
+
+def generate_day1(size: int, rnd: Random) -> Generated:
+    """
+    Every filler entry is above 1010, so no pair and no triple of fillers can sum to 2020: the only
+    solutions are the planted ones, a pair (one small entry and its complement) and a triple of small entries.
+    """
+    target = 2020
+    pair_small = rnd.randint(100, 1000)
+    triple = [rnd.randint(600, 700), rnd.randint(600, 700)]
+    triple.append(target - sum(triple))
+    smalls = [pair_small, *triple]
+    if len(set(smalls)) != len(smalls) or pair_small in (triple[0] + triple[1], triple[0] + triple[2], triple[1] + triple[2]):
+        return generate_day1(size, rnd)
+
+    pair_big = target - pair_small
+    forbidden = {target - small for small in triple}
+    forbidden |= {target - a - b for a, b in product(smalls, smalls) if a != b}
+    forbidden.add(pair_big)
+    candidates = [value for value in range(1011, 2020) if value not in forbidden]
+    fillers = [rnd.choice(candidates) for _ in range(max(0, size - 5))]
+
+    numbers = fillers + smalls + [pair_big]
+    rnd.shuffle(numbers)
+
+    return Generated(
+        lines=_lines(list(map(str, numbers))),
+        answers={
+            1: pair_small * pair_big,
+            2: prod(triple)
+        }
+    )
+
+
+def generate_day2(size: int, rnd: Random) -> Generated:
+    lines = []
+    valid = 0
+    valid_part2 = 0
+    for _ in range(size):
+        char = rnd.choice(string.ascii_lowercase[:6])
+        password = "".join(rnd.choices(string.ascii_lowercase[:6], k=rnd.randint(6, 20)))
+        lowest = rnd.randint(1, len(password) - 1)
+        highest = rnd.randint(lowest + 1, len(password))
+        lines.append(f"{lowest}-{highest} {char}: {password}")
+
+        valid += lowest <= password.count(char) <= highest
+        valid_part2 += (password[lowest - 1] == char) != (password[highest - 1] == char)
+
+    return Generated(lines=_lines(lines), answers={1: valid, 2: valid_part2})
+
+
+def generate_day3(size: int, rnd: Random, width: int = 31, density: float = 0.2) -> Generated:
+    return Generated(
+        lines=_lines([
+            "".join("#" if rnd.random() < density else "." for _ in range(width))
+            for _ in range(size)
+        ])
+    )
+
+
+PASSPORT_EYE_COLORS = ["amb", "blu", "brn", "gry", "grn", "hzl", "oth"]
+
+
+def _valid_passport_fields(rnd: Random) -> Dict[str, str]:
+    height = f"{rnd.randint(150, 193)}cm" if rnd.random() < 0.5 else f"{rnd.randint(59, 76)}in"
+    return {
+        "byr": str(rnd.randint(1920, 2002)),
+        "iyr": str(rnd.randint(2010, 2020)),
+        "eyr": str(rnd.randint(2020, 2030)),
+        "hgt": height,
+        "hcl": "#" + "".join(rnd.choices("0123456789abcdef", k=6)),
+        "ecl": rnd.choice(PASSPORT_EYE_COLORS),
+        "pid": "".join(rnd.choices(string.digits, k=9)),
+    }
+
+
+PASSPORT_INVALID_VALUES = {
+    "byr": ["1919", "2003", "19a0"],
+    "iyr": ["2009", "2021"],
+    "eyr": ["2019", "2031"],
+    "hgt": ["149cm", "194cm", "58in", "77in", "170", "60cn"],
+    "hcl": ["#12345g", "123abc", "#1234567"],
+    "ecl": ["wat", "red", "am"],
+    "pid": ["12345678", "0123456789", "12345678a"],
+}
+
+
+def generate_day4(size: int, rnd: Random) -> Generated:
+    """
+    A third of the passports are missing a required field, a third are complete but with one invalid value.
+    """
+    paragraphs = []
+    complete = 0
+    valid = 0
+    for _ in range(size):
+        fields = _valid_passport_fields(rnd)
+        if rnd.random() < 0.5:
+            fields["cid"] = str(rnd.randint(100, 999))
+
+        kind = rnd.randrange(3)
+        if kind == 0:
+            del fields[rnd.choice(list(PASSPORT_INVALID_VALUES.keys()))]
+        else:
+            complete += 1
+            if kind == 1:
+                key = rnd.choice(list(PASSPORT_INVALID_VALUES.keys()))
+                fields[key] = rnd.choice(PASSPORT_INVALID_VALUES[key])
+            else:
+                valid += 1
+
+        entries = [f"{key}:{value}" for key, value in fields.items()]
+        rnd.shuffle(entries)
+        raw_lines = []
+        while entries:
+            cut = rnd.randint(1, len(entries))
+            raw_lines.append(" ".join(entries[:cut]))
+            entries = entries[cut:]
+        paragraphs.append("\n".join(raw_lines))
+
+    return Generated(lines=_lines("\n\n".join(paragraphs).split("\n")), answers={1: complete, 2: valid})
+
+
+def _encode_boarding_pass(seat_id: int) -> str:
+    row, column = divmod(seat_id, 8)
+    return format(row, "07b").replace("0", "F").replace("1", "B") + \
+        format(column, "03b").replace("0", "L").replace("1", "R")
+
+
+def generate_day5(size: int, rnd: Random) -> Generated:
+    """
+    A full flight of `size` consecutive seats, but one, somewhere in the plane (there are only 1024 seats).
+    """
+    if not 3 <= size <= 1022:
+        raise ValueError(f"A plane is having between 3 and 1022 taken seats, not {size}")
+
+    # the last seat id is `first + size`, up to 1023
+    first = rnd.randint(1, 1023 - size)
+    seat_ids = list(range(first, first + size + 1))
+    missing = seat_ids.pop(rnd.randint(1, len(seat_ids) - 2))
+    rnd.shuffle(seat_ids)
+
+    return Generated(
+        lines=_lines(list(map(_encode_boarding_pass, seat_ids))),
+        answers={1: first + size, 2: missing}
+    )
+
+
+def generate_day6(size: int, rnd: Random) -> Generated:
+    paragraphs = []
+    anyone = 0
+    everyone = 0
+    for _ in range(size):
+        people = [
+            set(rnd.sample(string.ascii_lowercase, rnd.randint(1, 10)))
+            for _ in range(rnd.randint(1, 5))
+        ]
+        anyone += len(reduce(set.union, people))
+        everyone += len(reduce(set.intersection, people))
+        paragraphs.append("\n".join("".join(sorted(answers, key=lambda _: rnd.random())) for answers in people))
+
+    return Generated(lines=_lines("\n\n".join(paragraphs).split("\n")), answers={1: anyone, 2: everyone})
+
+
+BAG_ADJECTIVES = ["light", "dark", "bright", "muted", "shiny", "faded", "dotted", "vibrant", "clear", "dim",
+                  "drab", "dull", "mirrored", "pale", "plaid", "posh", "striped", "wavy"]
+BAG_COLORS = ["red", "orange", "white", "yellow", "gold", "olive", "plum", "blue", "black", "aqua", "beige",
+              "bronze", "brown", "chartreuse", "coral", "crimson", "cyan", "fuchsia", "gray", "green", "indigo",
+              "lavender", "lime", "magenta", "maroon", "purple", "salmon", "silver", "tan", "teal", "tomato",
+              "turquoise", "violet"]
+
+
+def generate_day7(size: int, rnd: Random) -> Generated:
+    """
+    The rules are forming a DAG: a bag only contains bags defined after it. To keep the number of bags
+    inside the shiny gold bag reasonable, it only contains bags from the last layer, which are empty.
+    """
+    names = [f"{adjective} {color}" for adjective, color in product(BAG_ADJECTIVES, BAG_COLORS)]
+    names.remove("shiny gold")
+    rnd.shuffle(names)
+    while len(names) < size:
+        names.append(f"{rnd.choice(BAG_ADJECTIVES)}{len(names)} {rnd.choice(BAG_COLORS)}")
+    names = names[:size - 1]
+
+    gold_index = len(names) // 2
+    names.insert(gold_index, "shiny gold")
+    leaves_start = len(names) - max(1, len(names) // 10)
+
+    contents: Dict[str, List[Tuple[int, str]]] = {}
+    for idx, name in enumerate(names):
+        if idx >= leaves_start:
+            children = []
+        elif idx == gold_index:
+            children = rnd.sample(names[leaves_start:], min(3, len(names) - leaves_start))
+        else:
+            children = rnd.sample(names[idx + 1:], min(rnd.randint(0, 4), len(names) - idx - 1))
+        contents[name] = [(rnd.randint(1, 5), child) for child in children]
+
+    containers = set()
+    to_visit = ["shiny gold"]
+    while to_visit:
+        current = to_visit.pop()
+        for name, children in contents.items():
+            if name not in containers and any(child == current for _, child in children):
+                containers.add(name)
+                to_visit.append(name)
+
+    lines = []
+    for name in rnd.sample(names, len(names)):
+        children = contents[name]
+        if children:
+            raw_contents = ", ".join(
+                f"{quantity} {child} bag{'s' if quantity > 1 else ''}"
+                for quantity, child in children
+            )
+        else:
+            raw_contents = "no other bags"
+        lines.append(f"{name} bags contain {raw_contents}.")
+
+    return Generated(
+        lines=_lines(lines),
+        answers={
+            1: len(containers),
+            2: sum(quantity for quantity, _ in contents["shiny gold"])
+        }
+    )
+
+
+def generate_day8(size: int, rnd: Random) -> Generated:
+    """
+    The program is a straight path through the instructions, only skipping dead blocks of `jmp +0` with forward
+    jumps, and the `nop`s are pointing backward into the path. So swapping any executed instruction is making
+    the program loop, but the corrupted one: a `nop` pointing backward that has been turned into a `jmp`.
+    The program is going on past `size` instructions until the corruption is planted.
+    """
+    program: List[str] = []
+    executed: List[int] = []
+    corruption_at_step = max(1, size // 2)
+    corrupted_pc = None
+    accumulator_at_corruption = 0
+    accumulator = 0
+    while len(program) < size or corrupted_pc is None:
+        pc = len(program)
+        choice = rnd.random()
+        if len(executed) >= corruption_at_step and corrupted_pc is None:
+            corrupted_pc = pc
+            accumulator_at_corruption = accumulator
+            offset = pc - rnd.choice(executed)
+            program.append(f"jmp -{offset}")
+            executed.append(pc)
+        elif choice < 0.5:
+            value = rnd.randint(-50, 50)
+            accumulator += value
+            program.append(f"acc {value:+d}")
+            executed.append(pc)
+        elif choice < 0.75 and executed:
+            offset = pc - rnd.choice(executed)
+            program.append(f"nop {-offset:+d}")
+            executed.append(pc)
+        else:
+            skipped = rnd.randint(1, 3)
+            program.append(f"jmp +{skipped + 1}")
+            executed.append(pc)
+            program.extend(["jmp +0"] * skipped)
+
+    return Generated(
+        lines=_lines(program),
+        answers={1: accumulator_at_corruption, 2: accumulator}
+    )
+
+
+def generate_day9(size: int, rnd: Random, preamble_size: int = 25) -> Generated:
+    """
+    Every number is the sum of two of the previous ones, except one: the sum of a contiguous run of numbers.
+    The numbers are growing quickly, as any new number is bigger than the two it is made of. The invalid number
+    is pushed back while its sum is one of the two previous ones, past `size` numbers if needed.
+    """
+    if size < preamble_size + 4:
+        raise ValueError(f"A list is having at least {preamble_size + 4} numbers, its preamble included, not {size}")
+
+    numbers = rnd.sample(range(1, 100), preamble_size)
+    invalid_at = max(preamble_size + 3, size - max(1, size // 10))
+    while len(numbers) < size or len(numbers) <= invalid_at:
+        window = numbers[-preamble_size:]
+        if len(numbers) == invalid_at:
+            start = rnd.randrange(0, len(numbers) - 3)
+            run = numbers[start:start + rnd.randint(2, 3)]
+            candidate = sum(run)
+            # twice a number of the window is refused too, the solver not telling apart the two numbers of a sum
+            sums = {a + b for a, b in product(window, window)}
+            if candidate in sums or candidate in window:
+                invalid_at += 1
+                continue
+            invalid = candidate
+        else:
+            a, b = rnd.sample(window, 2)
+            candidate = a + b
+            if candidate in window:
+                continue
+        numbers.append(candidate)
+
+    return Generated(lines=_lines(list(map(str, numbers))), answers={1: numbers[invalid_at]})
+
+
+def generate_day10(size: int, rnd: Random) -> Generated:
+    joltages = []
+    ones = 0
+    threes = 1  # to the built-in adapter
+    joltage = 0
+    for _ in range(size):
+        step = rnd.choice((1, 1, 3))
+        ones += step == 1
+        threes += step == 3
+        joltage += step
+        joltages.append(joltage)
+    rnd.shuffle(joltages)
+
+    return Generated(lines=_lines(list(map(str, joltages))), answers={1: ones * threes})
+
+
+def generate_day11(size: int, rnd: Random, width: Optional[int] = None, floor_density: float = 0.15) -> Generated:
+    width = width or size
+    return Generated(
+        lines=_lines([
+            "".join("." if rnd.random() < floor_density else "L" for _ in range(width))
+            for _ in range(size)
+        ])
+    )
+
+
+def generate_day12(size: int, rnd: Random) -> Generated:
+    lines = []
+    for _ in range(size):
+        action = rnd.choice("NSEWLRF")
+        value = rnd.choice((90, 180, 270)) if action in "LR" else rnd.randint(1, 100)
+        lines.append(f"{action}{value}")
+
+    return Generated(lines=_lines(lines))
+
+
+def _primes(count: int, minimum: int = 7) -> List[int]:
+    primes: List[int] = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+
+    return [p for p in primes if p >= minimum] or primes
+
+
+def generate_day13(size: int, rnd: Random) -> Generated:
+    """
+    The bus ids are distinct primes, so the earliest timestamp of part 2 is given by the chinese remainder theorem.
+    The timestamp is drawn again until a single bus is the first to leave after it.
+    """
+    bus_count = max(2, size // 4)
+    bus_ids = rnd.sample(_primes(bus_count * 3)[:bus_count * 2], bus_count)
+    slots: List[Optional[int]] = [None] * max(size, bus_count)
+    slots[0] = bus_ids[0]
+    for bus_id, slot in zip(bus_ids[1:], rnd.sample(range(1, len(slots)), bus_count - 1)):
+        slots[slot] = bus_id
+
+    while True:
+        timestamp = rnd.randint(1000, 10_000_000)
+        by_wait = sorted(bus_ids, key=lambda bus_id: -timestamp % bus_id)
+        best = by_wait[0]
+        if -timestamp % best != -timestamp % by_wait[1]:
+            break
+
+    modulus = prod(bus_ids)
+    # the earliest timestamp after 0: when the buses are all on time at 0, the next one is a full period later
+    earliest = sum(
+        (-offset % bus_id) * (modulus // bus_id) * pow(modulus // bus_id, -1, bus_id)
+        for offset, bus_id in enumerate(slots)
+        if bus_id
+    ) % modulus or modulus
+
+    return Generated(
+        lines=_lines([str(timestamp), ",".join(str(bus_id) if bus_id else "x" for bus_id in slots)]),
+        answers={1: best * (-timestamp % best), 2: earliest}
+    )
+
+
+def generate_day14(size: int, rnd: Random, max_floating_bits: int = 8) -> Generated:
+    lines = []
+    while len(lines) < size:
+        floating = set(rnd.sample(range(36), rnd.randint(0, max_floating_bits)))
+        lines.append("mask = " + "".join(
+            "X" if idx in floating else rnd.choice("01")
+            for idx in range(36)
+        ))
+        for _ in range(rnd.randint(1, 6)):
+            lines.append(f"mem[{rnd.randint(0, 65535)}] = {rnd.randint(0, 2 ** 30)}")
+
+    return Generated(lines=_lines(lines[:size]))
+
+
+def generate_day15(size: int, rnd: Random) -> Generated:
+    return Generated(lines=_lines([",".join(map(str, rnd.sample(range(size * 2), size)))]))
+
+
+def generate_day16(size: int, rnd: Random, number_of_fields: int = 20) -> Generated:
+    """
+    Field `k` is accepting the values up to `100 * (k + 1)`, and the values of the position holding field `k`
+    are all in range of it, with at least one too big for the previous fields: the only possible resolution
+    is by elimination from the last field. Some tickets are carrying a single value invalid for every field.
+    """
+    field_names = [
+        f"{'departure' if idx < 6 else 'field'} {name}"
+        for idx, name in enumerate(_unique_words(rnd, number_of_fields))
+    ]
+    rnd.shuffle(field_names)
+    positions = rnd.sample(range(number_of_fields), number_of_fields)  # position of every field
+
+    def upper_bound(field: int) -> int:
+        return 100 * (field + 1)
+
+    def generate_ticket() -> List[int]:
+        ticket = [0] * number_of_fields
+        for field, position in enumerate(positions):
+            ticket[position] = rnd.randint(1, upper_bound(field))
+        return ticket
+
+    lines = []
+    for field, name in enumerate(field_names):
+        split = rnd.randint(2, upper_bound(field) - 1)
+        lines.append(f"{name}: 1-{split} or {split + 1}-{upper_bound(field)}")
+
+    my_ticket = generate_ticket()
+    lines.extend(["", "your ticket:", ",".join(map(str, my_ticket)), "", "nearby tickets:"])
+
+    error_rate = 0
+    nearby = []
+    for field, position in enumerate(positions):
+        # make sure the field can not be in a position of a previous one
+        ticket = generate_ticket()
+        ticket[position] = upper_bound(field)
+        nearby.append(ticket)
+    while len(nearby) < size:
+        ticket = generate_ticket()
+        if rnd.random() < 0.2:
+            position = rnd.randrange(number_of_fields)
+            ticket[position] = upper_bound(number_of_fields) + rnd.randint(1, 100)
+            error_rate += ticket[position]
+        nearby.append(ticket)
+    rnd.shuffle(nearby)
+    lines.extend(",".join(map(str, ticket)) for ticket in nearby)
+
+    return Generated(
+        lines=_lines(lines),
+        answers={
+            1: error_rate,
+            2: prod(
+                my_ticket[positions[field]]
+                for field, name in enumerate(field_names)
+                if name.startswith("departure")
+            )
+        }
+    )
+
+
+def generate_day17(size: int, rnd: Random, density: float = 0.5) -> Generated:
+    return Generated(
+        lines=_lines([
+            "".join("#" if rnd.random() < density else "." for _ in range(size))
+            for _ in range(size)
+        ])
+    )
+
+
+def _generate_expression(rnd: Random, depth: int) -> str:
+    terms = []
+    for _ in range(rnd.randint(2, 5)):
+        if depth > 0 and rnd.random() < 0.3:
+            terms.append(f"({_generate_expression(rnd, depth - 1)})")
+        else:
+            terms.append(str(rnd.randint(1, 9)))
+
+    expression = terms[0]
+    for term in terms[1:]:
+        expression += f" {rnd.choice('+*')} {term}"
+
+    return expression
+
+
+def generate_day18(size: int, rnd: Random, max_depth: int = 3) -> Generated:
+    return Generated(lines=_lines([_generate_expression(rnd, max_depth) for _ in range(size)]))
+
+
+def generate_day19(size: int, rnd: Random, chunk_length: int = 5) -> Generated:
+    """
+    Rules 42 and 31 are matching the chunks of `chunk_length` characters with respectively an even and an odd
+    number of "b", so any chunk is matching exactly one of them and the valid messages are known by construction.
+    """
+    # rules 1 and 2 are matching a single character, then for every length the even rules and the odd rules
+    rule_a, rule_b = 1, 2
+    free_numbers = (n for n in range(3, 10_000) if n not in (8, 11, 31, 42))
+    even = {1: rule_a}
+    odd = {1: rule_b}
+    for length in range(2, chunk_length + 1):
+        even[length] = 42 if length == chunk_length else next(free_numbers)
+        odd[length] = 31 if length == chunk_length else next(free_numbers)
+    if chunk_length == 1:
+        raise ValueError("chunks should be at least 2 characters long")
+
+    rules = {
+        0: "8 11",
+        8: "42",
+        11: "42 31",
+        rule_a: '"a"',
+        rule_b: '"b"',
+    }
+    for length in range(2, chunk_length + 1):
+        rules[even[length]] = f"{even[length - 1]} {rule_a} | {odd[length - 1]} {rule_b}"
+        rules[odd[length]] = f"{even[length - 1]} {rule_b} | {odd[length - 1]} {rule_a}"
+
+    def chunk(parity: int) -> str:
+        while True:
+            candidate = "".join(rnd.choices("ab", k=chunk_length))
+            if candidate.count("b") % 2 == parity:
+                return candidate
+
+    messages = []
+    valid = 0
+    valid_with_loops = 0
+    for _ in range(size):
+        kind = rnd.randrange(4)
+        if kind == 0:
+            # matching rule 0 without loops
+            messages.append(chunk(0) + chunk(0) + chunk(1))
+            valid += 1
+            valid_with_loops += 1
+        elif kind == 1:
+            # only matching with the loops
+            count_31 = rnd.randint(1, 3)
+            count_42 = rnd.randint(count_31 + 1, count_31 + 3)
+            if (count_42, count_31) == (2, 1):
+                count_42 += 1
+            messages.append("".join(chunk(0) for _ in range(count_42)) + "".join(chunk(1) for _ in range(count_31)))
+            valid_with_loops += 1
+        elif kind == 2:
+            # not enough 42 chunks
+            count_42 = rnd.randint(1, 3)
+            messages.append("".join(chunk(0) for _ in range(count_42)) + "".join(chunk(1) for _ in range(count_42)))
+        else:
+            # not a round number of chunks
+            messages.append(chunk(0) + chunk(0) + chunk(1) + "".join(rnd.choices("ab", k=rnd.randint(1, chunk_length - 1))))
+
+    raw_rules = [f"{idx}: {rule}" for idx, rule in rules.items()]
+    rnd.shuffle(raw_rules)
+
+    return Generated(lines=_lines(raw_rules + [""] + messages), answers={1: valid, 2: valid_with_loops})
+
+
+SEA_MONSTER = [
+    "                  # ",
+    "#    ##    ##    ###",
+    " #  #  #  #  #  #   ",
+]
+
+
+def _reverse_bits(value: int, size: int) -> int:
+    return int(format(value, f"0{size}b")[::-1], 2)
+
+
+def _rotate(matrix: List[str]) -> List[str]:
+    return ["".join(row[idx] for row in reversed(matrix)) for idx in range(len(matrix[0]))]
+
+
+def _count_sea_monsters(picture: List[str]) -> List[int]:
+    """
+    Number of sea monsters in every orientation of the picture, the picture as it is being the first one.
+    """
+    monster = [(r, c) for r, pattern_row in enumerate(SEA_MONSTER) for c, pixel in enumerate(pattern_row) if pixel == "#"]
+    monster_height, monster_width = len(SEA_MONSTER), len(SEA_MONSTER[0])
+    counts = []
+    for view in (picture, picture[::-1]):
+        for _ in range(4):
+            counts.append(sum(
+                all(view[row + r][col + c] == "#" for r, c in monster)
+                for row in range(len(view) - monster_height + 1)
+                for col in range(len(view[0]) - monster_width + 1)
+            ))
+            view = _rotate(view)
+
+    return counts
+
+
+def generate_day20(size: int, rnd: Random, monsters: Optional[int] = None, density: float = 0.3) -> Generated:
+    """
+    A `size` x `size` jigsaw of 10x10 tiles. The edges are drawn so that every one of them (and its reverse)
+    is unique, so two tiles are only matching when they are neighbors. Some sea monsters are drawn in the
+    picture before cutting it in tiles, which are then randomly rotated and flipped.
+    As edges are only 10 bits wide, there are not enough unique ones for jigsaws bigger than 12x12, and
+    a sea monster is not fitting in jigsaws smaller than 3x3.
+    """
+    if not 3 <= size <= 12:
+        raise ValueError(f"The jigsaw size should be between 3 and 12, not {size}")
+
+    # the pixels at the corners of the tiles are shared by four tiles, so draw them first
+    corners = [[rnd.randrange(2) for _ in range(size + 1)] for _ in range(size + 1)]
+    used: Set[int] = set()
+
+    def edge(first_bit: int, last_bit: int) -> str:
+        for _ in range(1000):
+            value = (first_bit << 9) | (rnd.randrange(256) << 1) | last_bit
+            reverse = _reverse_bits(value, 10)
+            if value != reverse and value not in used and reverse not in used:
+                used.add(value)
+                return format(value, "010b").replace("0", ".").replace("1", "#")
+        raise ValueError("Unable to find an unused edge")
+
+    # horizontal[r][c] is the top edge of tile (r, c), vertical[r][c] its left edge
+    horizontal = [[edge(corners[r][c], corners[r][c + 1]) for c in range(size)] for r in range(size + 1)]
+    vertical = [[edge(corners[r][c], corners[r + 1][c]) for c in range(size + 1)] for r in range(size)]
+
+    # draw the picture, with some sea monsters, again until the random pixels are not making any other monster
+    # in any orientation, as the solver is counting the monsters of the first orientation having some
+    picture_size = 8 * size
+    monsters = monsters if monsters is not None else max(1, size // 2)
+    monster_height, monster_width = len(SEA_MONSTER), len(SEA_MONSTER[0])
+    while True:
+        picture = [["#" if rnd.random() < density else "." for _ in range(picture_size)] for _ in range(picture_size)]
+        taken: Set[Tuple[int, int]] = set()
+        placed = 0
+        for _ in range(monsters * 100):
+            if placed == monsters:
+                break
+            row = rnd.randrange(picture_size - monster_height + 1)
+            col = rnd.randrange(picture_size - monster_width + 1)
+            area = {(row + r, col + c) for r in range(-1, monster_height + 1) for c in range(-1, monster_width + 1)}
+            if area & taken:
+                continue
+            taken |= area
+            placed += 1
+            for r, pattern_row in enumerate(SEA_MONSTER):
+                for c, pixel in enumerate(pattern_row):
+                    if pixel == "#":
+                        picture[row + r][col + c] = "#"
+        counts = _count_sea_monsters(["".join(row) for row in picture])
+        if counts[0] == placed > 0 and not any(counts[1:]):
+            break
+    roughness = sum(row.count("#") for row in picture) - placed * 15
+
+    tile_ids = rnd.sample(range(1000, 10000), size * size)
+    raw_tiles = []
+    for r, c in product(range(size), range(size)):
+        tile_id = tile_ids[r * size + c]
+        tile = [horizontal[r][c]]
+        for inner_row in range(8):
+            inner = "".join(picture[8 * r + inner_row][8 * c:8 * c + 8])
+            tile.append(vertical[r][c][inner_row + 1] + inner + vertical[r][c + 1][inner_row + 1])
+        tile.append(horizontal[r + 1][c])
+        for _ in range(rnd.randrange(4)):
+            tile = _rotate(tile)
+        if rnd.random() < 0.5:
+            tile = tile[::-1]
+        raw_tiles.append([f"Tile {tile_id}:"] + tile)
+    rnd.shuffle(raw_tiles)
+
+    corner_ids = [tile_ids[0], tile_ids[size - 1], tile_ids[size * (size - 1)], tile_ids[size * size - 1]]
+    return Generated(
+        lines=_lines([line for raw_tile in raw_tiles for line in raw_tile + [""]][:-1]),
+        answers={1: prod(corner_ids), 2: roughness}
+    )
+
+
+def generate_day21(size: int, rnd: Random, number_of_allergens: int = 8) -> Generated:
+    """
+    Every allergen is in one ingredient, and the foods listing an allergen are only sharing its ingredient,
+    so every allergen is resolved by intersecting the foods listing it.
+    """
+    allergens = _unique_words(rnd, number_of_allergens)
+    ingredients = _unique_words(rnd, max(number_of_allergens * 4, size // 2 + number_of_allergens))
+    dangerous = dict(zip(allergens, rnd.sample(ingredients, number_of_allergens)))
+    safe = [ingredient for ingredient in ingredients if ingredient not in dangerous.values()]
+
+    foods: List[Tuple[Set[str], Set[str]]] = []
+    while len(foods) < max(size, number_of_allergens * 2):
+        listed = set(rnd.sample(allergens, rnd.randint(1, 3)))
+        contained = listed | set(allergen for allergen in allergens if rnd.random() < 0.1)
+        foods.append((
+            {dangerous[allergen] for allergen in contained} | set(rnd.sample(safe, rnd.randint(2, 8))),
+            listed
+        ))
+
+    # make sure every allergen is listed twice, and only its ingredient is common to the foods listing it
+    for allergen in allergens:
+        while True:
+            # all the ingredients are in common to no food, when the allergen is not listed yet
+            common = reduce(set.intersection, (food for food, listed in foods if allergen in listed), set(ingredients))
+            if common == {dangerous[allergen]} and sum(allergen in listed for _, listed in foods) > 1:
+                break
+            foods.append(({dangerous[allergen]} | set(rnd.sample(safe, rnd.randint(2, 8))), {allergen}))
+
+    rnd.shuffle(foods)
+    lines = [
+        f"{' '.join(sorted(food, key=lambda _: rnd.random()))} (contains {', '.join(sorted(listed))})"
+        for food, listed in foods
+    ]
+
+    return Generated(
+        lines=_lines(lines),
+        answers={
+            1: sum(ingredient not in dangerous.values() for food, _ in foods for ingredient in food),
+            2: ",".join(dangerous[allergen] for allergen in sorted(allergens))
+        }
+    )
+
+
+def generate_day22(size: int, rnd: Random) -> Generated:
+    cards = rnd.sample(range(1, size * 2 + 1), size * 2)
+    return Generated(lines=_lines(
+        ["Player 1:"] + list(map(str, cards[:size])) + ["", "Player 2:"] + list(map(str, cards[size:]))
+    ))
+
+
+def generate_day23(size: int, rnd: Random) -> Generated:
+    if not 2 <= size <= 9:
+        raise ValueError(f"Cups are labelled with a single digit, so there are between 2 and 9, not {size}")
+
+    return Generated(lines=_lines(["".join(map(str, rnd.sample(range(1, size + 1), size)))]))
+
+
+HEX_DIRECTIONS = ["e", "se", "sw", "w", "nw", "ne"]
+
+
+def generate_day24(size: int, rnd: Random, max_length: int = 20) -> Generated:
+    return Generated(lines=_lines([
+        "".join(rnd.choices(HEX_DIRECTIONS, k=rnd.randint(1, max_length)))
+        for _ in range(size)
+    ]))
+
+
+def generate_day25(size: int, rnd: Random) -> Generated:
+    """
+    The loop sizes are drawn up to `size`, so the time to crack a key is proportional to it.
+    """
+    modulus = 20201227
+    card_loop_size = rnd.randint(1, size)
+    door_loop_size = rnd.randint(1, size)
+
+    return Generated(
+        lines=_lines([str(pow(7, card_loop_size, modulus)), str(pow(7, door_loop_size, modulus))]),
+        answers={1: pow(7, card_loop_size * door_loop_size, modulus)}
+    )
+
+
+GENERATORS: Dict[int, Generator] = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+    8: generate_day8,
+    9: generate_day9,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+    13: generate_day13,
+    14: generate_day14,
+    15: generate_day15,
+    16: generate_day16,
+    17: generate_day17,
+    18: generate_day18,
+    19: generate_day19,
+    20: generate_day20,
+    21: generate_day21,
+    22: generate_day22,
+    23: generate_day23,
+    24: generate_day24,
+    25: generate_day25,
+}
+
+
+def generate(day: int, size: int, seed: int = 0) -> Generated:
+    generator = GENERATORS.get(day)
+    if not generator:
+        raise ValueError(f"No generator for day {day}")
+
+    return generator(size, Random(seed))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate inputs for the Advent of Code 2020 puzzles")
+    parser.add_argument("day", type=int)
+    parser.add_argument("size", type=int, help="size of the input, its unit depends on the day (lines, tiles...)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="directory where to write the input and the answers (default: stdout)")
+    args = parser.parse_args(argv)
+
+    generated = generate(args.day, args.size, args.seed)
+    if not args.output:
+        sys.stdout.writelines(generated.lines)
+        return 0
+
+    os.makedirs(args.output, exist_ok=True)
+    with open(os.path.join(args.output, "input"), "w") as file:
+        file.writelines(generated.lines)
+    with open(os.path.join(args.output, "answers.json"), "w") as file:
+        json.dump({str(part): answer for part, answer in generated.answers.items()}, file, indent=2)
+        file.write("\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+Build larger inputs out of the real puzzle inputs.
+
+Not every puzzle format survives being scaled up: a jigsaw or a program can not simply be repeated,
+so the days whose input does not stay meaningful when repeated are scaled with generated inputs instead.
+And the games of some days are as long as their parts are asking, whatever their input (the turns of
+day 15, the moves of day 23): their parts are scaled instead, by binding them to longer games.
+"""
+from typing import Callable, List, Dict, NamedTuple, Tuple, Any
+
+from aoc.registry import EntryPoint, get_puzzle
+from benchmarks.generators import generate
+
+Scaler = Callable[[List[str], int], List[str]]
+# the entry point of a part scaled by a factor
+PartScaler = Callable[[int], EntryPoint]
+
+
+class Scaling(NamedTuple):
+    scaler: Scaler
+    # beyond this factor the solvers would run for minutes (quadratic parts, 4D pockets...)
+    max_factor: int
+    # the scalers of the parts doing a given amount of work, in their order: when there are some, only
+    # these parts are scaled
+    parts: Tuple[PartScaler, ...] = ()
+
+
+def keep_lines(lines: List[str], _: int) -> List[str]:
+    return lines
+
+
+def _normalize(lines: List[str]) -> List[str]:
+    return [
+        line.rstrip("\n") + "\n"
+        for line in lines
+    ]
+
+
+def repeat_lines(lines: List[str], factor: int) -> List[str]:
+    normalized = _normalize(lines)
+    while normalized and not normalized[-1].strip():
+        normalized.pop()
+
+    return normalized * factor
+
+
+def repeat_paragraphs(lines: List[str], factor: int) -> List[str]:
+    paragraphs = repeat_lines(lines, 1) + ["\n"]
+    return (paragraphs * factor)[:-1]
+
+
+def repeat_after(is_header_end: Callable[[str], bool]) -> Scaler:
+    """
+    Keep the header of the input untouched (up to the first line matching the predicate, included)
+    and only repeat what is following it.
+    """
+    def scaler(lines: List[str], factor: int) -> List[str]:
+        normalized = _normalize(lines)
+        header_end = next(
+            idx
+            for idx, line in enumerate(normalized)
+            if is_header_end(line)
+        )
+        header = normalized[:header_end + 1]
+        return header + repeat_lines(normalized[header_end + 1:], factor)
+
+    return scaler
+
+
+def generated(day: int, base_size: int, seed: int = 0) -> Scaler:
+    """
+    Ignore the real input, and generate one of `base_size` times the scale factor.
+    """
+    def scaler(_: List[str], factor: int) -> List[str]:
+        return generate(day, base_size * factor, seed).lines
+
+    return scaler
+
+
+def scale(day: int, lines: List[str], factor: int) -> List[str]:
+    if factor == 1:
+        return lines
+
+    scaling = SCALERS.get(day)
+    if not scaling:
+        raise ValueError(f"Day {day} can not be scaled")
+    if factor > scaling.max_factor:
+        raise ValueError(f"Day {day} can not be scaled more than {scaling.max_factor}x")
+
+    return scaling.scaler(lines, factor)
+
+
+def can_scale(day: int, factor: int, part: int = 1) -> bool:
+    if factor == 1:
+        return True
+
+    scaling = SCALERS.get(day)
+    return scaling is not None and factor <= scaling.max_factor and (not scaling.parts or part <= len(scaling.parts))
+
+
+def scale_part(day: int, part: int, factor: int) -> Callable[[Any], Any]:
+    """
+    The solver of a part, bound to a longer game for the days whose parts are scaled.
+    """
+    if not can_scale(day, factor, part):
+        raise ValueError(f"Day {day} part {part} can not be scaled {factor}x")
+
+    scaling = SCALERS.get(day)
+    if factor == 1 or not scaling.parts:
+        return get_puzzle(day).parts[part - 1]
+
+    return scaling.parts[part - 1](factor)
+
+
+SCALERS: Dict[int, Scaling] = {
+    1: Scaling(repeat_lines, max_factor=10),
+    2: Scaling(repeat_lines, max_factor=1000),
+    3: Scaling(repeat_lines, max_factor=1000),
+    4: Scaling(repeat_paragraphs, max_factor=1000),
+    5: Scaling(repeat_lines, max_factor=1000),
+    6: Scaling(repeat_paragraphs, max_factor=1000),
+    7: Scaling(generated(7, base_size=600), max_factor=10),
+    8: Scaling(generated(8, base_size=600), max_factor=100),
+    9: Scaling(generated(9, base_size=1000), max_factor=10),
+    10: Scaling(repeat_lines, max_factor=1000),
+    11: Scaling(repeat_lines, max_factor=10),
+    12: Scaling(repeat_lines, max_factor=1000),
+    13: Scaling(generated(13, base_size=100), max_factor=10),
+    14: Scaling(repeat_lines, max_factor=100),
+    # the 30 million turns of part 2 are already taking seconds
+    15: Scaling(keep_lines, max_factor=1000, parts=(
+        lambda factor: EntryPoint(
+            "aoc.day15.rambunctious_recitation:play_game_with_array", number_of_turns=2020 * factor
+        ),
+    )),
+    16: Scaling(repeat_after(lambda line: line.startswith("nearby tickets:")), max_factor=100),
+    17: Scaling(repeat_lines, max_factor=10),
+    18: Scaling(repeat_lines, max_factor=100),
+    19: Scaling(repeat_after(lambda line: not line.strip()), max_factor=10),
+    21: Scaling(repeat_lines, max_factor=100),
+    # as many more cups as moves, the million cups of part 2 being already played for seconds
+    23: Scaling(keep_lines, max_factor=1000, parts=(
+        lambda factor: EntryPoint("aoc.day23.crab_cups:solve_part1", cups_wanted=9 * factor, iterations=100 * factor),
+    )),
+    24: Scaling(generated(24, base_size=300), max_factor=10),
+}
@@ -0,0 +1,240 @@
+"""
+Benchmark every part of every puzzle against its real input, and against scaled up inputs.
+
+    python -m benchmarks                          # real inputs, compared to the baseline
+    python -m benchmarks 15 23 --scales 1,10,100   # some days, scaled
+    python -m benchmarks --update-baseline         # record the current numbers as the baseline
+
+Each case is measured twice: once for the wall time (best of `--repeat` runs) and once under
+tracemalloc for the peak memory, as tracing the allocations is slowing down the solver a lot.
+"""
+import argparse
+import json
+import os
+import sys
+from typing import NamedTuple, List, Dict, Optional, Any, Tuple
+
+from aoc.cache import Cache, parsed_key
+from aoc.registry import Puzzle, get_puzzle, parse_days
+from aoc.util.profiling import Profiler, phase
+from benchmarks.scaling import scale, can_scale, scale_part
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_SCALES = (1, 10, 100, 1000)
+
+
+class Measure(NamedTuple):
+    day: int
+    part: int
+    scale: int
+    parse_ms: float
+    wall_ms: float
+    peak_kib: float
+    iterations_per_second: float
+
+    @property
+    def key(self) -> str:
+        return _key(self.day, self.part, self.scale)
+
+
+def _key(day: int, part: int, scale: int) -> str:
+    return f"day{day}.part{part}@{scale}x"
+
+
+class Failure(NamedTuple):
+    key: str
+    error: str
+
+    def __str__(self) -> str:
+        return f"{self.key}: {self.error}"
+
+
+class Regression(NamedTuple):
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        return f"{self.key}: {self.metric} went from {self.baseline:.1f} to {self.current:.1f} " \
+               f"({(self.current / self.baseline - 1) * 100:+.0f}%)"
+
+
+def measure(day: int,
+            part: int,
+            factor: int = 1,
+            repeat: int = 1,
+            memory: bool = True,
+            cache: Optional[Cache] = None) -> Measure:
+    """
+    With a cache, the parsed real input is loaded from it (the scaled inputs are always parsed),
+    but the solver is always run, as it is what is measured.
+    """
+    puzzle = get_puzzle(day)
+    lines = scale(day, puzzle.read_lines(), factor)
+    solver = scale_part(day, part, factor)
+
+    with Profiler(f"day {day} part {part}") as profiler:
+        with phase("parse"):
+            parsed = _parse(puzzle, lines, cache if factor == 1 else None)
+
+        for run_idx in range(repeat):
+            # parse again, some solvers are consuming their input
+            parsed = parsed if run_idx == 0 else puzzle.parse(lines)
+            with phase("solve"):
+                solver(parsed)
+
+    peak_kib = 0.0
+    if memory:
+        parsed = puzzle.parse(lines)
+        with Profiler(f"day {day} part {part}", memory=True) as memory_profiler:
+            with phase("solve"):
+                solver(parsed)
+        peak_kib = memory_profiler.peak_kib("solve") or 0.0
+
+    timings = [record.wall_ms for record in profiler.phases if record.name == "solve"]
+    return Measure(
+        day=day,
+        part=part,
+        scale=factor,
+        parse_ms=profiler.phases[0].wall_ms,
+        wall_ms=min(timings),
+        peak_kib=peak_kib,
+        iterations_per_second=len(timings) * 1000 / sum(timings) if sum(timings) else float("inf")
+    )
+
+
+def _parse(puzzle: Puzzle, lines: List[str], cache: Optional[Cache]) -> Any:
+    if not cache:
+        return puzzle.parse(lines)
+
+    key = parsed_key(puzzle)
+    try:
+        return cache.get(key)
+    except KeyError:
+        parsed = puzzle.parse(lines)
+        cache.put(key, parsed)
+        return parsed
+
+
+def run(days: List[int],
+        scales: List[int],
+        repeat: int = 1,
+        memory: bool = True,
+        cache: Optional[Cache] = None) -> Tuple[List[Measure], List[Failure]]:
+    """
+    The measures of every case, and the cases failing (a solver raising is not stopping the other cases).
+    """
+    measures = []
+    failures = []
+    for day in days:
+        for part in range(1, len(get_puzzle(day).parts) + 1):
+            for factor in scales:
+                if not can_scale(day, factor, part):
+                    continue
+                try:
+                    result = measure(day, part, factor, repeat, memory, cache)
+                except Exception as e:  # any error of a solver is reported as the failure of its case
+                    failure = Failure(_key(day, part, factor), f"{type(e).__name__}: {e}")
+                    print(f"FAILURE {failure}", file=sys.stderr)
+                    failures.append(failure)
+                    continue
+                print(f"{result.key}: {result.wall_ms:.1f}ms, {result.peak_kib:.0f}KiB", file=sys.stderr)
+                measures.append(result)
+
+    return measures, failures
+
+
+def to_json(measures: List[Measure]) -> Dict[str, Dict[str, Any]]:
+    return {
+        m.key: {
+            "parse_ms": round(m.parse_ms, 3),
+            "wall_ms": round(m.wall_ms, 3),
+            "peak_kib": round(m.peak_kib, 1),
+            "iterations_per_second": round(m.iterations_per_second, 3),
+        }
+        for m in measures
+    }
+
+
+def compare(measures: List[Measure],
+            baseline: Dict[str, Dict[str, float]],
+            tolerance: float,
+            min_wall_ms: float = 5,
+            min_peak_kib: float = 64) -> List[Regression]:
+    """
+    Find the measures that are worse than the baseline by more than the given tolerance.
+    Very short timings and small peaks are too noisy to be compared, so they are ignored
+    under `min_wall_ms` and `min_peak_kib`.
+    """
+    regressions = []
+    for m in measures:
+        reference = baseline.get(m.key)
+        if not reference:
+            continue
+
+        if reference["wall_ms"] >= min_wall_ms and m.wall_ms > reference["wall_ms"] * (1 + tolerance):
+            regressions.append(Regression(m.key, "wall_ms", reference["wall_ms"], m.wall_ms))
+
+        if reference["peak_kib"] >= min_peak_kib and m.peak_kib > reference["peak_kib"] * (1 + tolerance):
+            regressions.append(Regression(m.key, "peak_kib", reference["peak_kib"], m.peak_kib))
+
+    return regressions
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as file:
+        return json.load(file)
+
+
+def save(path: str, content: Dict[str, Any]) -> None:
+    with open(path, "w") as file:
+        json.dump(content, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Advent of Code 2020 solvers")
+    parser.add_argument("days", nargs="*", help="days to benchmark, like 7 or 1-5 (default: all)")
+    parser.add_argument("--scales", default="1", help=f"comma separated scale factors, like "
+                                                      f"{','.join(map(str, DEFAULT_SCALES))} (default: 1)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per case, the best one is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak memory measure")
+    parser.add_argument("--cache", action="store_true", help="load the parsed real inputs from the cache")
+    parser.add_argument("--output", help="write the measures to this JSON file")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="merge the measures into the baseline")
+    args = parser.parse_args(argv)
+
+    measures, failures = run(
+        days=parse_days(args.days),
+        scales=[int(factor) for factor in args.scales.split(",")],
+        repeat=args.repeat,
+        memory=not args.no_memory,
+        cache=Cache() if args.cache else None
+    )
+    results = to_json(measures)
+    if args.output:
+        save(args.output, results)
+    else:
+        print(json.dumps(results, indent=2, sort_keys=True))
+
+    baseline = load_baseline(args.baseline)
+    if args.update_baseline:
+        baseline.update(results)
+        save(args.baseline, baseline)
+        return 1 if failures else 0
+
+    regressions = compare(measures, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+
+    return 1 if regressions or failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+import pytest
+from hamcrest import assert_that, equal_to, calling, raises
+
+from aoc.registry import get_puzzle
+from benchmarks.generators import generate, GENERATORS
+
+SIZES = {
+    5: 300,
+    11: 10,
+    15: 6,
+    17: 5,
+    20: 3,
+    22: 10,
+    23: 9,
+    25: 1000,
+}
+
+
+class TestGenerate:
+    @pytest.mark.parametrize("day", sorted(GENERATORS.keys()))
+    def test_should_generate_input_with_expected_answers(self, day):
+        # GIVEN
+        puzzle = get_puzzle(day)
+        generated = generate(day, SIZES.get(day, 100), seed=42)
+
+        # WHEN
+        answers = {
+            part: puzzle.parts[part - 1](puzzle.parse(generated.lines))
+            for part in generated.answers.keys()
+        }
+
+        # THEN
+        assert_that(answers, equal_to(generated.answers))
+
+    @pytest.mark.parametrize("seed", range(10))
+    @pytest.mark.parametrize("day, size", [
+        (8, 1), (8, 10), (8, 40), (8, 100),
+        (9, 29), (9, 40), (9, 100),
+        (13, 2), (13, 10), (13, 100), (13, 180),
+        (5, 3), (5, 1022),
+        (20, 6),
+        (21, 1), (21, 17),
+    ])
+    def test_should_generate_input_with_expected_answers_for_any_seed_and_size(self, day, size, seed):
+        # GIVEN
+        puzzle = get_puzzle(day)
+        generated = generate(day, size, seed)
+
+        # WHEN
+        answers = {
+            part: puzzle.parts[part - 1](puzzle.parse(generated.lines))
+            for part in generated.answers.keys()
+        }
+
+        # THEN
+        assert_that(answers, equal_to(generated.answers))
+
+    def test_should_be_reproducible_with_the_same_seed(self):
+        # WHEN
+        first = generate(16, 50, seed=7)
+        second = generate(16, 50, seed=7)
+
+        # THEN
+        assert_that(first, equal_to(second))
+
+    def test_should_refuse_an_impossible_plane(self):
+        assert_that(calling(generate).with_args(5, 2000), raises(ValueError))
+
+    def test_should_refuse_a_list_shorter_than_its_preamble(self):
+        assert_that(calling(generate).with_args(9, 20), raises(ValueError))
@@ -0,0 +1,79 @@
+from hamcrest import assert_that, equal_to, calling, raises
+
+from benchmarks.scaling import repeat_lines, repeat_paragraphs, repeat_after, generated, scale, scale_part, can_scale
+
+
+class TestRepeatLines:
+    def test_should_repeat_lines_and_fix_missing_last_newline(self):
+        # GIVEN
+        lines = ["1\n", "2"]
+
+        # WHEN
+        res = repeat_lines(lines, 2)
+
+        # THEN
+        assert_that(res, equal_to(["1\n", "2\n", "1\n", "2\n"]))
+
+
+class TestRepeatParagraphs:
+    def test_should_separate_repeated_paragraphs(self):
+        # GIVEN
+        lines = ["a\n", "b\n", "\n", "c\n"]
+
+        # WHEN
+        res = repeat_paragraphs(lines, 2)
+
+        # THEN
+        assert_that(res, equal_to(["a\n", "b\n", "\n", "c\n", "\n", "a\n", "b\n", "\n", "c\n"]))
+
+
+class TestRepeatAfter:
+    def test_should_keep_header_untouched(self):
+        # GIVEN
+        lines = ["rule\n", "\n", "msg1\n", "msg2"]
+
+        # WHEN
+        res = repeat_after(lambda line: not line.strip())(lines, 2)
+
+        # THEN
+        assert_that(res, equal_to(["rule\n", "\n", "msg1\n", "msg2\n", "msg1\n", "msg2\n"]))
+
+
+class TestGenerated:
+    def test_should_generate_an_input_proportional_to_the_factor(self):
+        # WHEN
+        res = generated(24, base_size=30)(["esew\n"], 3)
+
+        # THEN
+        assert_that(len(res), equal_to(90))
+
+
+class TestScale:
+    def test_should_refuse_to_scale_a_day_without_scaler(self):
+        assert_that(calling(scale).with_args(20, ["Tile 1:\n"], 10), raises(ValueError))
+
+    def test_should_not_touch_input_at_scale_one(self):
+        # GIVEN
+        lines = ["Tile 1:\n"]
+
+        # WHEN
+        res = scale(20, lines, 1)
+
+        # THEN
+        assert_that(res, equal_to(lines))
+
+
+class TestScalePart:
+    def test_should_play_longer_games(self):
+        # WHEN
+        res = scale_part(15, 1, 10)([0, 3, 6]), scale_part(23, 1, 2)("389125467")
+
+        # THEN
+        assert_that(res, equal_to((6, "25167148181312116103917415")))
+
+    def test_should_only_scale_the_parts_having_a_scaler(self):
+        # WHEN
+        res = can_scale(15, 10, part=1), can_scale(15, 10, part=2), can_scale(15, 1, part=2)
+
+        # THEN
+        assert_that(res, equal_to((True, False, True)))
@@ -0,0 +1,29 @@
+from hamcrest import assert_that, equal_to
+
+import benchmarks.suite
+from benchmarks.suite import run, Failure
+
+
+class TestRun:
+    def test_should_go_on_after_a_failing_solver(self, monkeypatch):
+        # GIVEN
+        measure = benchmarks.suite.measure
+
+        def failing_day1(day, *args):
+            if day == 1:
+                raise ValueError("broken")
+            return measure(day, *args)
+
+        monkeypatch.setattr(benchmarks.suite, "measure", failing_day1)
+
+        # WHEN
+        measures, failures = run([1, 2], scales=[1], memory=False)
+
+        # THEN
+        assert_that(
+            ([m.key for m in measures], failures),
+            equal_to((
+                ["day2.part1@1x", "day2.part2@1x"],
+                [Failure("day1.part1@1x", "ValueError: broken"), Failure("day1.part2@1x", "ValueError: broken")]
+            ))
+        )
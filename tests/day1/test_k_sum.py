@@ -0,0 +1,78 @@
+from itertools import combinations
+
+from hamcrest import assert_that, equal_to
+
+from aoc.day1.k_sum import k_sum, k_sums, PairSumIndex
+from aoc.util.differential import check_equivalence, shrink_args, shrink_list, shrink_int
+
+REPORT = [1721, 979, 366, 299, 675, 1456]
+
+
+def _brute_force(numbers, target, k):
+    return any(sum(combination) == target for combination in combinations(numbers, k))
+
+
+def _is_solution(numbers, target, k, indexes):
+    return indexes is not None and len(set(indexes)) == k and sum(numbers[idx] for idx in indexes) == target
+
+
+def _generate(rnd):
+    # few values for many duplicates, or large ones for few sums
+    low, high = rnd.choice([(-5, 30), (0, 2), (-1000, 1000)])
+    numbers = [rnd.randint(low, high) for _ in range(rnd.randint(0, 12))]
+    # more entries to sum than the report has, at times
+    k = rnd.randint(1, 6)
+    # a sum of entries for a target that is often reached
+    target = rnd.choice([rnd.randint(-10, 80), sum(rnd.sample(numbers, min(k, len(numbers))))])
+    return numbers, target, k
+
+
+_SHRINK = shrink_args(shrink_list, shrink_int, None)
+
+
+class TestKSum:
+    def test_should_find_the_pair_and_the_triple_of_the_example(self):
+        # WHEN
+        res = k_sum(REPORT, 2020, 2), k_sum(REPORT, 2020, 3)
+
+        # THEN
+        assert_that(res, equal_to(((0, 3), (1, 2, 4))))
+
+    def test_should_use_an_entry_only_once(self):
+        assert_that(k_sum([5, 10, 3], 10, 2), equal_to(None))
+
+    def test_should_find_as_many_sums_as_a_brute_force(self):
+        # WHEN / THEN
+        check_equivalence(
+            reference=_brute_force,
+            candidate=lambda numbers, target, k: _is_solution(numbers, target, k, k_sum(numbers, target, k)),
+            generate=_generate,
+            shrink=_SHRINK,
+            seed=1
+        )
+
+
+class TestPairSumIndex:
+    def test_should_find_as_many_pairs_and_triples_as_a_brute_force(self):
+        # GIVEN
+        def generate(rnd):
+            numbers, target, _ = _generate(rnd)
+            return numbers, target, rnd.choice([2, 3])
+
+        # WHEN / THEN
+        check_equivalence(
+            reference=_brute_force,
+            candidate=lambda numbers, target, k: _is_solution(
+                numbers, target, k, PairSumIndex(numbers).find(target, k)
+            ),
+            generate=generate,
+            shrink=_SHRINK,
+            seed=2
+        )
+
+    def test_should_answer_many_targets(self):
+        # WHEN
+        res = k_sums(REPORT + [20, 20], [2020, 40, 2000, 1], k=2)
+
+        # THEN
+        assert_that(res, equal_to({2020: (0, 3), 40: (6, 7), 2000: None, 1: None}))
@@ -0,0 +1,72 @@
+import io
+
+from hamcrest import assert_that, equal_to, calling, raises
+
+from aoc.day1.expense_report import calculate_expense_streamed
+from aoc.day1.stream import stream_two_sum, first_two_sum, read_numbers, Pair
+
+REPORT = [1721, 979, 366, 299, 675, 1456]
+
+
+class TestStreamTwoSum:
+    def test_should_give_the_pairs_as_soon_as_they_are_read(self):
+        # GIVEN
+        read = []
+
+        def numbers():
+            for number in [10, 5, 10, 15, 2, 8]:
+                read.append(number)
+                yield number
+
+        # WHEN
+        pair = first_two_sum(numbers(), 20)
+
+        # THEN
+        assert_that(pair, equal_to(Pair(0, 2, 10, 10)))
+        assert_that(read, equal_to([10, 5, 10]))
+
+    def test_should_give_all_the_pairs_with_the_first_index_of_their_first_value(self):
+        # WHEN
+        res = list(stream_two_sum([10, 5, 10, 15, 2, 8], 20, bounds=(0, 20)))
+
+        # THEN
+        assert_that(res, equal_to([Pair(0, 2, 10, 10), Pair(1, 3, 5, 15)]))
+
+    def test_should_give_every_earlier_index_of_the_first_value(self):
+        # WHEN
+        res = list(stream_two_sum([1000, 1000, 1020, 1010, 1010, 1010], 2020, all_indexes=True))
+
+        # THEN
+        assert_that(res, equal_to([
+            Pair(0, 2, 1000, 1020), Pair(1, 2, 1000, 1020),
+            Pair(3, 4, 1010, 1010), Pair(3, 5, 1010, 1010), Pair(4, 5, 1010, 1010),
+        ]))
+
+    def test_should_only_give_the_values_with_a_bitmap(self):
+        # WHEN
+        res = list(stream_two_sum([10, 5, 10, 15], 20, bounds=(0, 20), with_indexes=False))
+
+        # THEN
+        assert_that(res, equal_to([Pair(None, 2, 10, 10), Pair(None, 3, 5, 15)]))
+
+    def test_should_refuse_entries_out_of_the_bounds(self):
+        assert_that(
+            calling(list).with_args(stream_two_sum([1, 50], 20, bounds=(0, 20))),
+            raises(ValueError)
+        )
+
+
+class TestReadNumbers:
+    def test_should_read_a_memory_mapped_file_and_a_stream(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input"
+        path.write_text("\n".join(map(str, REPORT)) + "\n")
+
+        # WHEN
+        res = list(read_numbers(str(path))), list(read_numbers(io.BytesIO(b"1\n\n2\n")))
+
+        # THEN
+        assert_that(res, equal_to((REPORT, [1, 2])))
+
+    def test_should_calculate_expense_from_a_stream(self):
+        assert_that(calculate_expense_streamed(iter(REPORT)), equal_to(514579))
@@ -0,0 +1,48 @@
+from itertools import combinations
+
+from hamcrest import assert_that, equal_to, calling, raises
+
+from aoc.day1.expense_report import calculate_expense_part2_with_bitsets
+from aoc.day1.subset_sum import SubsetSums
+from aoc.util.differential import check_equivalence, shrink_args, shrink_list, shrink_int
+
+
+class TestSubsetSums:
+    def test_should_list_the_sums_of_every_size(self):
+        # GIVEN
+        sums = SubsetSums([1, 2, 2, 5], max_size=3, max_sum=20)
+
+        # WHEN
+        res = [sums.targets(size) for size in range(4)]
+
+        # THEN
+        assert_that(res, equal_to([[0], [1, 2, 5], [3, 4, 6, 7], [5, 8, 9]]))
+
+    def test_should_refuse_negative_entries(self):
+        assert_that(calling(SubsetSums).with_args([1, -1], max_size=2, max_sum=10), raises(ValueError))
+
+    def test_should_find_witnesses_like_a_brute_force(self):
+        # GIVEN
+        def brute_force(numbers, target, size):
+            return any(sum(combination) == target for combination in combinations(numbers, size))
+
+        def witness(numbers, target, size):
+            indexes = SubsetSums(numbers, max_size=4, max_sum=60).witness(target, size)
+            return indexes is not None and len(set(indexes)) == size and sum(numbers[i] for i in indexes) == target
+
+        def generate(rnd):
+            # zeros, duplicates, and entries above the largest sum, for sums of no entry up to the largest one
+            numbers = [rnd.randint(0, rnd.choice([2, 25, 80])) for _ in range(rnd.randint(0, 10))]
+            return numbers, rnd.choice([0, rnd.randint(0, 60), 60]), rnd.randint(0, 4)
+
+        # WHEN / THEN
+        check_equivalence(brute_force, witness, generate, shrink_args(shrink_list, shrink_int, None), seed=3)
+
+
+class TestCalculateExpenseWithBitsets:
+    def test_it_should_calculate_expense_for_small_example(self):
+        # WHEN
+        res = calculate_expense_part2_with_bitsets([1721, 979, 366, 299, 675, 1456])
+
+        # THEN
+        assert_that(res, equal_to(241861950))
@@ -1,6 +1,6 @@
 from hamcrest import assert_that, equal_to
 
-from aoc.day11.seating_system import fill_seats, _parse, _is_occupied, _is_direction_occupied
+from aoc.day11.seating_system import fill_seats, _parse
 
 
 class TestFillSeats:
@@ -19,8 +19,7 @@ L.LLLLL.LL"""
 
         # WHEN
         res = fill_seats(
-            _parse(raw_seats.splitlines(keepends=True)),
-            is_occupied_predicate=_is_occupied
+            _parse(raw_seats.splitlines(keepends=True))
         )
 
         # THEN
@@ -42,7 +41,7 @@ L.LLLLL.LL"""
         # WHEN
         res = fill_seats(
             _parse(raw_seats.splitlines(keepends=True)),
-            is_occupied_predicate=_is_direction_occupied,
+            reach=None,
             empty_seat_threshold=5
         )
 
@@ -1,6 +1,9 @@
+from functools import partial
+
 from hamcrest import equal_to, assert_that
 
-from aoc.day15.rambunctious_recitation import play_game
+from aoc.day15.rambunctious_recitation import play_game, play_game_with_array
+from aoc.util.differential import check_equivalence, shrink_args, shrink_list, shrink_int
 
 
 class TestPlayGame:
@@ -91,3 +94,32 @@ class TestPlayGame:
 
         # THEN
         assert_that(res, equal_to(1836))
+
+
+class TestPlayGameWithArray:
+    def test_should_validate_first_example(self):
+        # GIVEN
+        starting_numbers = [0, 3, 6]
+        number_of_turns = 2020
+
+        # WHEN
+        res = play_game_with_array(starting_numbers, number_of_turns)
+
+        # THEN
+        assert_that(res, equal_to(436))
+
+    def test_should_play_like_the_reference_game(self):
+        # GIVEN
+        def generate(rnd):
+            starting_numbers = [rnd.randint(0, rnd.choice([3, 20, 1000])) for _ in range(rnd.randint(1, 8))]
+            # the games may end before all the starting numbers are spoken
+            return starting_numbers, rnd.choice([rnd.randint(1, 10), rnd.randint(1, 3000)])
+
+        # WHEN / THEN
+        check_equivalence(
+            reference=play_game,
+            candidate=play_game_with_array,
+            generate=generate,
+            shrink=shrink_args(partial(shrink_list, min_length=1), shrink_int),
+            seed=15
+        )
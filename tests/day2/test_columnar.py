@@ -0,0 +1,106 @@
+import string
+
+from hamcrest import assert_that, equal_to
+
+from aoc.day2.columnar import parse_columns, count_valid_passwords, count_valid_passwords_part2
+from aoc.day2.match_passwords import _parse, validate_passwords, validate_passwords_part2
+from aoc.util.differential import check_equivalence
+
+EXAMPLE = b"1-3 a: abcde\n1-3 b: cdefg\n2-9 c: ccccccccc\n"
+
+
+class TestParseColumns:
+    def test_should_split_the_entries_in_columns(self):
+        # WHEN
+        columns = parse_columns(EXAMPLE, block_size=8)
+
+        # THEN
+        assert_that(
+            (list(columns.lowest), list(columns.highest), columns.chars, columns.passwords, list(columns.starts)),
+            equal_to(([1, 1, 2], [3, 3, 9], b"abc", b"abcdecdefgccccccccc", [0, 5, 10]))
+        )
+
+    def test_should_accept_a_position_out_of_its_password(self):
+        # GIVEN
+        data = b"1-10 a: abca\n0-2 b: bb\n"
+
+        # WHEN
+        columns = parse_columns(data)
+
+        # THEN
+        assert_that((list(columns.lowest), list(columns.highest)), equal_to(([1, 0], [10, 2])))
+
+    def test_should_split_an_entry_at_its_first_separators_only(self):
+        # GIVEN
+        data = b"1-1 a: a 1-1 a: a\n1-3 a: ab-ad\n0-3 a: \n2-4 b: b: b\n"
+
+        # WHEN
+        columns = parse_columns(data)
+
+        # THEN
+        assert_that(
+            (list(columns.lowest), list(columns.highest), columns.chars, columns.passwords, list(columns.starts)),
+            equal_to(([1, 1, 0, 2], [1, 3, 3, 4], b"aaab", b"a 1-1 a: aab-adb: b", [0, 10, 15, 15]))
+        )
+
+
+class TestCountValidPasswords:
+    def test_should_validate_given_example(self):
+        # GIVEN
+        columns = parse_columns(EXAMPLE)
+
+        # WHEN
+        res = count_valid_passwords(columns), count_valid_passwords_part2(columns)
+
+        # THEN
+        assert_that(res, equal_to((2, 1)))
+
+    def test_should_never_match_a_position_out_of_its_password(self):
+        # GIVEN
+        columns = parse_columns(b"1-10 a: abca\n0-2 b: bb\n2-9 c: ac\n1-5 d: dd\n")
+
+        # WHEN
+        res = count_valid_passwords(columns), count_valid_passwords_part2(columns)
+
+        # THEN
+        assert_that(res, equal_to((3, 4)))
+
+    def test_should_validate_like_the_regex_parser(self):
+        # GIVEN
+        def generate(rnd):
+            lines = []
+            # passwords of separators, spaces and punctuation, or empty, at times
+            alphabet = rnd.choice(["abc", "abc", "ab -:", "a" + string.punctuation + " "])
+            for _ in range(rnd.randint(0, 30)):
+                password = "".join(rnd.choices(alphabet, k=rnd.randint(0, 12)))
+                # the positions may be 0, past the end of the password, or in any order
+                lowest = rnd.randint(0, len(password) + 2)
+                highest = rnd.randint(0, len(password) + 2)
+                lines.append(f"{lowest}-{highest} {rnd.choice('abc')}: {password}\n")
+            # blocks of a single line, up to the whole input at once
+            return lines, rnd.choice([1, rnd.randint(1, 64), 1024])
+
+        def with_regex(lines, _):
+            entries = _parse(lines)
+            in_passwords = [
+                entry for entry in entries
+                if 1 <= entry["lowest"] <= len(entry["password"]) and 1 <= entry["highest"] <= len(entry["password"])
+            ]
+
+            # out of the password, a position is never having the policy char
+            def has_char_at(entry, position):
+                return 0 < position and entry["password"][position - 1:position] == entry["char"]
+
+            out_of_passwords = sum(
+                has_char_at(entry, entry["lowest"]) != has_char_at(entry, entry["highest"])
+                for entry in entries
+                if entry not in in_passwords
+            )
+            return validate_passwords(entries), validate_passwords_part2(in_passwords) + out_of_passwords
+
+        def with_columns(lines, block_size):
+            columns = parse_columns("".join(lines).encode(), block_size)
+            return count_valid_passwords(columns), count_valid_passwords_part2(columns)
+
+        # WHEN / THEN
+        check_equivalence(with_regex, with_columns, generate, seed=2)
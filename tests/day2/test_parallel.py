@@ -0,0 +1,42 @@
+from hamcrest import assert_that, equal_to
+
+from aoc.day2.parallel import newline_ranges, count_valid_in_file
+
+EXAMPLE = b"1-3 a: abcde\n1-3 b: cdefg\n2-9 c: ccccccccc\n"
+
+
+class TestNewlineRanges:
+    def test_should_end_every_range_after_a_newline(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input"
+        path.write_bytes(EXAMPLE)
+
+        # WHEN
+        res = newline_ranges(str(path), chunk_size=5)
+
+        # THEN
+        assert_that(res, equal_to([(0, 13), (13, 26), (26, 43)]))
+
+
+class TestCountValidInFile:
+    def test_should_reduce_the_counts_of_the_workers(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input"
+        path.write_bytes(EXAMPLE * 10)
+
+        # WHEN
+        res = count_valid_in_file(str(path), workers=2, chunk_size=30)
+
+        # THEN
+        assert_that(res, equal_to((20, 10)))
+
+    def test_should_validate_passwords_with_separators(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input"
+        path.write_bytes(b"1-1 a: a 1-1 a: a\n1-3 a: ab-ad\n0-3 a: \n" * 10)
+
+        # WHEN
+        res = count_valid_in_file(str(path), workers=2, chunk_size=30)
+
+        # THEN
+        assert_that(res, equal_to((20, 10)))
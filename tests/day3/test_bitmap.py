@@ -0,0 +1,65 @@
+from random import Random
+
+from hamcrest import assert_that, equal_to
+
+from aoc.day3.bitmap import parse_tree_map, count_trees_by_trajectory, analyze_trajectories
+from aoc.day3.tobogan_trajectory import _parse_line, count_trees_in_trajectory
+from aoc.util.differential import check_equivalence
+
+EXAMPLE = [
+    "..##.......\n",
+    "#...#...#..\n",
+    ".#....#..#.\n",
+    "..#.#...#.#\n",
+    ".#...##..#.\n",
+    "..#.##.....\n",
+    ".#.#.#....#\n",
+    ".#........#\n",
+    "#.##...#...\n",
+    "#...##....#\n",
+    ".#..#...#.#\n",
+]
+
+
+class TestParseTreeMap:
+    def test_should_pack_the_first_column_in_the_highest_bit(self):
+        # GIVEN
+        lines = ["#..\n", ".#.\n", "..#\n"]
+
+        # WHEN
+        tree_map = parse_tree_map(lines)
+
+        # THEN
+        assert_that(tree_map.rows, equal_to([0b100, 0b010, 0b001]))
+        assert_that(tree_map.has_tree(0, 3), equal_to(True))
+
+
+class TestCountTreesByTrajectory:
+    def test_should_validate_given_example(self):
+        # GIVEN
+        tree_map = parse_tree_map(EXAMPLE)
+
+        # WHEN
+        trees = count_trees_by_trajectory(tree_map, [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)])
+
+        # THEN
+        assert_that(trees, equal_to([2, 7, 3, 4, 2]))
+        assert_that(analyze_trajectories(tree_map, [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]), equal_to(336))
+
+    def test_should_count_as_the_row_by_row_traversal(self):
+        # GIVEN
+        def generate(rnd: Random):
+            width = rnd.randint(1, 40)
+            lines = ["".join(rnd.choice("#.") for _ in range(width)) for _ in range(rnd.randint(1, 30))]
+            trajectories = [(rnd.randint(0, 50), rnd.randint(1, 4)) for _ in range(rnd.randint(1, 6))]
+            return lines, trajectories
+
+        def reference(lines, trajectories):
+            slope = list(map(_parse_line, lines))
+            return [count_trees_in_trajectory(slope, right, down) for right, down in trajectories]
+
+        def candidate(lines, trajectories):
+            return count_trees_by_trajectory(parse_tree_map(line + "\n" for line in lines), trajectories)
+
+        # WHEN / THEN
+        check_equivalence(reference, candidate, generate)
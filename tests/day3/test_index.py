@@ -0,0 +1,61 @@
+from random import Random
+
+from hamcrest import assert_that, equal_to
+
+from aoc.day3.bitmap import parse_tree_map, count_trees_by_trajectory
+from aoc.day3.index import TreeIndex
+from aoc.util.differential import check_equivalence
+
+EXAMPLE = [
+    "..##.......",
+    "#...#...#..",
+    ".#....#..#.",
+    "..#.#...#.#",
+    ".#...##..#.",
+    "..#.##.....",
+    ".#.#.#....#",
+    ".#........#",
+    "#.##...#...",
+    "#...##....#",
+    ".#..#...#.#",
+]
+
+
+class TestTreeIndex:
+    def test_should_validate_given_example(self):
+        # GIVEN
+        index = TreeIndex(parse_tree_map(EXAMPLE))
+
+        # WHEN
+        trees = index.count_all([(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)])
+
+        # THEN
+        assert_that(trees, equal_to([2, 7, 3, 4, 2]))
+
+    def test_should_count_the_trees_by_residue_and_column(self):
+        # GIVEN
+        index = TreeIndex(parse_tree_map(["#.", ".#", "##", ".."]))
+
+        # WHEN
+        counts = index.period_counts(2)
+
+        # THEN
+        assert_that(list(counts), equal_to([2, 1, 0, 1]))
+
+    def test_should_count_as_the_traversal(self):
+        # GIVEN
+        def generate(rnd: Random):
+            width = rnd.randint(1, 12)
+            lines = ["".join(rnd.choice("#.") for _ in range(width)) for _ in range(rnd.randint(1, 60))]
+            trajectories = [(rnd.randint(0, 30), rnd.randint(1, 5)) for _ in range(rnd.randint(1, 8))]
+            # with a few counts only, some of the slopes are followed over the rows
+            return lines, trajectories, rnd.choice([16, 1 << 20])
+
+        def reference(lines, trajectories, _):
+            return count_trees_by_trajectory(parse_tree_map(lines), trajectories)
+
+        def candidate(lines, trajectories, max_cells):
+            return TreeIndex(parse_tree_map(lines), max_cells).count_all(trajectories)
+
+        # WHEN / THEN
+        check_equivalence(reference, candidate, generate)
@@ -0,0 +1,66 @@
+import tracemalloc
+from random import Random
+
+from hamcrest import assert_that, equal_to, less_than
+
+from aoc.day3.bitmap import parse_tree_map, count_trees_by_trajectory
+from aoc.day3.stream import stream_trees_by_trajectory
+
+EXAMPLE = [
+    "..##.......\n",
+    "#...#...#..\n",
+    ".#....#..#.\n",
+    "..#.#...#.#\n",
+    ".#...##..#.\n",
+    "..#.##.....\n",
+    ".#.#.#....#\n",
+    ".#........#\n",
+    "#.##...#...\n",
+    "#...##....#\n",
+    ".#..#...#.#\n",
+]
+
+
+class TestStreamTreesByTrajectory:
+    def test_should_validate_given_example(self):
+        # GIVEN
+        lines = iter(EXAMPLE)
+
+        # WHEN
+        trees = stream_trees_by_trajectory(lines, [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)])
+
+        # THEN
+        assert_that(trees, equal_to([2, 7, 3, 4, 2]))
+
+    def test_should_count_as_the_loaded_map(self, tmp_path):
+        # GIVEN
+        rnd = Random(3)
+        lines = ["".join(rnd.choice("#.") for _ in range(13)) + "\n" for _ in range(500)]
+        path = tmp_path / "forest"
+        path.write_text("".join(lines))
+        trajectories = [(1, 1), (4, 1), (13, 3), (2, 7)]
+
+        # WHEN
+        with open(path) as file:
+            trees = stream_trees_by_trajectory(file, trajectories)
+
+        # THEN
+        assert_that(trees, equal_to(count_trees_by_trajectory(parse_tree_map(lines), trajectories)))
+
+    def test_should_only_hold_the_current_row(self):
+        # GIVEN
+        def rows(height):
+            for row_idx in range(height):
+                yield "#" * (row_idx % 7) + "." * (31 - row_idx % 7) + "\n"
+
+        # WHEN
+        tracemalloc.start()
+        try:
+            trees = stream_trees_by_trajectory(rows(100_000), [(3, 1), (1, 2)])
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # THEN
+        assert_that(trees[0], equal_to(sum(row_idx * 3 % 31 < row_idx % 7 for row_idx in range(100_000))))
+        assert_that(peak, less_than(64 * 1024))
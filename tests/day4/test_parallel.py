@@ -0,0 +1,96 @@
+from hamcrest import assert_that, equal_to
+
+from aoc.day4.parallel import record_ranges, audit_file, audit_passports, PassportAudit
+
+EXAMPLE = b"""ecl:gry pid:860033327 eyr:2020 hcl:#fffffd
+byr:1937 iyr:2017 cid:147 hgt:183cm
+
+iyr:2013 ecl:amb cid:350 eyr:2023 pid:028048884
+hcl:#cfa07d byr:1929
+
+hcl:#ae17e1 iyr:2013
+eyr:2024
+ecl:brn pid:760753108 byr:1931
+hgt:179cm
+
+hcl:#cfa07d eyr:2025 pid:166559648
+iyr:2011 ecl:brn hgt:59in
+"""
+
+
+class TestRecordRanges:
+    def test_should_end_every_range_after_a_blank_line(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "passports"
+        path.write_bytes(EXAMPLE)
+
+        # WHEN
+        res = record_ranges(str(path), chunk_size=10)
+
+        # THEN
+        assert_that(res, equal_to([(0, 80), (80, 150), (150, 222), (222, len(EXAMPLE))]))
+
+    def test_should_end_the_ranges_after_the_blank_lines_of_any_whitespace(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "passports"
+        path.write_bytes(EXAMPLE.replace(b"\n", b"\r\n").replace(b"\r\n\r\nhcl:#ae17e1", b"\r\n \t\r\nhcl:#ae17e1"))
+
+        # WHEN
+        res = record_ranges(str(path), chunk_size=10)
+
+        # THEN
+        assert_that(res, equal_to([(0, 83), (83, 158), (158, 235), (235, len(EXAMPLE) + 15)]))
+
+
+class TestAuditFile:
+    def test_should_merge_the_counts_of_the_workers(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "passports"
+        path.write_bytes(b"\n".join([EXAMPLE] * 10))
+
+        # WHEN
+        res = audit_file(str(path), workers=2, chunk_size=200, with_failures=True)
+
+        # THEN
+        assert_that(res, equal_to(PassportAudit(complete=20, valid=20, failures={"missing hgt": 10, "missing byr": 10})))
+
+
+class TestAuditPassports:
+    def test_should_count_the_failures_of_every_field(self):
+        # GIVEN
+        data = b"byr:1919 iyr:2015 eyr:2025 hgt:170 hcl:#123abc ecl:amb\n\npid:000000001\n"
+
+        # WHEN
+        res = audit_passports(data, with_failures=True)
+
+        # THEN
+        assert_that(res.failures, equal_to({
+            "invalid byr": 1, "invalid hgt": 1, "missing pid": 1,
+            "missing byr": 1, "missing iyr": 1, "missing eyr": 1, "missing hgt": 1, "missing hcl": 1, "missing ecl": 1,
+        }))
+
+    def test_should_count_the_failures_of_malformed_passports(self):
+        # GIVEN
+        data = (
+            b"byr:19:50 iyr:2015 eyr:2025 hgt:170cm hcl:#123abc ecl:amb pid:\xff\xfe00001 oops\n"
+            b"\n"
+            b"byr:1990 iyr:2015 eyr:2025 hgt:170cm hcl:#123abc ecl:amb pid:000000001 byr:1900\n"
+        )
+
+        # WHEN
+        res = audit_passports(data, with_failures=True)
+
+        # THEN
+        assert_that(res, equal_to(PassportAudit(complete=2, valid=0, failures={
+            "invalid byr": 2, "invalid pid": 1, "malformed entries": 1,
+        })))
+
+    def test_should_give_a_failure_of_every_invalid_passport(self):
+        # GIVEN
+        data = "byr:1950 iyr:2015 eyr:2025 hgt:170cm hcl:#123abc ecl:amb pid:000000001 cid:1\u00a0byr:1800\n".encode()
+
+        # WHEN
+        res = audit_passports(data, with_failures=True)
+
+        # THEN
+        assert_that(res, equal_to(PassportAudit(complete=1, valid=0, failures={"invalid byr": 1})))
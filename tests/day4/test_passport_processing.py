@@ -1,7 +1,11 @@
+from random import Random
+
 from hamcrest import assert_that, equal_to
 
 from aoc.day4.passport_processing import count_valid_passports, REQUIRED_PASSPORT_FIELDS, has_required_fields, \
-    has_correct_values
+    has_correct_values, generate_passport, COMPILED_PASSPORT_SCHEMA
+from aoc.day4.scanner import BINARY_PASSPORT_SCHEMA
+from aoc.util.differential import check_equivalence
 
 
 class TestCountValidPassports:
@@ -79,3 +83,66 @@ pid:3556412378 byr:2007"""
 
         # THEN
         assert_that(res, equal_to(0))
+
+
+class TestCompiledPassportSchema:
+    def test_should_check_as_the_validators(self):
+        # GIVEN
+        values = {
+            # the digits of any script are numbers too, but not the superscript ones
+            "byr": ["1920", "2002", "1919", "+1990", "1_990", "19a0", "", "\u0661\u0669\u0665\u0660", "\u00b2000"],
+            "iyr": ["2010", "2020", "2021", "-2015"],
+            "eyr": ["2020", "2030", "2031", "02025"],
+            "hgt": ["150cm", "193cm", "194cm", "59in", "76in", "77in", "170", "+60in", "60cn", "cm", "\uff16\uff10in"],
+            "hcl": ["#123abc", "#12345g", "123abc", "#1234567"],
+            "ecl": ["amb", "oth", "wat", "am", "ambb"],
+            "pid": ["000000001", "12345678", "0123456789", "12345678a", "\u0660" * 9],
+            "cid": ["1", "abc"],
+        }
+
+        def generate(rnd: Random):
+            # a key may be missing, or given several times
+            entries = [
+                f"{key}:{rnd.choice(choices)}"
+                for key, choices in values.items()
+                for _ in range(rnd.choice([0, 1, 1, 1, 1, 2, 3]))
+            ]
+            rnd.shuffle(entries)
+            # the entries may be separated by any whitespace, out of ASCII too
+            return rnd.choice([" ", "\n", "\u00a0"]).join(entries),
+
+        def reference(record):
+            passport = generate_passport([record])
+            return has_required_fields(passport, REQUIRED_PASSPORT_FIELDS), \
+                has_correct_values(passport, REQUIRED_PASSPORT_FIELDS)
+
+        def candidate(record):
+            checked = COMPILED_PASSPORT_SCHEMA.has_required_fields(record), \
+                COMPILED_PASSPORT_SCHEMA.has_correct_values(record)
+            # the binary schema of the scanner is checking the same records, given as bytes
+            return checked if BINARY_PASSPORT_SCHEMA.check(record.encode()) == checked else None
+
+        # WHEN / THEN
+        check_equivalence(reference, candidate, generate)
+
+    def test_should_keep_the_last_value_of_a_key(self):
+        # GIVEN
+        record = "byr:1900 byr:1950 iyr:2015 eyr:2025 hgt:170cm hcl:#123abc ecl:brn pid:012345678"
+
+        # WHEN
+        res = COMPILED_PASSPORT_SCHEMA.has_correct_values(record), \
+            COMPILED_PASSPORT_SCHEMA.has_correct_values(record.replace("byr:1950", "byr:1890"))
+
+        # THEN
+        assert_that(res, equal_to((True, False)))
+
+    def test_should_check_records_of_repeated_keys_in_linear_time(self):
+        # GIVEN
+        fields = ["byr:1990", "iyr:2015", "eyr:2025", "hgt:170cm", "hcl:#123abc", "ecl:brn"]
+        record = " ".join(field for field in fields for _ in range(200))
+
+        # WHEN
+        res = COMPILED_PASSPORT_SCHEMA.check(record)
+
+        # THEN
+        assert_that(res, equal_to((False, False)))
@@ -0,0 +1,94 @@
+from random import Random
+
+from hamcrest import assert_that, equal_to
+
+from aoc.day4.passport_processing import count_valid_passports, has_required_fields, has_correct_values, \
+    REQUIRED_PASSPORT_FIELDS
+from aoc.day4.scanner import scan_passports, scan_file, PassportCounts
+from aoc.registry import get_puzzle
+
+EXAMPLE = b"""ecl:gry pid:860033327 eyr:2020 hcl:#fffffd
+byr:1937 iyr:2017 cid:147 hgt:183cm
+
+iyr:2013 ecl:amb cid:350 eyr:2023 pid:028048884
+hcl:#cfa07d byr:1929
+
+hcl:#ae17e1 iyr:2013
+eyr:2024
+ecl:brn pid:760753108 byr:1931
+hgt:179cm
+
+hcl:#cfa07d eyr:2025 pid:166559648
+iyr:2011 ecl:brn hgt:59in"""
+
+
+class TestScanPassports:
+    def test_should_validate_given_example(self):
+        # GIVEN
+        data = EXAMPLE
+
+        # WHEN
+        counts = scan_passports(data)
+
+        # THEN
+        assert_that(counts, equal_to(PassportCounts(complete=2, valid=2)))
+
+    def test_should_split_the_records_on_blank_lines_only(self):
+        # GIVEN
+        data = b"\n\n" + EXAMPLE.replace(b"\n\n", b"\n  \t\n\n") + b"\n\n"
+
+        # WHEN
+        counts = scan_passports(data)
+
+        # THEN
+        assert_that(counts, equal_to(PassportCounts(complete=2, valid=2)))
+
+    def test_should_count_as_the_passports_of_the_lines(self, tmp_path):
+        # GIVEN
+        rnd = Random(4)
+        values = {
+            "byr": ["1937", "2003"], "iyr": ["2017", "2009"], "eyr": ["2020", "2031"], "hgt": ["183cm", "59in", "190in"],
+            "hcl": ["#fffffd", "#12345g"], "ecl": ["gry", "wat"], "pid": ["860033327", "0123456789"], "cid": ["147"],
+        }
+        lines = []
+        for _ in range(300):
+            entries = [f"{key}:{rnd.choice(choices)}" for key, choices in values.items() if rnd.random() < 0.9]
+            rnd.shuffle(entries)
+            cut = rnd.randint(0, len(entries))
+            lines += [" ".join(entries[:cut]) + "\n", " ".join(entries[cut:]) + "\n", "\n"]
+        path = tmp_path / "passports"
+        path.write_text("".join(lines))
+
+        # WHEN
+        counts = scan_file(str(path))
+
+        # THEN
+        assert_that(counts, equal_to(PassportCounts(
+            complete=count_valid_passports(iter(lines), lambda p: has_required_fields(p, REQUIRED_PASSPORT_FIELDS)),
+            valid=count_valid_passports(iter(lines), lambda p: has_correct_values(p, REQUIRED_PASSPORT_FIELDS))
+        )))
+
+    def test_should_scan_an_empty_file(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "passports"
+        path.write_bytes(b"")
+
+        # WHEN
+        counts = scan_file(str(path))
+
+        # THEN
+        assert_that(counts, equal_to(PassportCounts(complete=0, valid=0)))
+
+
+class TestRegisteredParts:
+    def test_should_count_each_part_from_the_bytes_of_the_file(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "passports"
+        path.write_bytes(EXAMPLE.replace(b"\n", b"\r\n") + b"\r\n\r\niyr:2013 ecl:amb\r\n")
+        puzzle = get_puzzle(4).with_input(str(path)).resolve()
+
+        # WHEN
+        answers = [solver(puzzle.parse(puzzle.open_input())) for solver in puzzle.parts]
+
+        # THEN
+        assert_that(answers, equal_to([2, 2]))
@@ -2,7 +2,7 @@ from hamcrest import assert_that, equal_to
 
 from aoc.util.functional import compose
 from aoc.day4.validators import number_validator, or_validator, regex_extractor, exists_validator, in_validator, \
-    regex_validator
+    regex_validator, CompiledSchema, NumberRule, AnyRule, PatternRule, InRule
 
 
 class TestNumberValidator:
@@ -160,3 +160,53 @@ class TestRegexValidator:
 
         # THEM
         assert_that(res, equal_to(True))
+
+
+class TestCompiledSchema:
+    def test_should_find_the_fields_in_any_order(self):
+        # GIVEN
+        schema = CompiledSchema({
+            "age": NumberRule(min_bound=18, max_bound=99),
+            "id": PatternRule(r"[a-f]{3}"),
+            "eye": InRule(frozenset({"blu", "brn"})),
+        })
+
+        # WHEN
+        valid = schema.has_correct_values("id:abc other:1\neye:blu age:42")
+        invalid = schema.has_correct_values("id:abc age:17 eye:blu")
+        missing = schema.has_required_fields("id:abc age:17 ey:blu")
+
+        # THEN
+        assert_that((valid, invalid, missing), equal_to((True, False, False)))
+
+    def test_should_check_all_the_rules_of_an_alternative(self):
+        # GIVEN
+        schema = CompiledSchema({
+            "n": AnyRule((NumberRule(min_bound=10, max_bound=15), NumberRule(min_bound=120, max_bound=200)))
+        })
+
+        # WHEN
+        res = [schema.has_correct_values(f"n:{val}") for val in ["123", "11", "110"]]
+
+        # THEN
+        assert_that(res, equal_to([True, True, False]))
+
+    def test_should_tell_apart_the_keys_sharing_a_prefix(self):
+        # GIVEN
+        schema = CompiledSchema({"a": NumberRule(min_bound=0, max_bound=9), "a1": PatternRule("x")})
+
+        # WHEN
+        res = schema.has_correct_values("a:3 a1:x")
+
+        # THEN
+        assert_that(res, equal_to(True))
+
+    def test_should_read_the_digits_of_any_script_in_bytes(self):
+        # GIVEN
+        schema = CompiledSchema({"n": NumberRule(min_bound=10, max_bound=15), "id": PatternRule(r"\d{3}")}, binary=True)
+
+        # WHEN
+        res = schema.check("n:\u0661\u0662 id:\u0660\u0661\u0662".encode()), schema.check("n:\u00b9\u00b2 id:012".encode())
+
+        # THEN
+        assert_that(res, equal_to(((True, True), (True, False))))
@@ -0,0 +1,98 @@
+import io
+import json
+import multiprocessing
+import os
+
+import pytest
+from hamcrest import assert_that, equal_to, has_key, is_not
+
+import aoc.batch
+from aoc.batch import find_inputs, solve_file, run_batch
+
+
+def _write_inputs(directory, contents):
+    for name, content in contents.items():
+        (directory / name).write_text(content)
+
+
+class TestFindInputs:
+    def test_should_expand_directories_and_globs(self, tmp_path):
+        # GIVEN
+        _write_inputs(tmp_path, {"a.txt": "", "b.txt": "", "c.log": ""})
+
+        # WHEN
+        res = find_inputs([str(tmp_path), str(tmp_path / "*.txt")])
+
+        # THEN
+        assert_that(res, equal_to([str(tmp_path / name) for name in ("a.txt", "b.txt", "c.log")]))
+
+
+class TestSolveFile:
+    def test_should_solve_all_the_parts(self, tmp_path):
+        # GIVEN
+        _write_inputs(tmp_path, {"input": "1721\n979\n366\n299\n675\n1456\n"})
+
+        # WHEN
+        res = solve_file(1, str(tmp_path / "input"))
+
+        # THEN
+        assert_that(res["answers"], equal_to({"1": 514579, "2": 241861950}))
+        assert_that(res, is_not(has_key("errors")))
+
+    def test_should_report_the_parts_failing(self, tmp_path):
+        # GIVEN
+        _write_inputs(tmp_path, {"input": "1721\nnot a number\n"})
+
+        # WHEN
+        res = solve_file(1, str(tmp_path / "input"))
+
+        # THEN
+        assert_that(res["answers"], equal_to({}))
+        assert_that(sorted(res["errors"]), equal_to(["1", "2"]))
+
+
+class TestRunBatch:
+    def test_should_isolate_the_failing_files(self, tmp_path):
+        # GIVEN
+        _write_inputs(tmp_path, {
+            "good": "1721\n979\n366\n299\n675\n1456\n",
+            "broken": "oops\n",
+            "missing_pair": "1\n2\n3\n",
+        })
+        output = io.StringIO()
+
+        # WHEN
+        summary = run_batch(1, find_inputs([str(tmp_path)]), output, workers=2, chunk_size=1)
+
+        # THEN
+        results = {json.loads(line)["file"]: json.loads(line) for line in output.getvalue().splitlines()}
+        assert_that(summary, equal_to({"files": 3, "failed": 1}))
+        assert_that(results[str(tmp_path / "good")]["answers"], equal_to({"1": 514579, "2": 241861950}))
+        assert_that(sorted(results[str(tmp_path / "broken")]["errors"]), equal_to(["1", "2"]))
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="the workers have to inherit the crash")
+    @pytest.mark.parametrize("chunk_size", [1, 8])
+    def test_should_only_fail_the_file_crashing_its_worker(self, tmp_path, monkeypatch, chunk_size):
+        # GIVEN
+        _write_inputs(tmp_path, {
+            f"good{idx}": "1721\n979\n366\n299\n675\n1456\n" for idx in range(6)
+        })
+        _write_inputs(tmp_path, {"crash": "1721\n979\n366\n299\n675\n1456\n"})
+
+        def solve_or_crash(day, path, budget=None):
+            if path.endswith("crash"):
+                os._exit(1)
+            return solve_file(day, path, budget)
+
+        monkeypatch.setattr(aoc.batch, "solve_file", solve_or_crash)
+        output = io.StringIO()
+
+        # WHEN
+        summary = run_batch(1, find_inputs([str(tmp_path)]), output, workers=2, chunk_size=chunk_size)
+
+        # THEN
+        results = {json.loads(line)["file"]: json.loads(line) for line in output.getvalue().splitlines()}
+        assert_that(summary, equal_to({"files": 7, "failed": 1}))
+        assert_that(sorted(results[str(tmp_path / "crash")]["errors"]), equal_to(["*"]))
+        for idx in range(6):
+            assert_that(results[str(tmp_path / f"good{idx}")]["answers"], equal_to({"1": 514579, "2": 241861950}))
@@ -0,0 +1,92 @@
+import os
+from functools import partial
+
+from hamcrest import assert_that, equal_to, calling, raises, is_not
+
+from aoc.cache import Cache, describe, version, answer_key
+from aoc.registry import get_puzzle
+
+
+def _solver(values, factor):
+    return sum(values) * factor
+
+
+class TestCache:
+    def test_should_get_what_has_been_put(self, tmp_path):
+        # GIVEN
+        cache = Cache(str(tmp_path))
+        cache.put("key", {"rules": [1, 2, 3]})
+
+        # WHEN
+        res = cache.get("key")
+
+        # THEN
+        assert_that(res, equal_to({"rules": [1, 2, 3]}))
+
+    def test_should_raise_key_error_on_miss(self, tmp_path):
+        assert_that(calling(Cache(str(tmp_path)).get).with_args("unknown"), raises(KeyError))
+
+    def test_should_skip_values_that_can_not_be_pickled(self, tmp_path):
+        # GIVEN
+        cache = Cache(str(tmp_path))
+
+        # WHEN
+        res = cache.put("key", (line for line in ["a", "b"]))
+
+        # THEN
+        assert_that(res, equal_to(False))
+        assert_that(calling(cache.get).with_args("key"), raises(KeyError))
+
+    def test_should_evict_least_recently_used_entries(self, tmp_path):
+        # GIVEN
+        cache = Cache(str(tmp_path), max_bytes=2500)
+        cache.put("first", b"1" * 1000)
+        cache.put("second", b"2" * 1000)
+        os.utime(tmp_path / "first.pickle", (0, 0))
+        os.utime(tmp_path / "second.pickle", (1, 1))
+        cache.get("first")
+
+        # WHEN
+        cache.put("third", b"3" * 1000)
+
+        # THEN
+        assert_that(cache.get("first"), equal_to(b"1" * 1000))
+        assert_that(calling(cache.get).with_args("second"), raises(KeyError))
+
+    def test_should_clear_all_entries(self, tmp_path):
+        # GIVEN
+        cache = Cache(str(tmp_path))
+        cache.put("first", 1)
+        cache.put("second", 2)
+
+        # WHEN
+        res = cache.clear()
+
+        # THEN
+        assert_that(res, equal_to(2))
+        assert_that(cache.size(), equal_to(0))
+
+
+class TestVersion:
+    def test_should_describe_partials_without_memory_addresses(self):
+        # GIVEN
+        solver = partial(_solver, factor={"b", "a"})
+
+        # WHEN
+        res = describe(solver)
+
+        # THEN
+        assert_that(res, equal_to("partial(tests.test_cache:_solver, , factor={'a', 'b'})"))
+
+    def test_should_depend_on_bound_arguments(self):
+        assert_that(version(partial(_solver, factor=1)), is_not(equal_to(version(partial(_solver, factor=2)))))
+
+    def test_should_have_a_key_per_part(self):
+        # GIVEN
+        puzzle = get_puzzle(15)
+
+        # WHEN
+        res = answer_key(puzzle, 1), answer_key(puzzle, 2)
+
+        # THEN
+        assert_that(res[0], is_not(equal_to(res[1])))
@@ -0,0 +1,98 @@
+import asyncio
+
+import aoc.main
+from hamcrest import assert_that, equal_to, starts_with
+
+from aoc.daemon import BagIndex, ExpenseIndex, MemoryGame, Daemon
+from aoc.day7.handy_haversacks import _parse as parse_bags
+from aoc.main import PartResult
+
+RULES = """light red bags contain 1 bright white bag, 2 muted yellow bags.
+dark orange bags contain 3 bright white bags, 4 muted yellow bags.
+bright white bags contain 1 shiny gold bag.
+muted yellow bags contain 2 shiny gold bags, 9 faded blue bags.
+shiny gold bags contain 1 dark olive bag, 2 vibrant plum bags.
+dark olive bags contain 3 faded blue bags, 4 dotted black bags.
+vibrant plum bags contain 5 faded blue bags, 6 dotted black bags.
+faded blue bags contain no other bags.
+dotted black bags contain no other bags."""
+
+
+class TestBagIndex:
+    def test_should_answer_for_any_bag(self):
+        # GIVEN
+        index = BagIndex(parse_bags(RULES.splitlines()))
+
+        # WHEN
+        res = index.containers("shiny gold"), index.contents("shiny gold"), index.contents("dark olive")
+
+        # THEN
+        assert_that(res, equal_to((4, 32, 7)))
+
+
+class TestExpenseIndex:
+    def test_should_answer_for_any_target(self):
+        # GIVEN
+        index = ExpenseIndex([1721, 979, 366, 299, 675, 1456])
+
+        # WHEN
+        res = index.two_sum(2020), index.three_sum(2020), index.two_sum(1)
+
+        # THEN
+        assert_that(res, equal_to((514579, 241861950, None)))
+
+
+class TestMemoryGame:
+    def test_should_continue_or_restart_the_game(self):
+        # GIVEN
+        game = MemoryGame([0, 3, 6])
+
+        # WHEN
+        res = [game.spoken(turn) for turn in (2, 4, 10, 2020, 9)]
+
+        # THEN
+        assert_that(res, equal_to([3, 0, 0, 436, 4]))
+
+
+class TestDaemon:
+    def test_should_answer_queries_with_their_id(self):
+        # GIVEN
+        daemon = Daemon()
+
+        # WHEN
+        res = asyncio.run(daemon.answer({"id": 7, "day": 15, "query": "spoken", "turn": 2020}))
+
+        # THEN
+        assert_that(res["id"], equal_to(7))
+        assert_that(res["answer"], equal_to(959))
+
+    def test_should_answer_an_error_for_an_unknown_query(self):
+        # GIVEN
+        daemon = Daemon()
+
+        # WHEN
+        res = asyncio.run(daemon.answer({"id": 1, "day": 15, "query": "unknown"}))
+
+        # THEN
+        assert_that(res["error"], starts_with("ValueError: unknown query unknown for day 15"))
+
+    def test_should_solve_a_part_once_for_concurrent_queries(self, monkeypatch):
+        # GIVEN
+        daemon = Daemon()
+        solved = []
+
+        def run_part(day, part, **_):
+            solved.append((day, part))
+            return PartResult(day, part, 42, 0, 0)
+
+        monkeypatch.setattr(aoc.main, "run_part", run_part)
+
+        async def query_twice():
+            return await asyncio.gather(*(daemon.answer({"id": idx, "day": 1, "part": 1}) for idx in range(2)))
+
+        # WHEN
+        res = asyncio.run(query_twice())
+
+        # THEN
+        assert_that([response["answer"] for response in res], equal_to([42, 42]))
+        assert_that(solved, equal_to([(1, 1)]))
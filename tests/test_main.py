@@ -0,0 +1,18 @@
+from hamcrest import assert_that, equal_to, starts_with
+
+import aoc.main
+from aoc.main import run_part
+from aoc.registry import get_puzzle
+
+
+class TestRunPart:
+    def test_should_report_an_input_failing_to_parse_as_an_error(self, monkeypatch):
+        # GIVEN
+        monkeypatch.setattr(aoc.main, "get_puzzle", lambda day: get_puzzle(day)._replace(raw_input="1721\nabc\n"))
+
+        # WHEN
+        res = run_part(1, 1)
+
+        # THEN
+        assert_that((res.answer, res.solve_ms), equal_to((None, 0)))
+        assert_that(res.error, starts_with("ValueError: "))
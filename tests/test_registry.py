@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+from hamcrest import assert_that, equal_to
+
+from aoc.registry import EntryPoint, get_puzzle
+
+
+class TestEntryPoint:
+    def test_should_bind_the_arguments_resolved(self):
+        # GIVEN
+        solver = EntryPoint(
+            "aoc.day3.bitmap:analyze_trajectories",
+            trajectories=EntryPoint("aoc.day3.tobogan_trajectory:TRAJECTORIES")
+        )
+        slope = get_puzzle(3).parse([
+            "..##.......", "#...#...#..", ".#....#..#.", "..#.#...#.#", ".#...##..#.", "..#.##.....",
+            ".#.#.#....#", ".#........#", "#.##...#...", "#...##....#", ".#..#...#.#",
+        ])
+
+        # WHEN
+        res = solver(slope)
+
+        # THEN
+        assert_that(res, equal_to(336))
+
+
+class TestRegistry:
+    def test_should_not_import_the_days_until_they_are_solved(self):
+        # GIVEN
+        statement = "import sys, aoc.registry; print(sorted(m for m in sys.modules if m.startswith('aoc.day')))"
+
+        # WHEN
+        output = subprocess.run([sys.executable, "-c", statement], capture_output=True, text=True).stdout
+
+        # THEN
+        assert_that(output.strip(), equal_to("[]"))
@@ -0,0 +1,145 @@
+import pytest
+from hamcrest import assert_that, equal_to, calling, raises
+
+from aoc.util.automaton import Automaton, Rule, square, hypercube, hexagonal, line_of_sight, DENSE, SPARSE, \
+    choose_backend, Graph
+from aoc.util.differential import check_equivalence
+from aoc.util.matrix import Grid
+
+LIFE = Rule.of(birth={3}, survival={2, 3})
+
+
+class TestRule:
+    def test_should_translate_state_and_count_to_next_state(self):
+        # WHEN
+        table = LIFE.table()
+
+        # THEN
+        assert_that([table[count] for count in range(5)], equal_to([0, 0, 0, 1, 0]))
+        assert_that([table[0x80 | count] for count in range(5)], equal_to([0, 0, 1, 1, 0]))
+
+
+class TestAutomaton:
+    @pytest.mark.parametrize("backend", [DENSE, SPARSE])
+    def test_should_oscillate_a_blinker(self, backend):
+        # GIVEN
+        automaton = Automaton(square(), LIFE, {(0, -1), (0, 0), (0, 1)}, backend=backend)
+
+        # WHEN
+        automaton.step()
+        first = automaton.cells()
+        automaton.step()
+        second = automaton.cells()
+
+        # THEN
+        assert_that(first, equal_to({(-1, 0), (0, 0), (1, 0)}))
+        assert_that(second, equal_to({(0, -1), (0, 0), (0, 1)}))
+
+    @pytest.mark.parametrize("backend", [DENSE, SPARSE])
+    def test_should_move_a_glider_further_than_the_dense_box(self, backend):
+        # GIVEN
+        glider = {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}
+        automaton = Automaton(square(), LIFE, glider, backend=backend)
+
+        # WHEN
+        automaton.run(100)
+
+        # THEN
+        assert_that(automaton.cells(), equal_to({(x + 25, y + 25) for x, y in glider}))
+
+    @pytest.mark.parametrize("backend", [DENSE, SPARSE])
+    def test_should_run_until_a_fixpoint(self, backend):
+        # GIVEN
+        automaton = Automaton(square(), LIFE, {(0, 0), (0, 1), (1, 0)}, backend=backend)
+
+        # WHEN
+        generations = automaton.run()
+
+        # THEN
+        assert_that(generations, equal_to(2))
+        assert_that(automaton.cells(), equal_to({(0, 0), (0, 1), (1, 0), (1, 1)}))
+
+    def test_should_grow_on_a_hexagonal_lattice(self):
+        # GIVEN
+        automaton = Automaton(hexagonal(), Rule.of(birth={2}, survival={1, 2}), {(0, 0), (1, 0)})
+
+        # WHEN
+        automaton.step()
+
+        # THEN
+        assert_that(automaton.cells(), equal_to({(0, 0), (1, 0), (1, -1), (0, 1)}))
+
+    def test_should_count_neighbors_in_4_dimensions(self):
+        # GIVEN
+        automaton = Automaton(hypercube(4), LIFE, {(0, 0, 0, 0), (1, 0, 0, 0), (2, 0, 0, 0)})
+
+        # WHEN
+        automaton.step()
+
+        # THEN
+        assert_that(automaton.population, equal_to(1 + 3 ** 3 - 1))
+
+    def test_should_evolve_like_the_sparse_backend_with_the_dense_one(self):
+        # GIVEN
+        def generate(rnd):
+            rule = Rule.of(birth=rnd.sample(range(1, 9), 2), survival=rnd.sample(range(9), 3))
+            cells = [(rnd.randint(-6, 6), rnd.randint(-6, 6)) for _ in range(rnd.randint(0, 60))]
+            return rule, cells, rnd.randint(1, 20)
+
+        def run(backend):
+            def evolve(rule, cells, generations):
+                automaton = Automaton(square(), rule, set(cells), backend=backend)
+                automaton.run(generations)
+                return automaton.cells()
+            return evolve
+
+        # WHEN
+        checked = check_equivalence(run(SPARSE), run(DENSE), generate, budget=50, seed=8)
+
+        # THEN
+        assert_that(checked, equal_to(50))
+
+    def test_should_refuse_births_without_neighbors_on_a_lattice(self):
+        assert_that(
+            calling(Automaton).with_args(square(), Rule.of(birth={0}, survival={1}), set()),
+            raises(ValueError)
+        )
+
+
+class TestChooseBackend:
+    def test_should_choose_from_the_density(self):
+        # GIVEN
+        dense = {(x, y) for x in range(10) for y in range(10)}
+        sparse = {(0, 0), (1000, 1000)}
+
+        # WHEN
+        res = choose_backend(square(), LIFE, dense), choose_backend(square(), LIFE, sparse)
+
+        # THEN
+        assert_that(res, equal_to((DENSE, SPARSE)))
+
+    def test_should_choose_dense_for_births_without_neighbors(self):
+        assert_that(choose_backend(Graph([[1], [0]]), Rule.of(birth={0}, survival=()), set()), equal_to(DENSE))
+
+
+class TestLineOfSight:
+    def test_should_link_the_first_cells_seen_in_every_direction(self):
+        # GIVEN
+        grid = Grid.parse(["L.L", "...", "L.."])
+
+        # WHEN
+        graph, positions = line_of_sight(grid, is_cell=ord("L").__eq__)
+
+        # THEN
+        assert_that(positions, equal_to([(0, 0), (0, 2), (2, 0)]))
+        assert_that(graph.adjacency, equal_to([[1, 2], [0, 2], [0, 1]]))
+
+    def test_should_only_look_at_adjacent_positions_with_reach_of_1(self):
+        # GIVEN
+        grid = Grid.parse(["L.L", "LL."])
+
+        # WHEN
+        graph, _ = line_of_sight(grid, is_cell=ord("L").__eq__, reach=1)
+
+        # THEN
+        assert_that(graph.adjacency, equal_to([[2, 3], [3], [0, 3], [0, 1, 2]]))
@@ -0,0 +1,99 @@
+from collections import deque
+
+from hamcrest import assert_that, equal_to, calling, raises, has_entries
+
+from aoc.day22.crab_combat import play_recurse_game
+from aoc.day25.combo_breaker import _find_loop_size, CHECKPOINT_INTERVAL
+from aoc.util.budget import Budget, BudgetExceeded, checkpoint
+
+
+class TestBudget:
+    def test_should_ignore_checkpoints_without_budget(self):
+        # WHEN
+        for _ in range(1000):
+            checkpoint("loop")
+
+        # THEN no exception is raised
+
+    def test_should_stop_after_the_iterations_with_the_progress(self):
+        # GIVEN
+        budget = Budget(iterations=10)
+
+        # WHEN
+        try:
+            with budget:
+                for idx in range(100):
+                    checkpoint("loop", index=idx)
+            progress = None
+        except BudgetExceeded as e:
+            progress = e.progress
+
+        # THEN
+        assert_that(progress, has_entries(checkpoint="loop", iterations=11, index=10))
+
+    def test_should_stop_after_the_wall_time(self):
+        # GIVEN
+        budget = Budget(wall_s=0)
+
+        # WHEN
+        def run():
+            with budget:
+                checkpoint("loop")
+
+        # THEN
+        assert_that(calling(run), raises(BudgetExceeded, "wall time budget exceeded"))
+
+    def test_should_stop_when_allocating_too_much_memory(self):
+        # GIVEN
+        budget = Budget(memory_mib=1)
+
+        # WHEN
+        def run():
+            with budget:
+                blocks = []
+                for _ in range(100):
+                    blocks.append(bytearray(64 * 1024))
+                    checkpoint("allocate", blocks=len(blocks))
+
+        # THEN
+        assert_that(calling(run), raises(BudgetExceeded, "memory budget exceeded"))
+
+
+class TestBudgetedSolvers:
+    def test_should_stop_searching_a_loop_size(self):
+        # GIVEN
+        budget = Budget(iterations=CHECKPOINT_INTERVAL)
+
+        # WHEN
+        def run():
+            with budget:
+                _find_loop_size(subject=7, expected_key=0, max_iterations=10 * CHECKPOINT_INTERVAL)
+
+        # THEN
+        assert_that(calling(run), raises(BudgetExceeded, "in find_loop_size after"))
+
+    def test_should_stop_a_recursive_combat(self):
+        # GIVEN
+        deck1, deck2 = deque([9, 2, 6, 3, 1]), deque([5, 8, 4, 7, 10])
+
+        # WHEN
+        try:
+            with Budget(iterations=5):
+                play_recurse_game(deck1, deck2)
+            progress = None
+        except BudgetExceeded as e:
+            progress = e.progress
+
+        # THEN
+        assert_that(progress, has_entries(checkpoint="recursive combat", iterations=6, round=6))
+
+    def test_should_not_change_the_answer_within_the_budget(self):
+        # GIVEN
+        deck1, deck2 = deque([9, 2, 6, 3, 1]), deque([5, 8, 4, 7, 10])
+
+        # WHEN
+        with Budget(wall_s=60, iterations=10 ** 6):
+            res = play_recurse_game(deck1, deck2)
+
+        # THEN
+        assert_that(res, equal_to(291))
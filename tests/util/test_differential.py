@@ -0,0 +1,56 @@
+from functools import partial
+
+from hamcrest import assert_that, equal_to, calling, raises
+
+from aoc.util.differential import check_equivalence, Divergence, shrink_args, shrink_list, shrink_int
+
+
+def _sum_with_a_bug(numbers, offset):
+    # diverging from the reference as soon as a number is above 41
+    return sum(number for number in numbers if number < 42) + offset
+
+
+def _generate(rnd):
+    return [rnd.randint(0, 100) for _ in range(rnd.randint(1, 20))], rnd.randint(-50, 50)
+
+
+class TestCheckEquivalence:
+    def test_should_agree_on_equivalent_engines(self):
+        # WHEN
+        checked = check_equivalence(lambda numbers, offset: sum(numbers) + offset,
+                                    lambda numbers, offset: sum(reversed(numbers)) + offset,
+                                    _generate,
+                                    budget=50)
+
+        # THEN
+        assert_that(checked, equal_to(50))
+
+    def test_should_report_a_minimised_divergence(self):
+        # WHEN
+        try:
+            check_equivalence(lambda numbers, offset: sum(numbers) + offset,
+                              _sum_with_a_bug,
+                              _generate,
+                              shrink=shrink_args(partial(shrink_list, min_length=1), shrink_int),
+                              budget=50)
+            divergence = None
+        except Divergence as e:
+            divergence = e
+
+        # THEN
+        assert_that(divergence.minimal_args, equal_to(([42], 0)))
+        assert_that((divergence.reference, divergence.candidate), equal_to((42, 0)))
+
+    def test_should_diverge_when_only_one_engine_raises(self):
+        assert_that(
+            calling(check_equivalence).with_args(lambda n: 1 // n, lambda n: 1, lambda rnd: (rnd.randint(0, 3),), budget=50),
+            raises(Divergence)
+        )
+
+
+class TestShrinkers:
+    def test_should_shrink_integers_towards_0(self):
+        assert_that(list(shrink_int(10)), equal_to([0, 5, 8, 9]))
+
+    def test_should_shrink_lists_without_going_under_their_minimal_length(self):
+        assert_that(list(shrink_list([5, 1], min_length=1)), equal_to([[1], [5], [0, 1], [3, 1], [4, 1], [5, 0]]))
@@ -0,0 +1,19 @@
+from hamcrest import assert_that, equal_to, has_item
+
+from aoc.util.imports import measure_imports, _parse_line, ImportTime
+
+
+class TestMeasureImports:
+    def test_should_parse_the_importtime_lines(self):
+        # WHEN
+        res = _parse_line("       312 |       7737 |   aoc.day3.tobogan_trajectory"), _parse_line(" self [us] | cumulative | imported package")
+
+        # THEN
+        assert_that(res, equal_to(([ImportTime("aoc.day3.tobogan_trajectory", 312, 7737, 1)], [])))
+
+    def test_should_measure_the_modules_imported_by_a_statement(self):
+        # WHEN
+        res = measure_imports("import aoc.day1.expense_report")
+
+        # THEN
+        assert_that([timing.module for timing in res], has_item("aoc.day1.expense_report"))
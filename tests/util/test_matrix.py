@@ -1,6 +1,6 @@
 from hamcrest import assert_that, equal_to
 
-from aoc.util.matrix import initialize_matrix
+from aoc.util.matrix import initialize_matrix, Grid
 
 
 class TestInitializeMatrix:
@@ -43,3 +43,74 @@ class TestInitializeMatrix:
                 [0, 0, 0, 0]
             ])
         )
+
+
+class TestGrid:
+    def test_should_parse_with_a_mapping(self):
+        # WHEN
+        grid = Grid.parse(["#.\n", ".#\n", "\n"], {"#": 1, ".": 0})
+
+        # THEN
+        assert_that((grid.height, grid.width), equal_to((2, 2)))
+        assert_that(grid.data, equal_to(bytearray([1, 0, 0, 1])))
+
+    def test_should_give_rows_and_columns_as_views(self):
+        # GIVEN
+        grid = Grid.parse(["abc", "def"])
+
+        # WHEN
+        row = grid.row(1)
+        grid[1, 0] = ord("X")
+
+        # THEN
+        assert_that(row.tobytes(), equal_to(b"Xef"))
+        assert_that(grid.column(2).tobytes(), equal_to(b"cf"))
+
+    def test_should_rotate_and_flip_without_copying(self):
+        # GIVEN
+        grid = Grid.parse(["abc", "def"])
+
+        # WHEN
+        rotated = grid.rotate()
+        rotated[0, 0] = ord("X")
+
+        # THEN
+        assert_that(rotated.to_lines(), equal_to(["Xa", "eb", "fc"]))
+        assert_that(grid.to_lines(), equal_to(["abc", "Xef"]))
+        assert_that(grid.flip().to_lines(), equal_to(["Xef", "abc"]))
+        assert_that(grid.rotate().rotate().to_lines(), equal_to(["feX", "cba"]))
+
+    def test_should_give_the_8_orientations(self):
+        # GIVEN
+        grid = Grid.parse(["ab", "cd"])
+
+        # WHEN
+        orientations = ["".join(view.to_lines()) for view in grid.orientations()]
+
+        # THEN
+        assert_that(
+            orientations,
+            equal_to(["abcd", "cadb", "dcba", "bdac", "cdab", "acbd", "badc", "dbca"])
+        )
+
+    def test_should_only_give_neighbors_in_bounds(self):
+        # GIVEN
+        grid = Grid(3, 3)
+
+        # WHEN
+        neighbors = list(grid.neighbors(0, 0))
+
+        # THEN
+        assert_that(neighbors, equal_to([(0, 1), (1, 0), (1, 1)]))
+
+    def test_should_count_in_a_view(self):
+        # GIVEN
+        grid = Grid.parse(["#..", "##."])
+
+        # WHEN
+        res = grid.transpose().count(ord("#")), grid.transpose().copy()
+
+        # THEN
+        assert_that(res[0], equal_to(3))
+        assert_that(res[1], equal_to(Grid.parse(["##", ".#", ".."])))
+        assert_that(res[1].is_compact, equal_to(True))
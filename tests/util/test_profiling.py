@@ -0,0 +1,57 @@
+from hamcrest import assert_that, equal_to, greater_than, none, not_none, contains_string
+
+from aoc.util.profiling import Profiler, phase
+
+
+@phase("build")
+def _build(size: int):
+    return [0] * size
+
+
+class TestPhase:
+    def test_should_time_a_phase_without_profiler(self):
+        # WHEN
+        with phase("solve") as record:
+            _build(10)
+
+        # THEN
+        assert_that(record.name, equal_to("solve"))
+        assert_that(record.wall_ms, greater_than(0))
+        assert_that(record.peak_kib, none())
+
+
+class TestProfiler:
+    def test_should_record_nested_and_decorated_phases(self):
+        # WHEN
+        with Profiler("day") as profiler:
+            with phase("parse"):
+                pass
+            with phase("solve"):
+                _build(10)
+                _build(10)
+
+        # THEN
+        assert_that([record.name for record in profiler.phases], equal_to(["parse", "solve", "build", "build"]))
+        assert_that(profiler.as_dict()["build"]["calls"], equal_to(2))
+
+    def test_should_trace_memory_peaks_of_nested_phases(self):
+        # WHEN
+        with Profiler(memory=True) as profiler:
+            with phase("solve"):
+                _build(1_000_000)
+
+        # THEN
+        assert_that(profiler.peak_kib("build"), greater_than(7000))
+        assert_that(profiler.peak_kib("solve"), greater_than(7000))
+
+    def test_should_only_profile_the_outermost_phase(self):
+        # WHEN
+        with Profiler(cprofile=True) as profiler:
+            with phase("solve"):
+                _build(10)
+
+        # THEN
+        solve, build = profiler.phases
+        assert_that(solve.stats, not_none())
+        assert_that(build.stats, none())
+        assert_that(profiler.report(), contains_string("_build"))
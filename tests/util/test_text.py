@@ -0,0 +1,52 @@
+from hamcrest import assert_that, equal_to
+
+from aoc.util.text import generate_paragraphs, read_lines, read_paragraphs
+
+
+class TestGenerateParagraphs:
+    def test_should_split_on_blank_lines(self):
+        # GIVEN
+        lines = ["a\n", "b\n", "\n", "\n", "c"]
+
+        # WHEN
+        res = list(generate_paragraphs(lines))
+
+        # THEN
+        assert_that(res, equal_to([["a", "b"], ["c"]]))
+
+
+class TestReadLines:
+    def test_should_stream_lines_of_a_file(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input"
+        path.write_bytes(b"first\nsecond\nno newline")
+
+        # WHEN
+        res = list(read_lines(str(path)))
+
+        # THEN
+        assert_that(res, equal_to(["first\n", "second\n", "no newline"]))
+
+    def test_should_read_an_empty_file(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input"
+        path.write_bytes(b"")
+
+        # WHEN
+        res = list(read_lines(str(path)))
+
+        # THEN
+        assert_that(res, equal_to([]))
+
+
+class TestReadParagraphs:
+    def test_should_stream_paragraphs_of_a_file(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input"
+        path.write_bytes(b"Player 1:\n9\n2\n\nPlayer 2:\n5\n")
+
+        # WHEN
+        res = list(read_paragraphs(str(path)))
+
+        # THEN
+        assert_that(res, equal_to([["Player 1:", "9", "2"], ["Player 2:", "5"]]))
@@ -0,0 +1,78 @@
+import pytest
+from hamcrest import assert_that, equal_to, calling, raises
+
+from aoc.day3.bitmap import parse_tree_map, count_trees_by_trajectory
+from aoc.day3.tobogan_trajectory import _parse as parse_slope, analyze_trajectories, TRAJECTORIES
+from aoc.day5.binary_boarding import find_highest_seat_id, find_my_seat_id
+from aoc.util.automaton import Automaton, Rule, square, DENSE
+from aoc.util.vectorized import use_numpy, set_backend, BACKEND_ENV, PYTHON
+
+
+@pytest.fixture
+def numpy_backend(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setenv(BACKEND_ENV, "numpy")
+
+
+class TestBackend:
+    def test_should_use_pure_python_when_asked(self, monkeypatch):
+        # GIVEN
+        monkeypatch.setenv(BACKEND_ENV, PYTHON)
+
+        # WHEN
+        res = use_numpy()
+
+        # THEN
+        assert_that(res, equal_to(False))
+
+    def test_should_refuse_an_unknown_backend(self):
+        assert_that(calling(set_backend).with_args("fortran"), raises(ValueError))
+
+
+class TestNumpyBackend:
+    def test_should_run_automaton_like_the_pure_python_backend(self, numpy_backend):
+        # GIVEN
+        glider = {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}
+        automaton = Automaton(square(), Rule.of(birth={3}, survival={2, 3}), glider, backend=DENSE)
+
+        # WHEN
+        automaton.run(40)
+
+        # THEN
+        assert_that(automaton.cells(), equal_to({(x + 10, y + 10) for x, y in glider}))
+
+    def test_should_count_trees_like_the_pure_python_backend(self, numpy_backend):
+        # GIVEN
+        slope = parse_slope([
+            "..##.......", "#...#...#..", ".#....#..#.", "..#.#...#.#", ".#...##..#.", "..#.##.....",
+            ".#.#.#....#", ".#........#", "#.##...#...", "#...##....#", ".#..#...#.#",
+        ])
+
+        # WHEN
+        res = analyze_trajectories(slope, TRAJECTORIES)
+
+        # THEN
+        assert_that(res, equal_to(336))
+
+    def test_should_count_trees_of_a_tree_map_like_the_pure_python_backend(self, numpy_backend):
+        # GIVEN
+        tree_map = parse_tree_map([
+            "..##.......", "#...#...#..", ".#....#..#.", "..#.#...#.#", ".#...##..#.", "..#.##.....",
+            ".#.#.#....#", ".#........#", "#.##...#...", "#...##....#", ".#..#...#.#",
+        ])
+
+        # WHEN
+        res = count_trees_by_trajectory(tree_map, TRAJECTORIES)
+
+        # THEN
+        assert_that(res, equal_to([2, 7, 3, 4, 2]))
+
+    def test_should_decode_boarding_passes(self, numpy_backend):
+        # GIVEN
+        boarding_passes = ["BFFFBBFRRR", "BFFFBBFRLR", "BFFFBBFRLL"]
+
+        # WHEN
+        res = find_highest_seat_id(boarding_passes), find_my_seat_id(boarding_passes)
+
+        # THEN
+        assert_that(res, equal_to((567, 566)))